@@ -0,0 +1,75 @@
+"""
+Scaling benchmark of the parallel rank correlations of corr_map.
+
+Times corr_map for the 'kendall' and 'spearman' methods on synthetic data
+for an increasing number of worker processes and prints the speedup over
+the serial computation.
+
+Usage::
+
+    poetry run python benchmarks/bench_corr_map.py --rows 200000 --features 30
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from simpler_eda.correlation import corr_map
+
+
+def make_data(rows, features, seed=0):
+    """
+    Generate correlated numeric features with ties and missing values.
+    """
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(rows, 1))
+    values = base + rng.normal(size=(rows, features))
+    values[:, ::3] = np.round(values[:, ::3], 1)
+    values[rng.random((rows, features)) < 0.01] = np.nan
+    return pd.DataFrame(values, columns=[f"f{i}" for i in range(features)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--features", type=int, default=20)
+    parser.add_argument(
+        "--methods", nargs="+", default=["kendall", "spearman"]
+    )
+    parser.add_argument(
+        "--jobs",
+        nargs="+",
+        type=int,
+        help="worker counts to time, powers of two up to the CPU count by "
+        "default",
+    )
+    args = parser.parse_args()
+
+    data = make_data(args.rows, args.features)
+    features = list(data.columns)
+    jobs = args.jobs or [1]
+    while not args.jobs and jobs[-1] * 2 <= os.cpu_count():
+        jobs.append(jobs[-1] * 2)
+
+    print(f"{args.rows} rows, {args.features} features")
+    print(f"{'method':<10}{'n_jobs':>8}{'seconds':>10}{'speedup':>9}")
+    for method in args.methods:
+        serial = None
+        for n_jobs in jobs:
+            start = time.perf_counter()
+            chart = corr_map(data, features, corr_method=method, n_jobs=n_jobs)
+            elapsed = time.perf_counter() - start
+            if serial is None:
+                serial, expected = elapsed, chart.data
+            else:
+                pd.testing.assert_frame_equal(chart.data, expected)
+            print(
+                f"{method:<10}{n_jobs:>8}{elapsed:>10.2f}"
+                f"{serial / elapsed:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
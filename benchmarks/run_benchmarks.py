@@ -0,0 +1,269 @@
+"""
+Benchmark suite of categorical_eda, numerical_eda and corr_map.
+
+Every case is run on synthetic data of increasing size, from 1e3 to 1e7
+rows and, for corr_map, from 2 to 500 features. For each run the suite
+records the wall time, the peak memory allocated while building the chart
+(tracemalloc) and the size in bytes of the serialized Vega-Lite
+specification. Results are written to benchmarks/results/ as JSON, named
+after the package version, so that runs of two versions can be compared.
+
+Usage::
+
+    poetry run python benchmarks/run_benchmarks.py --max-rows 1000000
+    poetry run python benchmarks/run_benchmarks.py --compare \\
+        benchmarks/results/0.1.7.json benchmarks/results/0.1.8.json
+"""
+import argparse
+import json
+import os
+import platform
+import time
+import tracemalloc
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+import simpler_eda
+from simpler_eda.categorical import categorical_eda
+from simpler_eda.compaction import enable_compaction, spec_size
+from simpler_eda.correlation import corr_map
+from simpler_eda.numerical import numerical_eda
+
+ROWS = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+FEATURES = [2, 10, 50, 100, 500]
+TITLE = "Benchmark"
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def make_data(rows, features=4, seed=0):
+    """
+    Generate a dataframe with correlated numeric features, categorical
+    columns of low and medium cardinality and a few missing values.
+    """
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(rows, 1))
+    numeric = base + rng.normal(size=(rows, features))
+    numeric[rng.random((rows, features)) < 0.01] = np.nan
+    data = pd.DataFrame(numeric, columns=[f"x{i}" for i in range(features)])
+    data["group"] = rng.choice(["a", "b", "c", "d"], rows)
+    data["category"] = rng.integers(0, 50, rows).astype(str)
+    data["time"] = np.arange(rows, dtype=float)
+    return data
+
+
+# name -> (function building the chart, whether it embeds every row)
+CASES = {
+    "categorical_eda.histogram": (
+        lambda df: categorical_eda(df, "category", color="group", title=TITLE),
+        True,
+    ),
+    "categorical_eda.histogram.aggregate": (
+        lambda df: categorical_eda(
+            df, "category", color="group", title=TITLE, aggregate=True
+        ),
+        False,
+    ),
+    "categorical_eda.density.aggregate": (
+        lambda df: categorical_eda(
+            df, "x0", plot_type="density", color="group", title=TITLE,
+            aggregate=True,
+        ),
+        False,
+    ),
+    "numerical_eda.scatter": (
+        lambda df: numerical_eda(df, "x0", "x1", "group", title=TITLE),
+        True,
+    ),
+    "numerical_eda.binned": (
+        lambda df: numerical_eda(
+            df, "x0", "x1", "group", plot_type="binned", title=TITLE
+        ),
+        False,
+    ),
+    "numerical_eda.line.max_points": (
+        lambda df: numerical_eda(
+            df, "time", "x0", "group", plot_type="line", title=TITLE,
+            max_points=1000,
+        ),
+        False,
+    ),
+    "corr_map.pearson": (
+        lambda df: corr_map(df, [c for c in df if c.startswith("x")]),
+        False,
+    ),
+    "corr_map.spearman": (
+        lambda df: corr_map(
+            df, [c for c in df if c.startswith("x")], corr_method="spearman"
+        ),
+        False,
+    ),
+    "corr_map.kendall": (
+        lambda df: corr_map(
+            df, [c for c in df if c.startswith("x")], corr_method="kendall"
+        ),
+        False,
+    ),
+}
+
+
+def measure(build, data, repeat):
+    """
+    Time, trace and serialize one chart.
+
+    Returns
+    -------
+    dict
+      Best wall time in seconds over repeat runs, peak traced memory in
+      bytes and the size of the JSON specification in bytes.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        chart = build(data)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    chart = build(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    spec_bytes = spec_size(chart)
+    return {
+        "seconds": min(times), "peak_bytes": peak, "spec_bytes": spec_bytes
+    }
+
+
+def run(args):
+    """
+    Run the row and feature sweeps and return the list of results.
+    """
+    results = []
+    selected = [c for c in CASES if any(k in c for k in args.cases)]
+    for rows in [r for r in ROWS if r <= args.max_rows]:
+        data = make_data(rows)
+        for name in selected:
+            build, inline = CASES[name]
+            if inline and rows > args.max_inline_rows:
+                continue
+            if name == "corr_map.kendall" and rows > args.max_kendall_rows:
+                continue
+            results.append(
+                {"case": name, "rows": rows, "features": 4,
+                 **measure(build, data, args.repeat)}
+            )
+            report(results[-1])
+
+    for features in [f for f in FEATURES if f <= args.max_features]:
+        data = make_data(args.feature_rows, features)
+        for name in [c for c in selected if c.startswith("corr_map")]:
+            if name == "corr_map.kendall" and features > 50:
+                continue
+            results.append(
+                {"case": name, "rows": args.feature_rows,
+                 "features": features, **measure(CASES[name][0], data, 1)}
+            )
+            report(results[-1])
+    return results
+
+
+def report(result):
+    """
+    Print one result as a table row.
+    """
+    print(
+        f"{result['case']:<38}{result['rows']:>10}{result['features']:>6}"
+        f"{result['seconds']:>10.3f}{result['peak_bytes'] / 2 ** 20:>10.1f}"
+        f"{result['spec_bytes'] / 2 ** 10:>12.1f}"
+    )
+
+
+def compare(old_path, new_path, threshold):
+    """
+    Print the ratio of every metric between two result files and flag the
+    regressions above threshold.
+    """
+    with open(old_path) as f:
+        old = {
+            (r["case"], r["rows"], r["features"]): r
+            for r in json.load(f)["results"]
+        }
+    with open(new_path) as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    for result in new:
+        key = (result["case"], result["rows"], result["features"])
+        if key not in old:
+            continue
+        ratios = [
+            result[m] / old[key][m] if old[key][m] else 1.0
+            for m in ["seconds", "peak_bytes", "spec_bytes"]
+        ]
+        flag = "REGRESSION" if max(ratios) > threshold else ""
+        regressions += bool(flag)
+        print(
+            f"{key[0]:<38}{key[1]:>10}{key[2]:>6}"
+            + "".join(f"{r:>10.2f}" for r in ratios)
+            + f"  {flag}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-rows", type=int, default=10 ** 6)
+    parser.add_argument("--max-inline-rows", type=int, default=10 ** 5,
+                        help="largest data embedded row by row")
+    parser.add_argument("--max-kendall-rows", type=int, default=10 ** 6)
+    parser.add_argument("--max-features", type=int, default=500)
+    parser.add_argument("--feature-rows", type=int, default=10 ** 4)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cases", nargs="+", default=[""],
+                        help="only run the cases containing these strings")
+    parser.add_argument("--compact", type=int, metavar="PRECISION",
+                        help="compact the chart data to this precision")
+    parser.add_argument("--output", help="result file, by default "
+                        "benchmarks/results/<version>.json")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"))
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="ratio above which a metric is a regression")
+    args = parser.parse_args()
+
+    if args.compare:
+        print(f"{'case':<38}{'rows':>10}{'feat':>6}"
+              f"{'time':>10}{'memory':>10}{'spec':>10}")
+        raise SystemExit(compare(*args.compare, args.threshold) > 0)
+
+    alt.data_transformers.disable_max_rows()
+    if args.compact:
+        enable_compaction(args.compact)
+    print(f"{'case':<38}{'rows':>10}{'feat':>6}"
+          f"{'seconds':>10}{'peak MiB':>10}{'spec KiB':>12}")
+    results = run(args)
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"{simpler_eda.__version__}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(
+            {
+                "version": simpler_eda.__version__,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "pandas": pd.__version__,
+                "altair": alt.__version__,
+                "compaction": args.compact,
+                "results": results,
+            },
+            f,
+            indent=2,
+        )
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,59 @@
 __version__ = '0.1.7'
+
+import importlib
+import sys
+import types
+
+# The plotting functions are imported on first access (PEP 562), so that
+# importing the package does not pay for importing altair, pandas and numpy
+_lazy_functions = {
+    "categorical_eda": "simpler_eda.categorical",
+    "categorical_eda_batch": "simpler_eda.categorical",
+    "numerical_eda": "simpler_eda.numerical",
+    "pair_plot": "simpler_eda.numerical",
+    "corr_map": "simpler_eda.correlation",
+    "EDAFrame": "simpler_eda.eda_frame",
+    "categorical_eda_async": "simpler_eda.async_eda",
+    "numerical_eda_async": "simpler_eda.async_eda",
+    "corr_map_async": "simpler_eda.async_eda",
+    "eda_report": "simpler_eda.report",
+    "HistogramAccumulator": "simpler_eda.accumulators",
+    "CorrelationAccumulator": "simpler_eda.accumulators",
+}
+
+__all__ = list(_lazy_functions)
+
+
+def __getattr__(name):
+    if name in _lazy_functions:
+        module = importlib.import_module(_lazy_functions[name])
+        function = getattr(module, name)
+        # Later lookups skip __getattr__
+        globals()[name] = function
+        return function
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_functions))
+
+
+class _Package(types.ModuleType):
+    """
+    The package module, whose exported functions are not replaced when the
+    submodules named after them are imported.
+    """
+
+    def __setattr__(self, name, value):
+        # Importing simpler_eda.corr_map binds the submodule to the package
+        # after running it, which would hide the corr_map function depending
+        # on the import order. Only that binding is skipped, any other
+        # assignment goes through
+        if name in _lazy_functions and value is sys.modules.get(
+            f"{__name__}.{name}"
+        ):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
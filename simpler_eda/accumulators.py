@@ -0,0 +1,352 @@
+from functools import partial
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from simpler_eda.backends import (
+    _columns,
+    _is_frame,
+    _is_numeric,
+    _native_backend,
+    _native_count_table,
+    _partition_reduce,
+    _to_pandas,
+)
+from simpler_eda.categorical import (
+    _SPACE_SAVING_FACTOR,
+    _SpaceSaving,
+    _color_encoding,
+    _count_table,
+    _histogram_chart,
+)
+from simpler_eda.compaction import _compact
+from simpler_eda.correlation import (
+    _corr_chart,
+    _frame_moments,
+    _matrix_frame,
+    _merge_moments,
+    _moments_corr,
+    _pearson_moments,
+)
+from simpler_eda.instrumentation import _stage_timer
+
+
+class HistogramAccumulator:
+    """
+    The counts of a categorical_eda histogram, updated batch by batch.
+
+    Every batch of new rows is counted with a group-by and its counts are
+    added to the running counts, so an update costs the size of the batch
+    and a chart the number of categories, whatever the number of rows seen
+    so far.
+
+    Parameters
+    ----------
+    xval : str
+      Variable used to represent the x-axis.
+    color : str, optional
+      Variable used to set the color of the bars.
+    facet_factor : str, optional
+      Variable used to specify facet factor.
+    max_categories : int, optional
+      Only keep the bars of the max_categories most frequent values of
+      xval, the other rows being counted in an "Other" bar. The batches are
+      merged into a Space-Saving summary as the chunks of categorical_eda,
+      so memory stays bounded however many distinct values are seen.
+
+    Examples
+    --------
+    >>> from simpler_eda.accumulators import HistogramAccumulator
+    >>> from vega_datasets import data
+    >>> cars = data.cars()
+    >>> histogram = HistogramAccumulator("Origin", color="Cylinders")
+    >>> histogram.update(cars[:200]).update(cars[200:])
+    >>> histogram.chart(title="Origin")
+    """
+
+    def __init__(self, xval, color=None, facet_factor=None,
+                 max_categories=None):
+        if max_categories is not None and (
+            not isinstance(max_categories, int) or max_categories < 1
+        ):
+            raise Exception("max_categories must be a positive integer")
+        self.xval = xval
+        self.color = color
+        self.facet_factor = facet_factor
+        self.max_categories = max_categories
+        self._summary = None
+        if max_categories is not None:
+            self._summary = _SpaceSaving(
+                xval, _SPACE_SAVING_FACTOR * max_categories
+            )
+        self._keys = list(
+            dict.fromkeys(
+                k for k in [xval, color, facet_factor] if k is not None
+            )
+        )
+        self._counts = {}
+
+    def update(self, data):
+        """
+        Add the rows of a batch to the counts.
+
+        Parameters
+        ----------
+        data : pandas.core.frame.DataFrame
+          The new rows. A pyarrow.Table, a polars DataFrame or LazyFrame or
+          a Dask DataFrame is counted with its own group-by.
+
+        Returns
+        -------
+        HistogramAccumulator
+          The accumulator itself.
+        """
+        timer = _stage_timer("HistogramAccumulator.update")
+        if not _is_frame(data):
+            raise Exception("the input data has to be a dataframe.")
+        columns = _columns(data)
+        if self.xval not in columns:
+            raise Exception("xval must be a feature in the input dataframe")
+        if self.color is not None and self.color not in columns:
+            raise Exception("color must be a feature in the input dataframe")
+        if self.facet_factor is not None and self.facet_factor not in columns:
+            raise Exception(
+                "facet_factor must be a feature in the input dataframe"
+            )
+        timer.mark("validation", data)
+
+        if _native_backend(data) is None:
+            counts = _count_table(data, self._keys)
+        else:
+            counts = _native_count_table(data, self._keys)
+        if self._summary is not None:
+            self._summary.update(counts)
+            timer.mark("counts", counts)
+            return self
+        for *key, count in counts.itertuples(index=False, name=None):
+            # Missing values are counted together whatever their type
+            key = tuple(None if pd.isna(v) else v for v in key)
+            self._counts[key] = self._counts.get(key, 0) + int(count)
+        timer.mark("counts", counts)
+        return self
+
+    def count_table(self):
+        """
+        The running counts.
+
+        Returns
+        -------
+        pandas.core.frame.DataFrame
+          One row per observed combination of xval, color and
+          facet_factor, in order of first appearance, with its number of
+          rows in the last column, as the aggregated categorical_eda. With
+          max_categories, the rows of the other values follow in "Other".
+        """
+        if self._summary is not None and self._summary.counts is not None:
+            return self._summary.count_table(self.max_categories)
+        count_col = "count"
+        while count_col in self._keys:
+            count_col = f"{count_col}_"
+        return pd.DataFrame(
+            [key + (count,) for key, count in self._counts.items()],
+            columns=self._keys + [count_col],
+        )
+
+    def chart(
+        self,
+        title=None,
+        font_size=10,
+        color_scheme="tableau20",
+        plot_height=150,
+        plot_width=200,
+        facet_col=None,
+    ):
+        """
+        Plot the running counts as categorical_eda does.
+
+        Parameters
+        ----------
+        title, font_size, color_scheme, plot_height, plot_width, facet_col
+          As in categorical_eda.
+
+        Returns
+        -------
+        `altair`
+            A histogram chart object of the rows seen so far.
+        """
+        timer = _stage_timer("HistogramAccumulator.chart")
+        if self.facet_factor is None and facet_col is not None:
+            raise Exception(
+                "facet_factor must be provided along with facet_col."
+            )
+        if self.facet_factor is not None and facet_col is None:
+            raise Exception("Specify facet_col for facetting the plot")
+        hist_data = self.count_table()
+        histogram = _histogram_chart(
+            hist_data,
+            self.xval,
+            alt.Y(f"{hist_data.columns[-1]}:Q", title="Count of Records"),
+            _color_encoding(self.color, color_scheme),
+            alt.Undefined if title is None else title,
+            font_size,
+            plot_height,
+            plot_width,
+            self.facet_factor,
+            facet_col,
+        )
+        timer.mark("chart", hist_data)
+        return _compact(histogram, None, timer)
+
+
+class CorrelationAccumulator:
+    """
+    The pairwise Pearson moments of a corr_map, updated batch by batch.
+
+    The means, sums of squared deviations and co-moments of every batch of
+    new rows are merged into the running moments with Chan's parallel
+    update formulas, so an update costs the size of the batch and a chart
+    the number of pairs of features, whatever the number of rows seen so
+    far. Missing values are excluded pairwise, as in pandas. The rank
+    correlations cannot be updated this way, so only the pearson method is
+    supported.
+
+    Parameters
+    ----------
+    features : list
+      A 1D list with names of numerical feature in str. It should contain
+      at least 2 features.
+
+    Examples
+    --------
+    >>> from simpler_eda.accumulators import CorrelationAccumulator
+    >>> from vega_datasets import data
+    >>> cars = data.cars()
+    >>> corr = CorrelationAccumulator(["Horsepower", "Displacement"])
+    >>> corr.update(cars[:200]).update(cars[200:])
+    >>> corr.chart(top_k=1)
+    """
+
+    def __init__(self, features):
+        assert isinstance(
+            features, list
+        ), "The input for feature should be a list"
+        assert (
+            len(features) >= 2
+        ), "There should be at least 2 features in the list"
+        assert all(
+            isinstance(f, str) for f in features
+        ), "All the entries in the feature list should be a string"
+        self.features = features
+        self._moments = _pearson_moments(np.empty((0, len(features))))
+
+    def update(self, data):
+        """
+        Merge the moments of the rows of a batch.
+
+        Parameters
+        ----------
+        data : pandas.core.frame.DataFrame
+          The new rows. Only the features of a pyarrow.Table or a polars
+          DataFrame or LazyFrame are converted to pandas, and the moments
+          of a Dask DataFrame are reduced partition by partition.
+
+        Returns
+        -------
+        CorrelationAccumulator
+          The accumulator itself.
+        """
+        timer = _stage_timer("CorrelationAccumulator.update")
+        assert _is_frame(data), "The input data is not a panda dataframe"
+        assert all(
+            _is_numeric(data, f) for f in self.features
+        ), "All features in the list should be numeric"
+        timer.mark("validation", data)
+
+        backend = _native_backend(data)
+        if backend == "dask":
+            moments = _partition_reduce(
+                data,
+                self.features,
+                partial(_frame_moments, features=self.features),
+                _merge_moments,
+            )
+        else:
+            if backend is not None:
+                data = _to_pandas(data, self.features)
+                timer.mark("conversion", data)
+            moments = _frame_moments(data, self.features)
+        self._moments = _merge_moments(self._moments, moments)
+        timer.mark("moments", None)
+        return self
+
+    def corr(self):
+        """
+        The running correlation matrix.
+
+        Returns
+        -------
+        pandas.core.frame.DataFrame
+          The symmetric Pearson correlation matrix of the rows seen so far,
+          equal to DataFrame.corr over all of them.
+        """
+        return pd.DataFrame(
+            _moments_corr(self._moments),
+            index=self.features,
+            columns=self.features,
+        )
+
+    def chart(
+        self,
+        color_scheme="blueorange",
+        plot_width=450,
+        plot_height=450,
+        title="Correlation Map",
+        min_abs_corr=None,
+        top_k=None,
+        cluster=False,
+    ):
+        """
+        Plot the running correlations as corr_map does.
+
+        Parameters
+        ----------
+        color_scheme, plot_width, plot_height, title, min_abs_corr, top_k,
+        cluster
+          As in corr_map.
+
+        Returns
+        -------
+        `altair`
+          The altair correlation map plot of the rows seen so far.
+        """
+        timer = _stage_timer("CorrelationAccumulator.chart")
+        assert isinstance(
+            color_scheme, str
+        ), "The color scheme should be given as a string"
+        assert isinstance(
+            plot_width, int
+        ), "The plot_width should be given as an integer"
+        assert isinstance(
+            plot_height, int
+        ), "The plot_height should be given as an integer"
+        assert isinstance(title, str), "The title should be given as a string"
+        assert min_abs_corr is None or (
+            isinstance(min_abs_corr, (int, float)) and 0 <= min_abs_corr <= 1
+        ), "The min_abs_corr should be a number between 0 and 1"
+        assert top_k is None or (
+            isinstance(top_k, int) and top_k > 0
+        ), "The top_k should be given as a positive integer"
+        assert isinstance(
+            cluster, bool
+        ), "The cluster should be given as a boolean"
+
+        corr_df, order = _matrix_frame(
+            self.corr(), min_abs_corr, top_k, cluster
+        )
+        timer.mark("correlation", corr_df)
+        corr_map = _corr_chart(
+            corr_df, order, color_scheme, plot_width, plot_height, title
+        )
+        timer.mark("chart", corr_df)
+        return _compact(corr_map, None, timer)
@@ -0,0 +1,184 @@
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from simpler_eda.categorical import categorical_eda
+from simpler_eda.correlation import corr_map
+from simpler_eda.instrumentation import _cancellable
+from simpler_eda.numerical import numerical_eda
+
+_executor = None
+_default_executor = None
+_max_concurrency = None
+
+# Concurrency limiter of every running event loop
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def set_async_executor(executor=None, max_concurrency=None):
+    """
+    Configure where and how many calls of the async functions run at once.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor, optional
+      Runs the plotting calls, for instance a ProcessPoolExecutor for
+      CPU-bound work on large inputs. Defaults to a thread pool with one
+      thread per core.
+    max_concurrency : int, optional
+      Maximum number of plotting calls running at once in each event loop,
+      the others waiting for a free slot. Defaults to the number of cores.
+
+    Examples
+    --------
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> from simpler_eda.async_eda import set_async_executor
+    >>> set_async_executor(ProcessPoolExecutor(4), max_concurrency=4)
+    """
+    global _executor, _max_concurrency
+    assert executor is None or isinstance(
+        executor, Executor
+    ), "The executor should be a concurrent.futures.Executor"
+    assert max_concurrency is None or (
+        isinstance(max_concurrency, int) and max_concurrency > 0
+    ), "The max_concurrency should be given as a positive integer"
+    _executor = executor
+    _max_concurrency = max_concurrency
+    # The calls already running keep the limiter they acquired
+    _semaphores.clear()
+
+
+async def categorical_eda_async(*args, **kwargs):
+    """
+    Run categorical_eda without blocking the event loop.
+
+    The call runs in the executor of set_async_executor once one of the
+    max_concurrency slots is free. Cancelling the awaiting task cancels a
+    call that has not started. A call running in a thread stops at the
+    start of its next stage. A call running in a process is left to finish
+    and its result is dropped.
+
+    Parameters
+    ----------
+    *args, **kwargs
+      The parameters of categorical_eda.
+
+    Returns
+    -------
+    altair.vegalite.v4.api.Chart
+      The chart returned by categorical_eda.
+    """
+    return await _offload(categorical_eda, args, kwargs)
+
+
+async def numerical_eda_async(*args, **kwargs):
+    """
+    Run numerical_eda without blocking the event loop, as
+    categorical_eda_async.
+
+    Parameters
+    ----------
+    *args, **kwargs
+      The parameters of numerical_eda.
+
+    Returns
+    -------
+    altair.vegalite.v4.api.Chart
+      The chart returned by numerical_eda.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from simpler_eda.async_eda import numerical_eda_async
+    >>> from vega_datasets import data
+    >>> asyncio.run(numerical_eda_async(data.cars(), xval="Horsepower",
+    ...                                 yval="Acceleration", color="Origin"))
+    """
+    return await _offload(numerical_eda, args, kwargs)
+
+
+async def corr_map_async(*args, **kwargs):
+    """
+    Run corr_map without blocking the event loop, as categorical_eda_async.
+
+    Parameters
+    ----------
+    *args, **kwargs
+      The parameters of corr_map.
+
+    Returns
+    -------
+    altair.vegalite.v4.api.Chart
+      The chart returned by corr_map.
+    """
+    return await _offload(corr_map, args, kwargs)
+
+
+async def _offload(function, args, kwargs):
+    """
+    Run a plotting function in the executor within the concurrency limit.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(
+            _max_concurrency or os.cpu_count()
+        )
+    await semaphore.acquire()
+
+    executor = _executor or _get_default_executor()
+    # Threads share the memory of the loop, so a running call can be told
+    # to stop; a process can only be cancelled before it starts the call
+    cancel = (
+        threading.Event() if isinstance(executor, ThreadPoolExecutor) else None
+    )
+    try:
+        future = executor.submit(_call, function, args, kwargs, cancel)
+    except BaseException:
+        semaphore.release()
+        raise
+    # The slot is freed once the worker is done, also after a cancellation,
+    # so that abandoned calls still count against the limit
+    future.add_done_callback(lambda _: _release(loop, semaphore))
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        if cancel is not None:
+            cancel.set()
+        raise
+
+
+def _call(function, args, kwargs, cancel=None):
+    """
+    Call a plotting function in a worker, raising CancelledError at the end
+    of its current stage once cancel is set.
+    """
+    if cancel is None:
+        return function(*args, **kwargs)
+    with _cancellable(cancel):
+        return function(*args, **kwargs)
+
+
+def _release(loop, semaphore):
+    """
+    Release a slot of the concurrency limiter from a worker thread.
+    """
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        # The event loop was closed in the meantime
+        pass
+
+
+def _get_default_executor():
+    """
+    The thread pool used when no executor is configured.
+    """
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="simpler_eda"
+        )
+    return _default_executor
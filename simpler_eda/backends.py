@@ -0,0 +1,473 @@
+import sys
+from functools import partial, reduce
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+# pyarrow, polars and dask are optional: a frame of theirs can only be
+# passed in once the library is imported, so they are looked up in
+# sys.modules
+
+# Number of partition results combined by every task of a tree reduction
+_SPLIT_EVERY = 8
+
+
+def _native_backend(data):
+    """
+    Identify the dataframe libraries handled without converting the whole
+    frame to pandas.
+
+    Parameters
+    ----------
+    data : object
+      The input data.
+
+    Returns
+    -------
+    str or None
+      "arrow" for a pyarrow.Table, "polars" for a polars DataFrame or
+      LazyFrame, "dask" for a Dask DataFrame, None otherwise.
+    """
+    pa = sys.modules.get("pyarrow")
+    if pa is not None and isinstance(data, pa.Table):
+        return "arrow"
+    pl = sys.modules.get("polars")
+    if pl is not None and isinstance(data, (pl.DataFrame, pl.LazyFrame)):
+        return "polars"
+    dd = sys.modules.get("dask.dataframe")
+    if dd is not None and isinstance(data, dd.DataFrame):
+        return "dask"
+    return None
+
+
+def _is_frame(data):
+    """
+    Whether the input is a pandas, pyarrow, polars or Dask dataframe.
+    """
+    return isinstance(data, pd.DataFrame) or _native_backend(data) is not None
+
+
+def _columns(data):
+    """
+    The column names of a pandas, pyarrow, polars or Dask dataframe.
+    """
+    backend = _native_backend(data)
+    if backend == "arrow":
+        return data.column_names
+    if backend == "polars":
+        return _polars_schema(data).names()
+    return data.columns
+
+
+def _is_numeric(data, column):
+    """
+    Whether a column of a pandas, pyarrow, polars or Dask dataframe is
+    numeric.
+    """
+    backend = _native_backend(data)
+    if backend == "arrow":
+        import pyarrow as pa
+
+        dtype = data.schema.field(column).type
+        return pa.types.is_integer(dtype) or pa.types.is_floating(dtype)
+    if backend == "polars":
+        return _polars_schema(data)[column].is_numeric()
+    if backend == "dask":
+        return is_numeric_dtype(data.dtypes[column])
+    return is_numeric_dtype(data[column])
+
+
+def _to_pandas(data, columns):
+    """
+    Convert only the given columns of a pyarrow, polars or Dask dataframe
+    to pandas; a LazyFrame or Dask DataFrame only reads these columns.
+
+    Parameters
+    ----------
+    data : pyarrow.Table or polars.DataFrame or polars.LazyFrame or
+           dask.dataframe.DataFrame
+      The input data.
+    columns : list
+      The columns to convert. None entries and duplicates are ignored.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      The selected columns.
+    """
+    columns = list(dict.fromkeys(c for c in columns if c is not None))
+    backend = _native_backend(data)
+    if backend == "arrow":
+        return data.select(columns).to_pandas()
+    if backend == "dask":
+        return data[columns].compute()
+    return _polars_to_pandas(data.lazy().select(columns).collect())
+
+
+def _native_count_table(data, keys):
+    """
+    Count the rows of a pyarrow or polars dataframe for every combination
+    of the grouping columns with the group-by kernel of its library. The
+    partitions of a Dask DataFrame are counted separately and their counts
+    summed with _partition_reduce.
+
+    Parameters
+    ----------
+    data : pyarrow.Table or polars.DataFrame or polars.LazyFrame or
+           dask.dataframe.DataFrame
+      The input data.
+    keys : list
+      Column names to group by. None entries and duplicates are ignored.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      One row per observed combination of the grouping columns, with the
+      number of rows stored in the last column, as categorical_eda's count
+      table.
+    """
+    keys = list(dict.fromkeys(k for k in keys if k is not None))
+    count_col = "count"
+    while count_col in keys:
+        count_col = f"{count_col}_"
+    backend = _native_backend(data)
+    if backend == "arrow":
+        counts = data.group_by(keys).aggregate([([], "count_all")])
+        return counts.rename_columns(keys + [count_col]).to_pandas()
+    if backend == "dask":
+        return _partition_reduce(
+            data,
+            keys,
+            partial(_partition_counts, keys=keys, count_col=count_col),
+            partial(_merge_counts, keys=keys, count_col=count_col),
+        )
+
+    import polars as pl
+
+    counts = (
+        data.lazy()
+        .group_by(keys, maintain_order=True)
+        .agg(pl.len().alias(count_col))
+        .collect()
+    )
+    return _polars_to_pandas(counts)
+
+
+def _native_binned_counts(data, columns, transforms, bins):
+    """
+    Count the points of every color group in a regular 2D grid with the
+    compute kernels of pyarrow or polars, or partition by partition for a
+    Dask DataFrame.
+
+    Parameters
+    ----------
+    data : pyarrow.Table or polars.DataFrame or polars.LazyFrame or
+           dask.dataframe.DataFrame
+      The input data.
+    columns : tuple
+      The (xval, yval, color) columns.
+    transforms : tuple
+      Whether a log transformation occurs on the x and y values.
+    bins : int
+      Number of bins along each axis.
+
+    Returns
+    -------
+    dict
+      The "groups", "ix", "iy" and "counts" arrays of the non-empty cells,
+      the "domains" of the (transformed) x and y values, and whether they
+      had "negatives" before the log transformation.
+    """
+    backend = _native_backend(data)
+    if backend == "arrow":
+        return _arrow_binned_counts(data, columns, transforms, bins)
+    if backend == "dask":
+        return _dask_binned_counts(data, columns, transforms, bins)
+    return _polars_binned_counts(data, columns, transforms, bins)
+
+
+def _partition_reduce(data, columns, chunk, combine):
+    """
+    Reduce the partitions of a Dask DataFrame lazily and in parallel.
+
+    Every partition, projected on the given columns, is reduced by chunk,
+    and the partial results are merged by combine in a tree of
+    _SPLIT_EVERY results per task, so that only the final result is
+    collected. The graph is computed with the configured Dask scheduler,
+    by default the local threaded one; chunk and combine are picklable, so
+    the process scheduler works as well.
+
+    Parameters
+    ----------
+    data : dask.dataframe.DataFrame
+      The input data.
+    columns : list
+      The columns read from every partition. None entries and duplicates
+      are ignored.
+    chunk : callable
+      Reduces a pandas partition to a partial result.
+    combine : callable
+      Merges two partial results.
+
+    Returns
+    -------
+    object
+      The reduction of all the partitions.
+    """
+    import dask
+
+    columns = list(dict.fromkeys(c for c in columns if c is not None))
+    parts = data[columns].to_delayed()
+    results = [dask.delayed(chunk)(part) for part in parts]
+    while len(results) > 1:
+        results = [
+            dask.delayed(reduce)(combine, results[i:i + _SPLIT_EVERY])
+            for i in range(0, len(results), _SPLIT_EVERY)
+        ]
+    return dask.compute(results[0])[0]
+
+
+def _arrow_binned_counts(table, columns, transforms, bins):
+    """
+    _native_binned_counts of a pyarrow.Table.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    axes, negatives, domains = [], [], []
+    for column, log in zip(columns[:2], transforms):
+        values = pc.cast(table[column], pa.float64())
+        negatives.append(
+            bool(log and pc.any(pc.less(values, 0)).as_py())
+        )
+        if log:
+            values = pc.ln(values)
+        domain = pc.min_max(pc.filter(values, pc.is_finite(values))).as_py()
+        axes.append(values)
+        domains.append((_as_float(domain["min"]), _as_float(domain["max"])))
+
+    valid = pc.and_(pc.is_finite(axes[0]), pc.is_finite(axes[1]))
+    cells = {"group": pc.filter(table[columns[2]], valid)}
+    for name, values, (low, high) in zip(["ix", "iy"], axes, domains):
+        width = (high - low) or 1.0
+        index = pc.floor(
+            pc.multiply(
+                pc.divide(pc.subtract(pc.filter(values, valid), low), width),
+                float(bins),
+            )
+        )
+        index = pc.min_element_wise(pc.max_element_wise(index, 0.0), bins - 1)
+        cells[name] = pc.cast(index, pa.int64())
+
+    counts = (
+        pa.table(cells)
+        .group_by(["group", "ix", "iy"])
+        .aggregate([([], "count_all")])
+        .sort_by([("group", "ascending"), ("ix", "ascending"),
+                  ("iy", "ascending")])
+    )
+    return {
+        "groups": np.asarray(counts["group"].to_pylist(), dtype=object),
+        "ix": counts["ix"].to_numpy(),
+        "iy": counts["iy"].to_numpy(),
+        "counts": counts["count_all"].to_numpy(),
+        "domains": domains,
+        "negatives": negatives,
+    }
+
+
+def _polars_binned_counts(data, columns, transforms, bins):
+    """
+    _native_binned_counts of a polars DataFrame or LazyFrame.
+    """
+    import polars as pl
+
+    frame = data.lazy()
+    axes, stats = [], []
+    for k, (column, log) in enumerate(zip(columns[:2], transforms)):
+        values = pl.col(column).cast(pl.Float64)
+        if log:
+            values = values.log()
+        finite = values.filter(values.is_finite())
+        axes.append(values)
+        stats += [
+            (pl.col(column) < 0).any().alias(f"negative {k}"),
+            finite.min().alias(f"min {k}"),
+            finite.max().alias(f"max {k}"),
+        ]
+    stats = frame.select(stats).collect().row(0, named=True)
+    domains = [
+        (_as_float(stats[f"min {k}"]), _as_float(stats[f"max {k}"]))
+        for k in range(2)
+    ]
+
+    indices = []
+    for name, values, (low, high) in zip(["ix", "iy"], axes, domains):
+        width = (high - low) or 1.0
+        indices.append(
+            ((values - low) / width * bins)
+            .floor()
+            .clip(0, bins - 1)
+            .cast(pl.Int64)
+            .alias(name)
+        )
+    counts = (
+        frame.filter(axes[0].is_finite() & axes[1].is_finite())
+        .group_by([pl.col(columns[2]).alias("group")] + indices)
+        .agg(pl.len().alias("count"))
+        .sort(["group", "ix", "iy"], nulls_last=True)
+        .collect()
+    )
+    return {
+        "groups": np.asarray(counts["group"].to_list(), dtype=object),
+        "ix": counts["ix"].to_numpy(),
+        "iy": counts["iy"].to_numpy(),
+        "counts": counts["count"].to_numpy(),
+        "domains": domains,
+        "negatives": [
+            bool(log and stats[f"negative {k}"])
+            for k, log in enumerate(transforms)
+        ],
+    }
+
+
+def _dask_binned_counts(data, columns, transforms, bins):
+    """
+    _native_binned_counts of a Dask DataFrame: a first reduction finds the
+    domains, a second one counts the cells of every partition.
+    """
+    stats = _partition_reduce(
+        data,
+        columns[:2],
+        partial(_partition_domains, columns=columns[:2],
+                transforms=transforms),
+        _merge_domains,
+    )
+    domains = [(low, high) for low, high, _ in stats]
+    counts = _partition_reduce(
+        data,
+        columns,
+        partial(_partition_cells, columns=columns, transforms=transforms,
+                domains=domains, bins=bins),
+        partial(_merge_counts, keys=["group", "ix", "iy"],
+                count_col="count"),
+    )
+    return {
+        "groups": counts["group"].to_numpy(dtype=object),
+        "ix": counts["ix"].to_numpy(),
+        "iy": counts["iy"].to_numpy(),
+        "counts": counts["count"].to_numpy(),
+        "domains": domains,
+        "negatives": [negative for _, _, negative in stats],
+    }
+
+
+def _partition_values(part, column, log):
+    """
+    The float values of a column of a partition, log transformed if
+    requested.
+    """
+    values = part[column].to_numpy(dtype=float, na_value=np.nan)
+    if log:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = np.log(values)
+    return values
+
+
+def _partition_domains(part, columns, transforms):
+    """
+    The (min, max, negatives) of the finite (transformed) values of the x
+    and y columns of a partition, NaN bounds when there are none.
+    """
+    stats = []
+    for column, log in zip(columns, transforms):
+        values = part[column].to_numpy(dtype=float, na_value=np.nan)
+        negative = bool(log and (values < 0).any())
+        values = _partition_values(part, column, log)
+        finite = values[np.isfinite(values)]
+        if finite.size:
+            stats.append((finite.min(), finite.max(), negative))
+        else:
+            stats.append((np.nan, np.nan, negative))
+    return stats
+
+
+def _merge_domains(a, b):
+    """
+    Merge the _partition_domains of two sets of partitions.
+    """
+    return [
+        (_as_float(np.fmin(low_a, low_b)), _as_float(np.fmax(high_a, high_b)),
+         negative_a or negative_b)
+        for (low_a, high_a, negative_a), (low_b, high_b, negative_b)
+        in zip(a, b)
+    ]
+
+
+def _partition_cells(part, columns, transforms, domains, bins):
+    """
+    Count the points of a partition in every cell of the grid of every
+    color group.
+    """
+    cells = {"group": part[columns[2]].to_numpy()}
+    valid = np.ones(len(part), dtype=bool)
+    for name, column, log, (low, high) in zip(
+        ["ix", "iy"], columns, transforms, domains
+    ):
+        values = _partition_values(part, column, log)
+        valid &= np.isfinite(values)
+        width = (high - low) or 1.0
+        with np.errstate(invalid="ignore"):
+            cells[name] = np.clip(
+                np.nan_to_num((values - low) / width * bins), 0, bins - 1
+            ).astype(np.int64)
+    cells = pd.DataFrame(cells)[valid]
+    return _partition_counts(cells, ["group", "ix", "iy"], "count")
+
+
+def _partition_counts(part, keys, count_col):
+    """
+    Count the rows of a partition for every combination of the keys.
+    """
+    return (
+        part.groupby(keys, dropna=False, observed=True, sort=False)
+        .size()
+        .reset_index(name=count_col)
+    )
+
+
+def _merge_counts(a, b, keys, count_col):
+    """
+    Sum the counts of two count tables of _partition_counts.
+    """
+    return (
+        pd.concat([a, b], ignore_index=True)
+        .groupby(keys, dropna=False, observed=True, sort=False)[count_col]
+        .sum()
+        .reset_index()
+    )
+
+
+def _polars_schema(data):
+    """
+    The schema of a polars DataFrame or LazyFrame, without collecting it.
+    """
+    return data.lazy().collect_schema()
+
+
+def _polars_to_pandas(frame):
+    """
+    Convert a collected polars DataFrame to pandas through numpy, so that
+    pyarrow is not required.
+    """
+    return pd.DataFrame(
+        {name: frame[name].to_numpy() for name in frame.columns}
+    )
+
+
+def _as_float(value):
+    """
+    A reduction result as a float, NaN for an empty input.
+    """
+    return np.nan if value is None else float(value)
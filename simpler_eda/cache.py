@@ -0,0 +1,200 @@
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from simpler_eda.instrumentation import _null_timer
+
+_cache = OrderedDict()
+_max_bytes = None
+_used_bytes = 0
+_stats = {"hits": 0, "misses": 0}
+# Guards the entries, their size and the counters, which the async_eda
+# threads update concurrently
+_lock = threading.RLock()
+
+
+def enable_cache(max_bytes=256 * 2 ** 20):
+    """
+    Memoize the data computed by categorical_eda, numerical_eda and
+    corr_map.
+
+    While enabled, the computed chart data (count tables, densities,
+    projected and transformed columns, bins, correlation matrices) is kept
+    in a least-recently-used cache. Its key is a content fingerprint of the
+    columns the chart reads plus the parameters that change the data, so
+    calling a function again with only cosmetic changes such as the title,
+    font_size or color_scheme skips the computation.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+      Memory budget of the cached data. The least recently used entries
+      are evicted once it is exceeded.
+
+    Examples
+    --------
+    >>> from simpler_eda.cache import enable_cache
+    >>> enable_cache(max_bytes=512 * 2 ** 20)
+    """
+    global _max_bytes
+    assert (
+        isinstance(max_bytes, int) and max_bytes > 0
+    ), "The max_bytes should be given as a positive integer"
+    with _lock:
+        _max_bytes = max_bytes
+        _evict()
+
+
+def disable_cache():
+    """
+    Stop memoizing chart data and release the cached entries.
+    """
+    global _max_bytes
+    with _lock:
+        _max_bytes = None
+        clear_cache()
+
+
+def clear_cache():
+    """
+    Release every cached entry and reset the hit and miss counters.
+    """
+    global _used_bytes
+    with _lock:
+        _cache.clear()
+        _used_bytes = 0
+        _stats.update(hits=0, misses=0)
+
+
+def cache_info():
+    """
+    Report the state of the cache.
+
+    Returns
+    -------
+    dict
+      The number of "hits", "misses" and "entries", the "bytes" in use and
+      the "max_bytes" budget, None when the cache is disabled.
+    """
+    with _lock:
+        return {
+            **_stats,
+            "entries": len(_cache),
+            "bytes": _used_bytes,
+            "max_bytes": _max_bytes,
+        }
+
+
+def _memoize(name, data, columns, params, compute, timer=_null_timer):
+    """
+    Return the cached result of compute(), computing it on a miss.
+
+    Parameters
+    ----------
+    name : str
+      Name of the calling function.
+    data : pandas.core.frame.DataFrame or EDAFrame
+      The input dataframe.
+    columns : list
+      The columns of data the result depends on.
+    params : tuple
+      The hashable parameters the result depends on.
+    compute : callable
+      Computes the result from scratch.
+    timer : _StageTimer, optional
+      Timer of the calling function, marking the fingerprinting of the data
+      as the "cache lookup" stage.
+
+    Returns
+    -------
+    object
+      The result of compute().
+    """
+    global _used_bytes
+    if _max_bytes is None:
+        return compute()
+
+    columns = list(dict.fromkeys(c for c in columns if c is not None))
+    if isinstance(data, pd.DataFrame):
+        fingerprint = _data_hash(data[columns])
+    else:
+        # An EDAFrame keeps the fingerprint of every column
+        fingerprint = data._fingerprint(columns)
+    key = (name, tuple(columns), params, fingerprint)
+    timer.mark("cache lookup")
+    with _lock:
+        if key in _cache:
+            _stats["hits"] += 1
+            _cache.move_to_end(key)
+            return _cache[key][0]
+        _stats["misses"] += 1
+
+    # The lock is not held while computing, so other calls can proceed
+    result = compute()
+    size = _sizeof(result)
+    with _lock:
+        if _max_bytes is not None and size <= _max_bytes:
+            if key in _cache:
+                # Computed meanwhile by another thread
+                _used_bytes -= _cache.pop(key)[1]
+            _cache[key] = (result, size)
+            _used_bytes += size
+            _evict()
+    return result
+
+
+def _evict():
+    """
+    Drop the least recently used entries until the budget is met, the
+    lock being held.
+    """
+    global _used_bytes
+    while _cache and _used_bytes > _max_bytes:
+        _, (_, size) = _cache.popitem(last=False)
+        _used_bytes -= size
+
+
+def _sizeof(value):
+    """
+    Estimate the memory held by a cached result.
+    """
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (tuple, list)):
+        return sum(_sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def _data_hash(data):
+    """
+    Fingerprint the content of a dataframe without serializing it.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+      The dataframe to fingerprint.
+
+    Returns
+    -------
+    str
+      A hex digest of the column names, dtypes and values.
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            [[str(c), str(t)] for c, t in data.dtypes.items()]
+        ).encode()
+    )
+    try:
+        hashed = pd.util.hash_pandas_object(data, index=False)
+        digest.update(hashed.to_numpy().tobytes())
+    except TypeError:
+        # Unhashable cells such as lists fall back to their JSON text
+        digest.update(data.to_json(orient="records").encode())
+    return digest.hexdigest()
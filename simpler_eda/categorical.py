@@ -0,0 +1,973 @@
+from collections.abc import Iterable
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from simpler_eda.backends import (
+    _columns,
+    _is_frame,
+    _is_numeric,
+    _native_backend,
+    _native_count_table,
+    _to_pandas,
+)
+from simpler_eda.cache import _memoize
+from simpler_eda.compaction import _compact
+from simpler_eda.eda_frame import _unwrap
+from simpler_eda.instrumentation import _stage_timer
+
+
+def categorical_eda(
+    data,
+    xval,
+    plot_type="histogram",
+    color=None,
+    title=None,
+    font_size=10,
+    color_scheme="tableau20",
+    plot_height=150,
+    plot_width=200,
+    opacity=1,
+    facet_factor=None,
+    facet_col=None,
+    aggregate=False,
+    bandwidth="scott",
+    grid_size=200,
+    max_categories=None,
+):
+    """
+    This function takes in a data frame object and one categorical
+    feature, to produce a histogram plot that visualizes the
+    distribution of the feature. User can also choose to plot density
+    graph of the feature by specifing in plot_type.
+    The function also offers customization on color, plot title,
+    font size, color-scheme, plot size and other common configurations.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+       Input dataframe object. A pyarrow.Table or a polars DataFrame or
+       LazyFrame is also accepted: its histogram counts are computed with
+       its own group-by and only the count table is converted to pandas.
+       The histogram counts of a Dask DataFrame are computed partition by
+       partition and summed in a tree reduction. With max_categories, an
+       iterable of dataframe chunks such as ``pd.read_csv(...,
+       chunksize=...)`` is also accepted for histograms.
+    xval : str
+      Variable used to represent the x-axis.
+    plot_type : str, optional
+      Variable used to specify plot type. Options include "histogram"
+      and "density". When "density" is selected, the variable yval becomes
+      obsolete.
+    color : str, optional
+      Variable used to set the color of the marks in the plot object.
+    tilte : str, optional
+      Variable used to set the title of the plot.
+    font_size  : int, optional
+      Variable used to set the size of the axis labels and title.
+    color_scheme : str, optional
+      Variable used to set the bar size.
+    plot_height : int, optional
+      Variable used to specify plot height
+    plot_witdh : int, optional
+      Variable used to specify plot width
+    opacity : float, optional
+      Variable used to specify density fill opacity for density plot
+    facet_factor : str, optional
+      Variable used to specify facet factor
+    facet_col : int, optional
+      Variable used to specify number of facet columns
+    aggregate : bool, optional
+      If True, the histogram counts or the density curves are computed in
+      pandas and only the aggregated table is embedded in the chart, so the
+      chart size scales with the number of categories or grid points rather
+      than the number of rows.
+    bandwidth : str or float, optional
+      Bandwidth of the Gaussian kernel used for aggregated density plots.
+      Either a rule, "scott" or "silverman", applied to every color and
+      facet group, or a positive number.
+    grid_size : int, optional
+      Number of grid points at which each aggregated density is evaluated.
+    max_categories : int, optional
+      Only plot the bars of the max_categories most frequent values of
+      xval in a histogram, the rows of the other values being counted in
+      an "Other" bar. The counts are aggregated as with aggregate=True and
+      are exact for dataframes. The chunks of an iterable are merged into a
+      Space-Saving summary monitoring ten times max_categories values, so
+      memory does not grow with the number of rows or distinct values. Its
+      counts stay exact until more distinct values than it monitors are
+      seen; beyond, a frequent value seen late may be missing and the bar
+      of a value monitored late only counts its rows since then.
+
+    Returns
+    -------
+    `altair`
+        A histogram or density chart object based on user specifications.
+
+    Examples
+    --------
+    >>> import altair as alt
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> from simpler_eda.categorical import categorical_plot
+    >>> from vega_datasets import data
+    >>> cars = data.cars()
+    >>> categorical_eda(data = cars,
+                        xval = "Origin",
+                        color = "Horsepower",
+                        title = "Histogram of Origin in Different Levels of
+                        Horsepower",
+                        plot_height = 100,
+                        plot_width = 200
+                        )
+    """
+    timer = _stage_timer("categorical_eda")
+    data, frame = _unwrap(data)
+
+    # Checking for valid inputs:
+    chunked = (
+        not _is_frame(data)
+        and isinstance(data, Iterable)
+        and max_categories is not None
+    )
+    if not _is_frame(data) and not chunked:
+        raise Exception("the input data has to be a dataframe.")
+    if facet_factor is None and facet_col is not None:
+        raise Exception("facet_factor must be provided along with facet_col.")
+    if facet_factor is not None and facet_col is None:
+        raise Exception("Specify facet_col for facetting the plot")
+    if plot_type not in ["histogram", "density"]:
+        raise Exception("plot_type must be either 'histogram' or 'density'")
+    if opacity <= 0 or opacity > 1:
+        raise Exception("opacity must be in range (0, 1)")
+    if not chunked:
+        _check_features(_columns(data), xval, color, facet_factor)
+    if not isinstance(aggregate, bool):
+        raise Exception("aggregate must be of type boolean.")
+    if isinstance(bandwidth, str):
+        if bandwidth not in ["scott", "silverman"]:
+            raise Exception(
+                "bandwidth must be 'scott', 'silverman' or a positive number"
+            )
+    elif not isinstance(bandwidth, (int, float)) or bandwidth <= 0:
+        raise Exception(
+            "bandwidth must be 'scott', 'silverman' or a positive number"
+        )
+    if not isinstance(grid_size, int) or grid_size < 2:
+        raise Exception("grid_size must be an integer of at least 2")
+    if max_categories is not None and (
+        not isinstance(max_categories, int) or max_categories < 1
+    ):
+        raise Exception("max_categories must be a positive integer")
+    if max_categories is not None and plot_type != "histogram":
+        raise Exception("max_categories only applies to histograms")
+    if plot_type == "density" and not _is_numeric(data, xval):
+        raise Exception("xval must be numeric for density plots")
+    timer.mark("validation", None if chunked else data)
+
+    native = not chunked and _native_backend(data) is not None
+    if native and plot_type == "density":
+        # The densities are estimated from the plotted columns only
+        data = _to_pandas(data, [xval, color, facet_factor])
+        timer.mark("conversion", data)
+
+    # Aggregating the histogram counts up front, so only the count table is
+    # embedded in the chart instead of every row of the input dataframe.
+    # pyarrow and polars input is always counted with its own group-by
+    if chunked:
+        hist_data = _chunked_count_table(
+            data, xval, color, facet_factor, max_categories
+        )
+        timer.mark("counts", hist_data)
+        count_col = hist_data.columns[-1]
+        y_count = alt.Y(f"{count_col}:Q", title="Count of Records")
+    elif plot_type == "histogram" and native:
+        hist_data = _native_count_table(data, [xval, color, facet_factor])
+        timer.mark("counts", hist_data)
+        count_col = hist_data.columns[-1]
+        y_count = alt.Y(f"{count_col}:Q", title="Count of Records")
+    elif plot_type == "histogram" and (
+        aggregate or max_categories is not None
+    ):
+        keys = [xval, color, facet_factor]
+        hist_data = _memoize(
+            "categorical_eda.histogram",
+            data if frame is None else frame,
+            keys,
+            (),
+            lambda: (
+                _count_table(data, keys)
+                if frame is None
+                else _coded_count_table(frame, keys)
+            ),
+            timer,
+        )
+        timer.mark("counts", hist_data)
+        count_col = hist_data.columns[-1]
+        y_count = alt.Y(f"{count_col}:Q", title="Count of Records")
+    else:
+        hist_data = data
+        y_count = "count()"
+    if max_categories is not None and not chunked:
+        hist_data = _fold_categories(
+            hist_data, xval, _top_values(hist_data, xval, max_categories)
+        )
+        timer.mark("top_categories", hist_data)
+
+    # Evaluating the densities on a fixed grid up front, so only the grid
+    # points are embedded in the chart instead of every row
+    if plot_type == "density" and aggregate:
+        keys = [color, facet_factor]
+        density_data = _memoize(
+            "categorical_eda.density",
+            data if frame is None else frame,
+            [xval] + keys,
+            (xval, bandwidth, grid_size),
+            lambda: _density_table(data, xval, keys, bandwidth, grid_size),
+            timer,
+        )
+        timer.mark("density", density_data)
+    else:
+        density_data = data
+
+    color_encoding = _color_encoding(color, color_scheme)
+    density_groups = [] if color is None else [color]
+    if plot_type == "histogram":
+        categorical_plot = _histogram_chart(
+            hist_data, xval, y_count, color_encoding, title, font_size,
+            plot_height, plot_width, facet_factor, facet_col
+        )
+    elif facet_factor is None:
+        density_chart = alt.Chart(data=density_data, title=title)
+        if not aggregate:
+            density_chart = density_chart.transform_density(
+                xval, groupby=density_groups, as_=[xval, "density"]
+            )
+        categorical_plot = (
+            density_chart
+            .mark_area(opacity=opacity)
+            .encode(
+                x=xval,
+                y="density:Q",
+                **color_encoding,
+            )
+            .properties(width=plot_width, height=plot_height)
+            .configure_title(fontSize=font_size)
+            .configure_axis(
+                labelFontSize=font_size, titleFontSize=font_size
+            )
+        )
+    else:
+        density_chart = alt.Chart(data=density_data)
+        if not aggregate:
+            density_chart = density_chart.transform_density(
+                xval, groupby=density_groups, as_=[xval, "density"]
+            )
+        categorical_plot = (
+            density_chart
+            .mark_area(opacity=opacity)
+            .encode(
+                x=xval,
+                y="density:Q",
+                **color_encoding,
+            )
+            .properties(width=plot_width, height=plot_height)
+            .facet(facet_factor, columns=facet_col, title=title)
+            .configure_title(fontSize=font_size)
+            .configure_axis(
+                labelFontSize=font_size, titleFontSize=font_size
+            )
+        )
+
+    timer.mark("chart", density_data if plot_type == "density" else hist_data)
+    # The counts and densities computed up front are plotted as well
+    plotted = [xval, color, facet_factor]
+    if plot_type == "histogram" and not isinstance(y_count, str):
+        plotted.append(count_col)
+    elif plot_type == "density" and aggregate:
+        plotted.append("density")
+    categorical_plot = _compact(categorical_plot, plotted, timer)
+    return categorical_plot
+
+
+def categorical_eda_batch(
+    data,
+    xvals,
+    color=None,
+    title=None,
+    font_size=10,
+    color_scheme="tableau20",
+    plot_height=150,
+    plot_width=200,
+    facet_col=4,
+):
+    """
+    This function takes in a data frame object and a list of categorical
+    features, to produce a grid of histograms that visualize the
+    distribution of every feature. The counts of all the features are
+    computed in a single pass over the data and embedded once, as a long
+    table with one row per feature, value and color.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+       Input dataframe object.
+    xvals : list
+      Variables plotted, one histogram each.
+    color : str, optional
+      Variable used to set the color of the bars.
+    title : str, optional
+      Variable used to set the title of the plot.
+    font_size  : int, optional
+      Variable used to set the size of the axis labels and title.
+    color_scheme : str, optional
+      Variable used to set the color scheme of the bars.
+    plot_height : int, optional
+      Variable used to specify the height of every histogram
+    plot_width : int, optional
+      Variable used to specify the width of every histogram
+    facet_col : int, optional
+      Variable used to specify number of histograms per row
+
+    Returns
+    -------
+    `altair`
+        A faceted chart with one histogram per variable.
+
+    Examples
+    --------
+    >>> from simpler_eda.categorical import categorical_eda_batch
+    >>> from vega_datasets import data
+    >>> cars = data.cars()
+    >>> categorical_eda_batch(data = cars,
+                              xvals = ["Origin", "Cylinders", "Year"],
+                              color = "Origin",
+                              facet_col = 3
+                              )
+    """
+    timer = _stage_timer("categorical_eda_batch")
+    data, frame = _unwrap(data)
+
+    # Checking for valid inputs:
+    if not isinstance(data, pd.DataFrame):
+        raise Exception("the input data has to be a dataframe.")
+    if not isinstance(xvals, list) or len(xvals) == 0:
+        raise Exception("xvals must be a non-empty list of features")
+    if any(xval not in data.columns for xval in xvals):
+        raise Exception("xvals must be features in the input dataframe")
+    if color is not None and color not in data.columns:
+        raise Exception("color must be a feature in the input dataframe")
+    if not isinstance(facet_col, int) or facet_col < 1:
+        raise Exception("facet_col must be a positive integer")
+    timer.mark("validation", data)
+
+    counts = _memoize(
+        "categorical_eda_batch",
+        data if frame is None else frame,
+        xvals + [color],
+        (tuple(xvals),),
+        lambda: _batch_count_table(data, xvals, color, frame),
+        timer,
+    )
+    timer.mark("counts", counts)
+    variable_col, value_col, *_, count_col = counts.columns
+
+    encoding = {
+        "x": alt.X(f"{value_col}:N", title=None, sort=None),
+        "y": alt.Y(f"{count_col}:Q", title="Count of Records"),
+        **_color_encoding(color, color_scheme),
+    }
+    batch_plot = (
+        alt.Chart(data=counts)
+        .mark_bar()
+        .encode(**encoding)
+        .properties(width=plot_width, height=plot_height)
+        .facet(
+            alt.Facet(f"{variable_col}:N", sort=list(map(str, xvals)),
+                      title=None),
+            columns=facet_col,
+        )
+        .resolve_scale(x="independent", y="independent")
+    )
+    if title is not None:
+        batch_plot = batch_plot.properties(title=title)
+    batch_plot = batch_plot.configure_title(fontSize=font_size).configure_axis(
+        labelFontSize=font_size, titleFontSize=font_size
+    )
+    timer.mark("chart", counts)
+    batch_plot = _compact(batch_plot, None, timer)
+    return batch_plot
+
+
+def _check_features(columns, xval, color, facet_factor):
+    """
+    Check that the plotted features are columns of the input data.
+    """
+    if xval not in columns:
+        raise Exception("xval must be a feature in the input dataframe")
+    if color is not None and color not in columns:
+        raise Exception("color must be a feature in the input dataframe")
+    if facet_factor is not None and facet_factor not in columns:
+        raise Exception(
+            "facet_factor must be a feature in the input dataframe"
+        )
+
+
+def _color_encoding(color, color_scheme):
+    """
+    The color channel of the marks, empty without a color so that the marks
+    keep the default color of the chart.
+    """
+    if color is None:
+        return {}
+    return {"color": alt.Color(color, scale=alt.Scale(scheme=color_scheme))}
+
+
+def _histogram_chart(hist_data, xval, y_count, color_encoding, title,
+                     font_size, plot_height, plot_width, facet_factor=None,
+                     facet_col=None):
+    """
+    Make the bar chart of categorical_eda, faceted when facet_factor is
+    given.
+
+    Parameters
+    ----------
+    hist_data : pandas.core.frame.DataFrame
+      The rows, or the count table, plotted.
+    xval : str
+      Variable on the x-axis.
+    y_count : str or altair.Y
+      "count()" to count the rows in Vega-Lite, or the y channel of the
+      counts of a count table.
+    color_encoding : dict
+      The color channel from _color_encoding.
+    title, font_size, plot_height, plot_width, facet_factor, facet_col
+      As in categorical_eda.
+
+    Returns
+    -------
+    altair.Chart or altair.FacetChart
+      The histogram.
+    """
+    if facet_factor is None:
+        chart = alt.Chart(data=hist_data, title=title)
+    else:
+        chart = alt.Chart(data=hist_data)
+    chart = (
+        chart.mark_bar()
+        .encode(x=alt.X(xval), y=y_count, **color_encoding)
+        .properties(width=plot_width, height=plot_height)
+    )
+    if facet_factor is not None:
+        chart = chart.facet(facet_factor, columns=facet_col, title=title)
+    return chart.configure_title(fontSize=font_size).configure_axis(
+        labelFontSize=font_size, titleFontSize=font_size
+    )
+
+
+def _count_table(data, keys):
+    """
+    Count the rows of a dataframe for every combination of the given
+    grouping columns in a single pass.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+      Input dataframe object.
+    keys : list
+      Column names to group by. None entries and duplicates are ignored.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      One row per observed combination of the grouping columns, with the
+      number of rows stored in the last column.
+    """
+    keys = list(dict.fromkeys(k for k in keys if k is not None))
+    count_col = "count"
+    while count_col in keys:
+        count_col = f"{count_col}_"
+    return (
+        data.groupby(keys, dropna=False, observed=True, sort=False)
+        .size()
+        .reset_index(name=count_col)
+    )
+
+
+def _coded_count_table(frame, keys):
+    """
+    _count_table of an EDAFrame, counting the combinations of the
+    factorized codes of its grouping columns with a single np.unique.
+
+    Parameters
+    ----------
+    frame : EDAFrame
+      The profiled input dataframe.
+    keys : list
+      Column names to group by. None entries and duplicates are ignored.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      The count table of _count_table, in the same order.
+    """
+    keys = list(dict.fromkeys(k for k in keys if k is not None))
+    count_col = "count"
+    while count_col in keys:
+        count_col = f"{count_col}_"
+    combined = np.zeros(len(frame.data), dtype=np.int64)
+    for key in keys:
+        codes, uniques = frame._codes(key)
+        # Missing values form a group of their own, as with dropna=False
+        n_codes = len(uniques) + 1
+        if combined.max(initial=0) > 2 ** 62 // n_codes:
+            # The combined codes would overflow
+            return _count_table(frame.data, keys)
+        codes = np.where(codes < 0, len(uniques), codes)
+        combined = combined * n_codes + codes
+
+    _, first, counts = np.unique(
+        combined, return_index=True, return_counts=True
+    )
+    # Ordering the groups by first appearance, as groupby(sort=False), and
+    # taking their values from their first row to keep the dtypes
+    order = np.argsort(first, kind="stable")
+    table = frame.data[keys].take(first[order]).reset_index(drop=True)
+    table[count_col] = counts[order]
+    return table
+
+
+def _batch_count_table(data, xvals, color, frame=None):
+    """
+    Count the rows of a dataframe for every value of each given column and
+    every color with one np.bincount per column over factorized codes.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+      Input dataframe object.
+    xvals : list
+      Column names whose values are counted.
+    color : str or None
+      Column name the counts are split by.
+    frame : EDAFrame, optional
+      Profile of data whose factorized codes are reused.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      The "variable" name, its "value" as a string, the color value when a
+      color is given and the number of rows in the last column, in the
+      order of the values. Missing values are counted as a value of their
+      own.
+    """
+    taken = {color}
+    names = []
+    for name in ["variable", "value", "count"]:
+        while name in taken:
+            name = f"{name}_"
+        taken.add(name)
+        names.append(name)
+    variable_col, value_col, count_col = names
+
+    # Factorizing the color once, missing values getting the last code
+    if color is None:
+        color_codes, color_uniques = np.zeros(len(data), dtype=np.intp), [None]
+    else:
+        color_codes, color_uniques = _factorize(data[color], frame)
+    n_colors = len(color_uniques)
+
+    tables = []
+    for xval in xvals:
+        codes, uniques = _factorize(data[xval], frame)
+        counts = np.bincount(
+            codes * n_colors + color_codes, minlength=len(uniques) * n_colors
+        )
+        cells = np.flatnonzero(counts)
+        values = pd.Series(uniques, dtype=object).iloc[cells // n_colors]
+        table = {
+            variable_col: str(xval),
+            value_col: values.map(_value_label).to_numpy(),
+        }
+        if color is not None:
+            table[color] = np.asarray(color_uniques, dtype=object)[
+                cells % n_colors
+            ]
+        table[count_col] = counts[cells]
+        tables.append(pd.DataFrame(table))
+    return pd.concat(tables, ignore_index=True)
+
+
+def _factorize(values, frame=None):
+    """
+    Encode a column as integer codes in the sorted order of its values,
+    missing values being encoded as one more value after the observed ones.
+    The codes of an EDAFrame are reordered instead of factorizing again.
+
+    Returns
+    -------
+    tuple
+      The codes and the list of distinct values, None for missing values.
+    """
+    try:
+        if frame is None:
+            codes, uniques = pd.factorize(values, sort=True)
+        else:
+            codes, uniques = frame._codes(values.name)
+            order = np.argsort(np.asarray(uniques), kind="stable")
+            rank = np.empty(len(order), dtype=np.intp)
+            rank[order] = np.arange(len(order))
+            codes = np.where(codes < 0, -1, rank[codes])
+            uniques = uniques.take(order)
+    except TypeError:
+        # Mixed types that cannot be compared keep their order of appearance
+        codes, uniques = pd.factorize(values)
+    uniques = list(uniques)
+    if (codes < 0).any():
+        codes = np.where(codes < 0, len(uniques), codes)
+        uniques.append(None)
+    return codes, uniques
+
+
+def _value_label(value):
+    """
+    Label of a counted value, keeping missing values as None.
+    """
+    return None if value is None else str(value)
+
+
+# Label of the bar counting the values left out by max_categories
+_OTHER = "Other"
+
+# Values monitored by the Space-Saving summary per category kept
+_SPACE_SAVING_FACTOR = 10
+
+
+def _top_values(counts, xval, max_categories):
+    """
+    The max_categories most frequent values of xval in a count table, ties
+    being broken by order of first appearance.
+    """
+    totals = counts.groupby(xval, dropna=False, observed=True, sort=False)[
+        counts.columns[-1]
+    ].sum()
+    return totals.sort_values(ascending=False, kind="stable").index[
+        :max_categories
+    ]
+
+
+def _fold_categories(counts, xval, top, other=None):
+    """
+    Fold the rows of a count table whose xval is not one of the top values
+    into an "Other" bar.
+
+    Parameters
+    ----------
+    counts : pandas.core.frame.DataFrame
+      A count table from _count_table.
+    xval : str
+      The plotted variable.
+    top : pandas.Index
+      The values of xval keeping their own bar. The "Other" bar is
+      labelled "Other" with underscores appended while it is one of them.
+    other : pandas.core.frame.DataFrame, optional
+      Counts of other values by the remaining grouping columns, added to
+      the "Other" bar.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      The count table of the top values followed by the "Other" rows.
+    """
+    keys = list(counts.columns[:-1])
+    count_col = counts.columns[-1]
+    rest = [k for k in keys if k != xval]
+    kept = counts[xval].isin(top)
+    folded = [counts.loc[~kept, rest + [count_col]]]
+    if other is not None:
+        folded.append(other)
+    folded = _sum_counts(pd.concat(folded), rest, count_col)
+    folded = folded[folded[count_col] > 0]
+    if len(folded) == 0:
+        return counts
+    kept = counts[kept].astype({xval: object})
+    kept[xval] = _iso_timestamps(kept[xval])
+    return pd.concat(
+        [
+            kept,
+            folded.assign(**{xval: _other_label(top)})[keys + [count_col]],
+        ],
+        ignore_index=True,
+    )
+
+
+def _other_label(values):
+    """
+    The label of the "Other" bar, distinct from the values keeping their
+    own bar.
+    """
+    label = _OTHER
+    while label in values:
+        label = f"{label}_"
+    return label
+
+
+def _iso_timestamps(values):
+    """
+    Replace the timestamps of an object column by their ISO text, as Altair
+    only does for datetime columns.
+    """
+    return values.map(
+        lambda v: v.isoformat() if isinstance(v, pd.Timestamp) else v
+    )
+
+
+def _sum_counts(counts, keys, count_col):
+    """
+    Sum the counts of the rows of a count table sharing the same keys.
+    """
+    if not keys:
+        return pd.DataFrame({count_col: [counts[count_col].sum()]})
+    return (
+        counts.groupby(keys, dropna=False, observed=True, sort=False)[
+            count_col
+        ]
+        .sum()
+        .reset_index()
+    )
+
+
+def _chunked_count_table(chunks, xval, color, facet_factor, max_categories):
+    """
+    Count the rows of an iterable of dataframe chunks in a Space-Saving
+    summary of the most frequent values of xval.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      The count table of the max_categories most frequent values followed
+      by the "Other" rows, as _fold_categories.
+    """
+    keys = list(
+        dict.fromkeys(k for k in [xval, color, facet_factor] if k is not None)
+    )
+    summary = None
+    for chunk in chunks:
+        if not _is_frame(chunk):
+            raise Exception("the input data has to be a dataframe.")
+        _check_features(_columns(chunk), xval, color, facet_factor)
+        if _native_backend(chunk) is None:
+            counts = _count_table(chunk, keys)
+        else:
+            counts = _native_count_table(chunk, keys)
+        if summary is None:
+            summary = _SpaceSaving(
+                xval, _SPACE_SAVING_FACTOR * max_categories
+            )
+        summary.update(counts)
+    if summary is None:
+        return _count_table(pd.DataFrame(columns=keys), keys)
+    return summary.count_table(max_categories)
+
+
+class _SpaceSaving:
+    """
+    Space-Saving summary of the most frequent values of xval, merged count
+    table by count table.
+
+    At most capacity values are monitored. Each has an upper bound of its
+    frequency, used to rank the values, and the count table of its rows
+    seen since it is monitored, plotted as its bar. When a count table
+    brings more values than the capacity, the values of lowest frequency
+    stop being monitored and their rows are folded into the "Other" counts,
+    while the values starting to be monitored when the summary is full
+    inherit the lowest frequency as in the Space-Saving algorithm. Every
+    row is counted exactly once, in the bar of its value or in "Other".
+
+    Parameters
+    ----------
+    xval : str
+      The plotted variable.
+    capacity : int
+      The number of values monitored.
+    """
+
+    def __init__(self, xval, capacity):
+        self.xval = xval
+        self.capacity = capacity
+        self.frequencies = pd.Series(dtype=float)
+        self.counts = None
+        self.other = None
+
+    def update(self, counts):
+        """
+        Merge the count table of new rows.
+        """
+        keys = list(counts.columns[:-1])
+        count_col = counts.columns[-1]
+        rest = [k for k in keys if k != self.xval]
+        totals = counts.groupby(
+            self.xval, dropna=False, observed=True, sort=False
+        )[count_col].sum()
+        # The values not monitored may have been seen up to the lowest
+        # frequency times before
+        floor = (
+            self.frequencies.min()
+            if len(self.frequencies) >= self.capacity
+            else 0
+        )
+        merged = pd.concat(
+            [self.frequencies.rename("old"), totals.rename("new")], axis=1
+        )
+        frequencies = merged["old"].fillna(floor) + merged["new"].fillna(0)
+        self.frequencies = frequencies.sort_values(
+            ascending=False, kind="stable"
+        )[: self.capacity]
+
+        if self.counts is not None:
+            counts = _sum_counts(
+                pd.concat([self.counts, counts]), keys, count_col
+            )
+        monitored = counts[self.xval].isin(self.frequencies.index)
+        dropped = [counts.loc[~monitored, rest + [count_col]]]
+        if self.other is not None:
+            dropped.append(self.other)
+        self.other = _sum_counts(pd.concat(dropped), rest, count_col)
+        self.counts = counts[monitored]
+
+    def count_table(self, max_categories):
+        """
+        The count table of the max_categories most frequent values followed
+        by the "Other" rows.
+        """
+        top = self.frequencies.index[:max_categories]
+        return _fold_categories(self.counts, self.xval, top, self.other)
+
+
+def _density_table(data, xval, keys, bandwidth, grid_size):
+    """
+    Estimate the density of a numeric column for every combination of the
+    given grouping columns with a binned Gaussian kernel density estimate.
+
+    The values are linearly binned onto a shared grid spanning the observed
+    range of xval, and every group is convolved with its kernel through a
+    single batched FFT.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+      Input dataframe object.
+    xval : str
+      Numeric column whose density is estimated.
+    keys : list
+      Column names to group by. None entries, duplicates and xval itself
+      are ignored.
+    bandwidth : str or float
+      "scott", "silverman" or a fixed positive bandwidth.
+    grid_size : int
+      Number of grid points per group.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      The grouping columns, the grid points in xval and their "density".
+    """
+    keys = list(dict.fromkeys(k for k in keys if k is not None and k != xval))
+    values = data[xval].to_numpy(dtype=float)
+    if keys:
+        grouped = data.groupby(keys, dropna=False, observed=True, sort=False)
+        codes = grouped.ngroup().to_numpy()
+        labels = grouped.size().index.to_frame(index=False)
+    else:
+        codes = np.zeros(len(values), dtype=np.intp)
+        labels = pd.DataFrame(index=range(1))
+
+    valid = np.isfinite(values) & (codes >= 0)
+    values, codes = values[valid], codes[valid]
+    if len(values) == 0:
+        return pd.DataFrame(columns=keys + [xval, "density"])
+
+    n_groups = len(labels)
+    counts = np.bincount(codes, minlength=n_groups)
+    bw = _kde_bandwidth(values, codes, counts, bandwidth)
+
+    lo, hi = values.min(), values.max()
+    if hi == lo:
+        lo, hi = lo - 3 * bw.max(), hi + 3 * bw.max()
+    grid = np.linspace(lo, hi, grid_size)
+    delta = grid[1] - grid[0]
+
+    # Linear binning: every value splits its weight between the two
+    # neighbouring grid points of its own group
+    pos = (values - lo) / delta
+    idx = np.clip(np.floor(pos).astype(np.intp), 0, grid_size - 2)
+    frac = pos - idx
+    flat = codes * grid_size + idx
+    size = n_groups * grid_size
+    weights = np.bincount(flat, 1 - frac, minlength=size) + np.bincount(
+        flat + 1, frac, minlength=size
+    )
+    weights = weights.reshape(n_groups, grid_size)
+
+    # Convolving every group with its own Gaussian kernel, truncated at four
+    # bandwidths, in one batched FFT
+    half = int(min(grid_size - 1, np.ceil(4 * bw.max() / delta)))
+    offsets = np.arange(-half, half + 1) * delta
+    kernel = np.exp(-0.5 * (offsets / bw[:, None]) ** 2) / (
+        bw[:, None] * np.sqrt(2 * np.pi)
+    )
+    n_fft = 1 << int(np.ceil(np.log2(grid_size + 2 * half)))
+    density = np.fft.irfft(
+        np.fft.rfft(weights, n_fft) * np.fft.rfft(kernel, n_fft), n_fft
+    )[:, half:half + grid_size]
+    density = np.clip(density, 0, None) / np.maximum(counts, 1)[:, None]
+
+    observed = np.flatnonzero(counts)
+    density_df = labels.iloc[np.repeat(observed, grid_size)].reset_index(
+        drop=True
+    )
+    density_df[xval] = np.tile(grid, len(observed))
+    density_df["density"] = density[observed].ravel()
+    return density_df
+
+
+def _kde_bandwidth(values, codes, counts, bandwidth):
+    """
+    Compute the Gaussian kernel bandwidth of every group.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+      Finite values of the density column.
+    codes : numpy.ndarray
+      Group code of every value.
+    counts : numpy.ndarray
+      Number of values in every group.
+    bandwidth : str or float
+      "scott", "silverman" or a fixed positive bandwidth.
+
+    Returns
+    -------
+    numpy.ndarray
+      One positive bandwidth per group.
+    """
+    n_groups = len(counts)
+    if not isinstance(bandwidth, str):
+        return np.full(n_groups, float(bandwidth))
+
+    grouped = pd.Series(values).groupby(codes)
+    std = grouped.std().reindex(range(n_groups)).to_numpy()
+    n = np.maximum(counts, 1) ** -0.2
+    if bandwidth == "scott":
+        bw = 1.059 * std * n
+    else:
+        quartiles = grouped.quantile([0.25, 0.75]).unstack()
+        iqr = (quartiles[0.75] - quartiles[0.25]).reindex(range(n_groups))
+        spread = np.fmin(std, iqr.to_numpy() / 1.34)
+        spread = np.where(spread > 0, spread, std)
+        bw = 0.9 * spread * n
+
+    # Single-valued or constant groups fall back to a tenth of the range
+    fallback = (values.max() - values.min()) / 10 or 1.0
+    return np.where(np.isfinite(bw) & (bw > 0), bw, fallback)
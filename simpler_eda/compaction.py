@@ -0,0 +1,199 @@
+import json
+
+import altair as alt
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_float_dtype, is_object_dtype, is_string_dtype
+
+from simpler_eda.instrumentation import _null_timer
+
+_settings = None
+
+# Characters of the codes replacing repeated strings
+_CODE_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def enable_compaction(precision=6, encode_strings=True):
+    """
+    Compact the data embedded in the charts of categorical_eda,
+    numerical_eda, corr_map, categorical_eda_batch and pair_plot.
+
+    While enabled, the columns a chart does not use are dropped, floats are
+    rounded to the given number of significant digits, integral float
+    columns are stored as integers and, optionally, repeated strings are
+    replaced by short codes. A calculate transform restores the strings in
+    the browser before any other transform, so the rendered chart is
+    unchanged apart from the rounding.
+
+    Parameters
+    ----------
+    precision : int, optional
+      Number of significant digits kept for float values.
+    encode_strings : bool, optional
+      Whether to dictionary-encode string columns with repeated values.
+
+    Examples
+    --------
+    >>> from simpler_eda.compaction import enable_compaction, spec_size
+    >>> from simpler_eda.correlation import corr_map
+    >>> from vega_datasets import data
+    >>> enable_compaction(precision=3)
+    >>> spec_size(corr_map(data.cars(), ["Horsepower", "Displacement"]))
+    """
+    global _settings
+    assert (
+        isinstance(precision, int) and precision > 0
+    ), "The precision should be given as a positive integer"
+    assert isinstance(
+        encode_strings, bool
+    ), "The encode_strings should be given as a boolean"
+    _settings = {"precision": precision, "encode_strings": encode_strings}
+
+
+def disable_compaction():
+    """
+    Embed the chart data at full precision again.
+    """
+    global _settings
+    _settings = None
+
+
+def spec_size(chart):
+    """
+    Measure the size of the serialized Vega-Lite specification of a chart.
+
+    Parameters
+    ----------
+    chart : altair.TopLevelMixin
+      Any chart, for instance one returned by corr_map.
+
+    Returns
+    -------
+    int
+      Number of bytes of the JSON specification, including the inline data.
+    """
+    return len(json.dumps(chart.to_dict()).encode())
+
+
+def _compact(chart, columns=None, timer=_null_timer):
+    """
+    Compact the data of a chart when compaction is enabled.
+
+    Parameters
+    ----------
+    chart : altair.TopLevelMixin
+      A chart holding a dataframe as its top-level data.
+    columns : list, optional
+      The columns used by the chart, None when all are used.
+    timer : _StageTimer, optional
+      Timer of the calling function, marking the "compaction" stage.
+
+    Returns
+    -------
+    altair.TopLevelMixin
+      A copy of the chart with the compacted data, or the chart itself.
+    """
+    if _settings is None or not isinstance(chart.data, pd.DataFrame):
+        return chart
+    data = chart.data
+    if columns is not None:
+        data = data[list(dict.fromkeys(c for c in columns if c is not None))]
+
+    compacted = {}
+    calculate = []
+    for name, values in data.items():
+        if is_float_dtype(values):
+            values = _round_floats(values, _settings["precision"])
+        elif _settings["encode_strings"] and (
+            is_object_dtype(values) or is_string_dtype(values)
+        ):
+            values, labels = _encode_strings(values)
+            if labels:
+                calculate.append(
+                    alt.CalculateTransform(**_restore_transform(name, labels))
+                )
+        compacted[name] = values
+
+    chart = chart.copy(deep=False)
+    chart.data = pd.DataFrame(compacted, index=data.index)
+    if calculate:
+        # Top-level transforms run before the faceting and the transforms
+        # of the chart, so every later step sees the original strings
+        transform = [] if chart.transform is alt.Undefined else chart.transform
+        chart.transform = calculate + list(transform)
+    timer.mark("compaction", chart.data)
+    return chart
+
+
+def _round_floats(values, precision):
+    """
+    Round every value to precision significant digits, converting the
+    column to integers when all its values are integral.
+    """
+    x = values.to_numpy(dtype=float, na_value=np.nan)
+    finite = np.isfinite(x) & (x != 0)
+    magnitude = np.zeros(len(x))
+    # Bounding the magnitude keeps the scale finite for subnormal values
+    magnitude[finite] = np.maximum(
+        np.floor(np.log10(np.abs(x[finite]))), -290
+    )
+    scale = 10.0 ** (precision - 1 - magnitude)
+    rounded = np.where(finite, np.round(x * scale) / scale, x)
+    if (
+        np.isfinite(rounded).all()
+        and (np.abs(rounded) < 2 ** 53).all()
+        and (rounded == np.round(rounded)).all()
+    ):
+        return pd.Series(rounded.astype(np.int64), index=values.index)
+    return pd.Series(rounded, index=values.index)
+
+
+def _encode_strings(values):
+    """
+    Replace the strings of a column repeating its values by short codes.
+
+    Returns
+    -------
+    tuple
+      The encoded column and the mapping of codes to strings, empty when
+      the column is left unchanged.
+    """
+    codes, uniques = pd.factorize(values)
+    if not all(isinstance(u, str) for u in uniques):
+        return values, {}
+    keys = np.array([_code(k) for k in range(len(uniques))], dtype=object)
+    # Encoding only pays off when the bytes saved on every occurrence
+    # exceed the size of the mapping and of its transform
+    occurrences = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    saved = sum(
+        n * (len(json.dumps(u)) - len(json.dumps(k)))
+        for n, u, k in zip(occurrences, uniques, keys)
+    )
+    labels = dict(zip(keys, uniques))
+    if saved <= len(json.dumps(_restore_transform(values.name, labels))):
+        return values, {}
+    encoded = np.where(codes >= 0, keys[np.maximum(codes, 0)], None)
+    return pd.Series(encoded, index=values.index, dtype=object), labels
+
+
+def _restore_transform(name, labels):
+    """
+    Calculate transform replacing the codes of a column by its strings.
+    """
+    field = json.dumps(str(name))
+    return {
+        "calculate": f"{json.dumps(labels)}[datum[{field}]]",
+        "as": str(name),
+    }
+
+
+def _code(number):
+    """
+    Shortest code of a non-negative integer with the _CODE_DIGITS.
+    """
+    base = len(_CODE_DIGITS)
+    code = _CODE_DIGITS[number % base]
+    while number >= base:
+        number = number // base - 1
+        code = _CODE_DIGITS[number % base] + code
+    return code
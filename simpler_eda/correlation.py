@@ -0,0 +1,1072 @@
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import altair as alt
+
+from simpler_eda.backends import (
+    _is_frame,
+    _is_numeric,
+    _native_backend,
+    _partition_reduce,
+    _to_pandas,
+)
+from simpler_eda.cache import _memoize
+from simpler_eda.compaction import _compact
+from simpler_eda.eda_frame import _unwrap
+from simpler_eda.instrumentation import _stage_timer
+
+# from vega_datasets import data
+
+
+def corr_map(
+    data,
+    features,
+    corr_method="pearson",
+    color_scheme="blueorange",
+    plot_width=450,
+    plot_height=450,
+    title="Correlation Map",
+    n_jobs=1,
+    min_abs_corr=None,
+    top_k=None,
+    cluster=False,
+):
+    """
+    Plot a correlation map with the given dataframe object and a list of
+    numerical features.Users are allowed to set multiple arguments regarding
+    the setting of the correlation plot including method to calculate
+    correlation, color schemes, plot width, height, and plot title.
+
+    Parameters
+    ----------
+    data: pandas.core.frame.DataFrame or iterable
+      The input dataframe ojbect, or an iterable of dataframe chunks such as
+      ``pd.read_csv(..., chunksize=...)``. Chunks are reduced one at a time
+      into pairwise means and co-moments, so memory does not grow with the
+      number of rows. Chunked input only supports the pearson method.
+      A pyarrow.Table or a polars DataFrame or LazyFrame is also accepted,
+      of which only the features are converted to pandas. The pearson
+      moments of a Dask DataFrame are computed partition by partition and
+      merged in a tree reduction, so only the matrix is collected.
+
+    features: list
+      A 1D list with names of numerical feature in str for correlation map
+      plotting. It should contain at least 2 features.
+
+    corr_method: str, optional
+      The method to calculate correlation between features. The default is
+      "Pearson", two other supported methods are "'kendall' and 'spearman'.
+      Kendall's tau-b is computed with Knight's O(n log n) algorithm.
+
+    color_scheme: str, optional
+      The color scheme
+      Other diverging color schemes can be "blueorange, "redgrey",
+      "purpleorange", etc.
+      Other proper color scheme reference can be found in
+      https://vega.github.io/vega/docs/schemes/
+
+    plot_width: int, optional
+      The width of the plot
+
+    plot_height: int, optional
+      The heigh of the plot
+
+    title: str, optional
+      The title of the correlation map
+
+    n_jobs: int, optional
+      Number of worker processes computing the 'kendall' and 'spearman'
+      correlations. The feature pairs are split into tiles and the column
+      ranks are shared with the workers through shared memory. -1 uses all
+      CPU cores. The results are identical to the serial computation.
+
+    min_abs_corr: float, optional
+      Only plot the pairs of features whose absolute correlation is at
+      least this threshold, between 0 and 1.
+
+    top_k: int, optional
+      Only plot, for every feature, the pairs with its top_k strongest
+      absolute correlations. A pair is kept when it is in the top_k of
+      either feature.
+
+    With min_abs_corr or top_k, the 'pearson' and 'spearman' (without
+    missing values) correlations are computed in blocks of columns and only
+    the kept cells are stored, so wide tables never hold the dense matrix.
+    The diagonal is always plotted.
+
+    cluster: bool, optional
+      If True, the features are ordered along the axes by average linkage
+      hierarchical clustering of 1 - |correlation|, so that correlated
+      features are adjacent. Requires scipy.
+
+    Returns
+    -------
+    `altair`
+      The altair correlation map plot
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import altair as alt
+    >>> import numpy as np
+    >>> from simpler_eda.correlation import corr_map
+    >>> from vega_datasets import data
+    >>> df = data.cars()
+    >>> corr_map(df,
+    ["Horsepower", "Displacement", "Cylinders", "Acceleration"])
+    """
+    timer = _stage_timer("corr_map")
+    data, frame = _unwrap(data)
+
+    # Checking for valid inputs:
+    chunked = not _is_frame(data)
+    assert not chunked or isinstance(
+        data, Iterable
+    ), "The input data is not a panda dataframe"
+    assert isinstance(features, list), "The input for feature should be a list"
+    assert (
+        len(features) >= 2
+    ), "There should be at least 2 features in the list"
+    assert all(
+        isinstance(f, str) for f in features
+    ), "All the entries in the feature list should be a string"
+    assert chunked or all(
+        _is_numeric(data, f) for f in features
+    ), "All features in the list should be numeric"
+    assert corr_method in [
+        "pearson",
+        "kendall",
+        "spearman",
+    ], """The correlation method should be 'pearson', 'kendall',
+            or 'spearman' """
+    assert isinstance(
+        color_scheme, str
+    ), "The color scheme should be given as a string"
+    assert isinstance(
+        plot_width, int
+    ), "The plot_width should be given as an integer"
+    assert isinstance(
+        plot_height, int
+    ), "The plot_height should be given as an integer"
+    assert isinstance(title, str), "The title should be given as a string"
+    assert (
+        isinstance(n_jobs, int) and n_jobs != 0
+    ), "The n_jobs should be given as a non-zero integer"
+    assert (
+        not chunked or corr_method == "pearson"
+    ), "Chunked input only supports the 'pearson' correlation method"
+    assert min_abs_corr is None or (
+        isinstance(min_abs_corr, (int, float)) and 0 <= min_abs_corr <= 1
+    ), "The min_abs_corr should be a number between 0 and 1"
+    assert top_k is None or (
+        isinstance(top_k, int) and top_k > 0
+    ), "The top_k should be given as a positive integer"
+    assert isinstance(
+        cluster, bool
+    ), "The cluster should be given as a boolean"
+    timer.mark("validation", None if chunked else data)
+
+    backend = _native_backend(data)
+    if backend == "dask" and corr_method == "pearson":
+        # The moments of the partitions are merged without collecting rows
+        corr_df, order = _matrix_frame(
+            _dask_pearson_corr(data, features), min_abs_corr, top_k, cluster
+        )
+    elif chunked:
+        corr_df, order = _matrix_frame(
+            _chunked_pearson_corr(data, features), min_abs_corr, top_k,
+            cluster
+        )
+    else:
+        if backend is not None:
+            # Only the features are read from pyarrow, polars and Dask input
+            data = _to_pandas(data, features)
+            timer.mark("conversion", data)
+        corr_df, order = _memoize(
+            "corr_map",
+            data if frame is None else frame,
+            features,
+            (corr_method, min_abs_corr, top_k, cluster),
+            lambda: _corr_frame(
+                data[features], corr_method, n_jobs, min_abs_corr, top_k,
+                cluster, frame
+            ),
+            timer,
+        )
+    timer.mark("correlation", corr_df)
+    corr_map = _corr_chart(
+        corr_df, order, color_scheme, plot_width, plot_height, title
+    )
+
+    timer.mark("chart", corr_df)
+    corr_map = _compact(corr_map, None, timer)
+    return corr_map
+
+
+def _corr_chart(corr_df, order, color_scheme, plot_width, plot_height,
+                title):
+    """
+    Make the chart of corr_map from its correlations in long format.
+
+    Parameters
+    ----------
+    corr_df : pandas.core.frame.DataFrame
+      The "level_0", "level_1" feature pairs and their "corr".
+    order : list
+      The clustered order of the features, or None.
+    color_scheme, plot_width, plot_height, title
+      As in corr_map.
+
+    Returns
+    -------
+    altair.Chart
+      The correlation map.
+    """
+    sort = alt.Undefined if order is None else order
+    return (
+        alt.Chart(corr_df, title=title)
+        .mark_rect(opacity=0.45)
+        .encode(
+            alt.X("level_0", title="", sort=sort),
+            alt.Y("level_1", title="", sort=sort),
+            alt.Size("corr", title="Correlation"),
+            alt.Color(
+                "corr",
+                scale=alt.Scale(
+                    scheme=color_scheme, reverse=True, domain=(-1, 1)
+                ),
+                title="Correlation",
+            ),
+            alt.Tooltip(["level_0", "level_1"]),
+        )
+        .configure_axis(labelFontSize=15)
+        .configure_title(fontSize=20)
+        .configure_legend(
+            titleFontSize=14, titleAlign="center", labelFontSize=13
+        )
+        .properties(width=plot_width, height=plot_height)
+        .interactive()
+    )
+
+
+def _corr_frame(selected_cols, corr_method, n_jobs=1, min_abs_corr=None,
+                top_k=None, cluster=False, frame=None):
+    """
+    Compute the correlations of the columns in the long format plotted by
+    corr_map.
+
+    Parameters
+    ----------
+    selected_cols : pandas.core.frame.DataFrame
+      The numeric columns to correlate.
+    corr_method : str
+      "pearson", "kendall" or "spearman".
+    n_jobs : int, optional
+      Number of worker processes for the rank correlations.
+    min_abs_corr, top_k, cluster : optional
+      As in corr_map.
+    frame : EDAFrame, optional
+      Profile of the input dataframe whose null counts, cardinalities and
+      dense ranks are reused.
+
+    Returns
+    -------
+    tuple
+      The "level_0", "level_1" feature pairs and their "corr", and the
+      clustered order of the features or None.
+    """
+    sparse = min_abs_corr is not None or top_k is not None
+    features = list(selected_cols.columns)
+    if frame is None:
+        values = selected_cols.to_numpy(dtype=float, na_value=np.nan)
+        missing = np.isnan(values).any()
+    else:
+        values = None
+        missing = any(frame._null_count(f) for f in features)
+    if sparse and corr_method == "spearman" and not missing:
+        # Without missing values, spearman is the pearson correlation of
+        # the average ranks
+        ranks = _column_ranks(selected_cols, frame)
+        values = np.column_stack(
+            [_average_ranks(r) for r in ranks]
+        ) if len(selected_cols) else np.empty((0, len(features)))
+        corr_method = "pearson"
+    if sparse and corr_method == "pearson":
+        if values is None:
+            values = selected_cols.to_numpy(dtype=float, na_value=np.nan)
+        if frame is None:
+            distinct = selected_cols.nunique().to_numpy()
+        else:
+            distinct = np.array([frame._cardinality(f) for f in features])
+        return _sparse_frame(
+            features,
+            _pearson_blocks(values, _BLOCK_SIZE),
+            np.where(distinct >= 2, 1.0, np.nan),
+            min_abs_corr,
+            top_k,
+            cluster,
+        )
+
+    if corr_method == "pearson":
+        corr_matrix = selected_cols.corr(corr_method)
+    else:
+        corr_matrix = _rank_corr(
+            selected_cols, corr_method, n_jobs,
+            _column_ranks(selected_cols, frame)
+        )
+    return _matrix_frame(corr_matrix, min_abs_corr, top_k, cluster)
+
+
+def _matrix_frame(corr_matrix, min_abs_corr=None, top_k=None,
+                  cluster=False):
+    """
+    Turn a dense correlation matrix into the long format plotted by
+    corr_map.
+
+    Parameters
+    ----------
+    corr_matrix : pandas.core.frame.DataFrame
+      The symmetric correlation matrix.
+    min_abs_corr, top_k, cluster : optional
+      As in corr_map.
+
+    Returns
+    -------
+    tuple
+      The "level_0", "level_1" feature pairs and their "corr", and the
+      clustered order of the features or None.
+    """
+    features = list(corr_matrix.columns)
+    values = corr_matrix.to_numpy()
+    i, j = np.triu_indices(len(values), k=1)
+    if min_abs_corr is None and top_k is None:
+        order = None
+        if cluster:
+            order = _cluster_order(
+                features, 1 - np.abs(np.nan_to_num(values[i, j]))
+            )
+        return corr_matrix.stack().reset_index(name="corr"), order
+
+    return _sparse_frame(
+        features,
+        [(i, j, values[i, j])],
+        np.diag(values),
+        min_abs_corr,
+        top_k,
+        cluster,
+    )
+
+
+# Number of features per block of the sparse correlation computation
+_BLOCK_SIZE = 256
+
+
+def _pearson_blocks(values, block_size):
+    """
+    Compute the pairwise Pearson correlations of the columns of a 2D array
+    one block of columns against another at a time.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+      A (rows, features) float array with NaN for missing values, which
+      are excluded pairwise.
+    block_size : int
+      Number of features per block.
+
+    Yields
+    ------
+    tuple
+      The i and j feature indices of the pairs i < j of a block and their
+      correlations.
+    """
+    n_features = values.shape[1]
+    valid = ~np.isnan(values)
+    observed = valid.astype(float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        shift = np.nan_to_num(
+            np.nansum(values, axis=0) / observed.sum(axis=0)
+        )
+    centered = np.where(valid, values - shift, 0.0)
+    complete = valid.all()
+    if complete:
+        # Without missing values every block is a single product of the
+        # standardized columns
+        norms = np.sqrt((centered ** 2).sum(axis=0))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centered = np.where(norms > 0, centered / norms, np.nan)
+
+    starts = range(0, n_features, block_size)
+    for a in starts:
+        rows = np.arange(a, min(a + block_size, n_features))
+        for b in starts[a // block_size:]:
+            cols = np.arange(b, min(b + block_size, n_features))
+            if complete:
+                block = centered[:, rows].T @ centered[:, cols]
+            else:
+                block = _pearson_block(centered, observed, rows, cols)
+            i, j = np.meshgrid(rows, cols, indexing="ij")
+            upper = i < j
+            yield i[upper], j[upper], np.clip(block[upper], -1.0, 1.0)
+
+
+def _pearson_block(centered, observed, rows, cols):
+    """
+    Compute the Pearson correlations between two blocks of columns over
+    the rows where both columns of a pair are observed.
+
+    Parameters
+    ----------
+    centered : numpy.ndarray
+      The values shifted by their column means, 0 where missing.
+    observed : numpy.ndarray
+      1.0 where the value is observed, 0.0 where missing.
+    rows, cols : numpy.ndarray
+      Feature indices of both blocks.
+
+    Returns
+    -------
+    numpy.ndarray
+      The (rows, cols) correlations, NaN where they are undefined.
+    """
+    x, x_observed = centered[:, rows], observed[:, rows]
+    y, y_observed = centered[:, cols], observed[:, cols]
+    count = x_observed.T @ y_observed
+    sum_x = x.T @ y_observed
+    sum_y = x_observed.T @ y
+    m2_x = (x ** 2).T @ y_observed - _safe_divide(sum_x ** 2, count)
+    m2_y = x_observed.T @ (y ** 2) - _safe_divide(sum_y ** 2, count)
+    comoment = x.T @ y - _safe_divide(sum_x * sum_y, count)
+    with np.errstate(invalid="ignore"):
+        divisor = np.sqrt(m2_x * m2_y)
+    return np.where(divisor > 0, _safe_divide(comoment, divisor), np.nan)
+
+
+def _sparse_frame(features, blocks, diagonal, min_abs_corr, top_k,
+                  cluster):
+    """
+    Keep the correlations above the threshold or among the top_k of a
+    feature and store them in the long format plotted by corr_map.
+
+    Parameters
+    ----------
+    features : list
+      The feature names.
+    blocks : iterable
+      ``(i, j, correlation)`` arrays of pairs i < j covering every pair.
+    diagonal : numpy.ndarray
+      The correlation of every feature with itself, NaN if undefined.
+    min_abs_corr, top_k, cluster : optional
+      As in corr_map.
+
+    Returns
+    -------
+    tuple
+      The "level_0", "level_1" feature pairs and their "corr" for the
+      kept pairs in both orders and the diagonal, and the clustered order
+      of the features or None.
+    """
+    n_features = len(features)
+    distances = np.ones(n_features * (n_features - 1) // 2)
+    kept = []
+    pending = 0
+    for i, j, corr in blocks:
+        if cluster:
+            # Position of the pairs in the condensed distance matrix
+            distances[n_features * i - i * (i + 1) // 2 + j - i - 1] = (
+                1 - np.abs(np.nan_to_num(corr))
+            )
+        # Undefined correlations are left out, as by stack in dense mode
+        keep = ~np.isnan(corr)
+        if min_abs_corr is not None:
+            keep &= np.abs(corr) >= min_abs_corr
+        kept.append((i[keep], j[keep], corr[keep]))
+        pending += keep.sum()
+        # Candidates outside the top_k of both their features can never
+        # enter it again, so they are pruned as the blocks come in
+        if top_k is not None and pending > 4 * top_k * n_features:
+            kept = [_top_k_cells(*map(np.concatenate, zip(*kept)), top_k)]
+            pending = len(kept[0][0])
+
+    i, j, corr = (
+        map(np.concatenate, zip(*kept)) if kept
+        else (np.empty(0, int), np.empty(0, int), np.empty(0))
+    )
+    if top_k is not None:
+        i, j, corr = _top_k_cells(i, j, corr, top_k)
+
+    defined = np.flatnonzero(~np.isnan(diagonal))
+    rows = np.concatenate([i, j, defined])
+    cols = np.concatenate([j, i, defined])
+    values = np.concatenate([corr, corr, diagonal[defined]])
+    position = np.lexsort((cols, rows))
+    names = np.asarray(features, dtype=object)
+    corr_df = pd.DataFrame(
+        {
+            "level_0": names[rows[position]],
+            "level_1": names[cols[position]],
+            "corr": values[position],
+        }
+    )
+    order = _cluster_order(features, distances) if cluster else None
+    return corr_df, order
+
+
+def _top_k_cells(i, j, corr, top_k):
+    """
+    Keep the pairs among the top_k strongest absolute correlations of
+    either of their features.
+    """
+    ends = np.concatenate([i, j])
+    pairs = np.tile(np.arange(len(corr)), 2)
+    strength = np.abs(np.concatenate([corr, corr]))
+    position = np.lexsort((-strength, ends))
+    sorted_ends = ends[position]
+    rank = np.arange(len(position)) - np.searchsorted(
+        sorted_ends, sorted_ends
+    )
+    keep = np.zeros(len(corr), dtype=bool)
+    keep[pairs[position[rank < top_k]]] = True
+    return i[keep], j[keep], corr[keep]
+
+
+def _cluster_order(features, distances):
+    """
+    Order the features by average linkage hierarchical clustering.
+
+    Parameters
+    ----------
+    features : list
+      The feature names.
+    distances : numpy.ndarray
+      The condensed 1 - |correlation| distance matrix.
+
+    Returns
+    -------
+    list
+      The features in the order of the leaves of the dendrogram.
+    """
+    try:
+        from scipy.cluster.hierarchy import leaves_list, linkage
+    except ImportError:
+        raise ImportError(
+            "Ordering the features by clustering requires scipy"
+        ) from None
+    if len(features) < 3:
+        return list(features)
+    return [
+        features[k] for k in leaves_list(linkage(distances, method="average"))
+    ]
+
+
+def _chunked_pearson_corr(chunks, features):
+    """
+    Compute the pairwise Pearson correlation matrix of an iterable of
+    dataframe chunks, holding only the running moments in memory.
+
+    Parameters
+    ----------
+    chunks : iterable
+      Dataframes sharing the given features.
+    features : list
+      The numeric columns to correlate.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      The symmetric correlation matrix.
+    """
+    moments = None
+    for chunk in chunks:
+        assert isinstance(
+            chunk, pd.DataFrame
+        ), "The input data is not a panda dataframe"
+        assert all(
+            pd.api.types.is_numeric_dtype(chunk[f]) for f in features
+        ), "All features in the list should be numeric"
+        chunk_moments = _frame_moments(chunk, features)
+        moments = (
+            chunk_moments
+            if moments is None
+            else _merge_moments(moments, chunk_moments)
+        )
+    if moments is None:
+        moments = _pearson_moments(np.empty((0, len(features))))
+    return pd.DataFrame(
+        _moments_corr(moments), index=features, columns=features
+    )
+
+
+def _dask_pearson_corr(data, features):
+    """
+    Compute the pairwise Pearson correlation matrix of a Dask DataFrame,
+    merging the moments of its partitions in a tree reduction.
+
+    Parameters
+    ----------
+    data : dask.dataframe.DataFrame
+      The input data.
+    features : list
+      The numeric columns to correlate.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      The symmetric correlation matrix.
+    """
+    moments = _partition_reduce(
+        data,
+        features,
+        partial(_frame_moments, features=features),
+        _merge_moments,
+    )
+    return pd.DataFrame(
+        _moments_corr(moments), index=features, columns=features
+    )
+
+
+def _frame_moments(chunk, features):
+    """
+    _pearson_moments of the features of a pandas dataframe.
+    """
+    return _pearson_moments(
+        chunk[features].to_numpy(dtype=float, na_value=np.nan)
+    )
+
+
+def _pearson_moments(values):
+    """
+    Compute the pairwise-complete moments of the columns of a 2D array.
+
+    Entry [i, j] of every matrix only uses the rows where both column i and
+    column j are observed, as in the pairwise deletion of pandas.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+      A (rows, features) float array with NaN for missing values.
+
+    Returns
+    -------
+    tuple
+      ``(count, mean, m2, comoment)`` matrices where mean[i, j] and
+      m2[i, j] are the mean and sum of squared deviations of column i, and
+      comoment[i, j] is the sum of cross deviations of columns i and j.
+    """
+    valid = ~np.isnan(values)
+    observed = valid.astype(float)
+    # Shifting by the column means keeps the sums of squares well
+    # conditioned
+    with np.errstate(invalid="ignore", divide="ignore"):
+        shift = np.nan_to_num(
+            np.nansum(values, axis=0) / observed.sum(axis=0)
+        )
+    centered = np.where(valid, values - shift, 0.0)
+
+    count = observed.T @ observed
+    sums = centered.T @ observed
+    squares = (centered ** 2).T @ observed
+    products = centered.T @ centered
+    mean = _safe_divide(sums, count)
+    m2 = squares - mean * sums
+    comoment = products - mean * sums.T
+    return count, mean + shift[:, None], m2, comoment
+
+
+def _merge_moments(a, b):
+    """
+    Merge the moments of two disjoint sets of rows with Chan's parallel
+    update formulas.
+
+    Parameters
+    ----------
+    a, b : tuple
+      ``(count, mean, m2, comoment)`` matrices from _pearson_moments.
+
+    Returns
+    -------
+    tuple
+      The moments of the union of both sets of rows.
+    """
+    count_a, mean_a, m2_a, comoment_a = a
+    count_b, mean_b, m2_b, comoment_b = b
+    count = count_a + count_b
+    delta = np.where((count_a > 0) & (count_b > 0), mean_b - mean_a, 0.0)
+    weight = _safe_divide(count_a * count_b, count)
+    mean = mean_a + delta * _safe_divide(count_b, count)
+    mean = np.where(count_a > 0, mean, mean_b)
+    m2 = m2_a + m2_b + delta ** 2 * weight
+    comoment = comoment_a + comoment_b + delta * delta.T * weight
+    return count, mean, m2, comoment
+
+
+def _moments_corr(moments):
+    """
+    Turn pairwise moments into a Pearson correlation matrix.
+
+    Parameters
+    ----------
+    moments : tuple
+      ``(count, mean, m2, comoment)`` matrices from _pearson_moments.
+
+    Returns
+    -------
+    numpy.ndarray
+      The correlation matrix, NaN where it is undefined.
+    """
+    _, _, m2, comoment = moments
+    with np.errstate(invalid="ignore"):
+        divisor = np.sqrt(m2 * m2.T)
+    return np.where(divisor > 0, _safe_divide(comoment, divisor), np.nan)
+
+
+def _safe_divide(numerator, denominator):
+    """
+    Elementwise division returning 0 where the denominator is 0.
+    """
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros(np.broadcast(numerator, denominator).shape),
+        where=denominator != 0,
+    )
+
+
+def _column_ranks(selected_cols, frame=None):
+    """
+    The dense ranks of every column, those kept by an EDAFrame when given.
+    """
+    if frame is not None:
+        return [frame._ranks(f) for f in selected_cols.columns]
+    return [
+        _dense_ranks(selected_cols[f].to_numpy(dtype=float, na_value=np.nan))
+        for f in selected_cols.columns
+    ]
+
+
+def _dense_ranks(values):
+    """
+    Compute the dense rank of every value of a numeric column.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+      The column values, possibly containing NaN.
+
+    Returns
+    -------
+    numpy.ndarray
+      0-based dense ranks as int64, with -1 for missing values.
+    """
+    ranks = np.full(len(values), -1, dtype=np.int64)
+    valid = ~np.isnan(values)
+    ranks[valid] = np.unique(values[valid], return_inverse=True)[1]
+    return ranks
+
+
+def _rank_corr(selected_cols, corr_method, n_jobs=1, ranks=None):
+    """
+    Compute the pairwise Kendall tau-b or Spearman correlation matrix of the
+    columns, optionally in a process pool.
+
+    Every column is ranked once and its ranks are reused for all the pairs
+    it appears in. Missing values are excluded pairwise, as in pandas. With
+    several jobs, the upper triangle of feature pairs is split into tiles
+    and the workers read the ranks from shared memory instead of receiving
+    a pickled copy.
+
+    Parameters
+    ----------
+    selected_cols : pandas.core.frame.DataFrame
+      The numeric columns to correlate.
+    corr_method : str
+      "kendall" or "spearman".
+    n_jobs : int, optional
+      Number of worker processes, -1 for all CPU cores.
+    ranks : list, optional
+      The dense ranks of every column, computed when not given.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      The symmetric correlation matrix.
+    """
+    n_features = selected_cols.shape[1]
+    if ranks is None:
+        ranks = _column_ranks(selected_cols)
+    ranks = np.array(ranks, dtype=np.int64).reshape(
+        n_features, selected_cols.shape[0]
+    )
+
+    # As in pandas, a feature is perfectly correlated with itself unless it
+    # has no observations or, for spearman, no variation
+    corr = np.full((n_features, n_features), np.nan)
+    min_distinct = 1 if corr_method == "kendall" else 2
+    for i in range(n_features):
+        if ranks[i].max(initial=-1) + 1 >= min_distinct:
+            corr[i, i] = 1.0
+
+    n_jobs = os.cpu_count() if n_jobs < 0 else n_jobs
+    tiles = _pair_tiles(n_features, n_jobs)
+    if n_jobs == 1 or len(tiles) == 1:
+        results = [
+            _rank_corr_tile(ranks, corr_method, rows, cols)
+            for rows, cols in tiles
+        ]
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=ranks.nbytes)
+        try:
+            np.ndarray(ranks.shape, ranks.dtype, buffer=shm.buf)[:] = ranks
+            with ProcessPoolExecutor(
+                max_workers=min(n_jobs, len(tiles)),
+                initializer=_attach_shared_ranks,
+                initargs=(shm.name, ranks.shape),
+            ) as pool:
+                results = list(
+                    pool.map(
+                        _shared_rank_corr_tile,
+                        [corr_method] * len(tiles),
+                        *zip(*tiles),
+                    )
+                )
+        finally:
+            shm.close()
+            shm.unlink()
+
+    for tile in results:
+        for i, j, value in tile:
+            corr[i, j] = corr[j, i] = value
+    return pd.DataFrame(
+        corr, index=selected_cols.columns, columns=selected_cols.columns
+    )
+
+
+def _pair_tiles(n_features, n_jobs):
+    """
+    Split the upper triangle of feature pairs into rectangular tiles.
+
+    Parameters
+    ----------
+    n_features : int
+      Number of features.
+    n_jobs : int
+      Number of workers; about four tiles are made per worker.
+
+    Returns
+    -------
+    list
+      ``(rows, cols)`` ranges of feature indices covering every pair i < j.
+    """
+    if n_jobs == 1:
+        return [(range(n_features), range(n_features))]
+    n_blocks = max(1, min(n_features, int(np.ceil(np.sqrt(8 * n_jobs)))))
+    edges = np.linspace(0, n_features, n_blocks + 1).astype(int)
+    blocks = [range(a, b) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+    return [
+        (rows, cols)
+        for k, rows in enumerate(blocks)
+        for cols in blocks[k:]
+        if cols[-1] > rows[0]
+    ]
+
+
+def _rank_corr_tile(ranks, corr_method, rows, cols):
+    """
+    Compute the correlations of the pairs i < j of one tile.
+
+    Parameters
+    ----------
+    ranks : numpy.ndarray
+      (features, rows) dense ranks, -1 marking missing values.
+    corr_method : str
+      "kendall" or "spearman".
+    rows, cols : range
+      Feature indices of the tile.
+
+    Returns
+    -------
+    list
+      ``(i, j, correlation)`` tuples.
+    """
+    results = []
+    for i in rows:
+        if corr_method == "kendall":
+            # Presorting by the first column leaves only its ties to be
+            # sorted for every pair
+            order = np.argsort(ranks[i], kind="stable")
+            rank_x = ranks[i][order]
+        for j in cols:
+            if j <= i:
+                continue
+            if corr_method == "kendall":
+                value = _kendall_tau_b(rank_x, ranks[j][order])
+            else:
+                value = _spearman_rho(ranks[i], ranks[j])
+            results.append((i, j, value))
+    return results
+
+
+_shared_ranks = None
+
+
+def _attach_shared_ranks(name, shape):
+    """
+    Process pool initializer mapping the shared rank matrix.
+    """
+    global _shared_ranks
+    shm = shared_memory.SharedMemory(name=name)
+    _shared_ranks = (
+        shm,
+        np.ndarray(shape, dtype=np.int64, buffer=shm.buf),
+    )
+
+
+def _shared_rank_corr_tile(corr_method, rows, cols):
+    """
+    Compute one tile in a worker process from the shared rank matrix.
+    """
+    return _rank_corr_tile(_shared_ranks[1], corr_method, rows, cols)
+
+
+def _spearman_rho(rank_x, rank_y):
+    """
+    Spearman correlation of two dense rank arrays.
+
+    The dense ranks of the pairwise complete observations are turned into
+    average ranks, which are then correlated with the Pearson formula.
+
+    Parameters
+    ----------
+    rank_x, rank_y : numpy.ndarray
+      Dense ranks of both columns, -1 marking missing values.
+
+    Returns
+    -------
+    float
+      The Spearman coefficient, NaN if it is undefined.
+    """
+    valid = (rank_x >= 0) & (rank_y >= 0)
+    if not valid.all():
+        rank_x, rank_y = rank_x[valid], rank_y[valid]
+    if len(rank_x) < 2:
+        return np.nan
+
+    average_x = _average_ranks(rank_x)
+    average_y = _average_ranks(rank_y)
+    average_x -= average_x.mean()
+    average_y -= average_y.mean()
+    divisor = np.sqrt((average_x ** 2).sum() * (average_y ** 2).sum())
+    if divisor == 0:
+        return np.nan
+    return (average_x * average_y).sum() / divisor
+
+
+def _average_ranks(dense_ranks):
+    """
+    Convert dense ranks to 1-based average ranks, ties sharing the mean of
+    the positions they occupy.
+    """
+    counts = np.bincount(dense_ranks)
+    return (np.cumsum(counts) - (counts - 1) / 2.0)[dense_ranks]
+
+
+def _kendall_tau_b(rank_x, rank_y):
+    """
+    Kendall tau-b of two dense rank arrays with Knight's algorithm.
+
+    The pairs are sorted by (x, y) and the discordant pairs are counted as
+    the inversions of the resulting y sequence, in O(n log n).
+
+    Parameters
+    ----------
+    rank_x, rank_y : numpy.ndarray
+      Dense ranks of both columns, -1 marking missing values.
+
+    Returns
+    -------
+    float
+      The tau-b coefficient, NaN if it is undefined.
+    """
+    valid = (rank_x >= 0) & (rank_y >= 0)
+    if not valid.all():
+        rank_x, rank_y = rank_x[valid], rank_y[valid]
+    n = len(rank_x)
+    if n < 2:
+        return np.nan
+
+    n_y = int(rank_y.max()) + 1
+    keys = np.sort(rank_x * n_y + rank_y, kind="stable")
+    n_pairs = n * (n - 1) // 2
+    x_ties = _tied_pairs(np.bincount(rank_x))
+    y_ties = _tied_pairs(np.bincount(rank_y))
+    run_starts = np.flatnonzero(np.diff(keys)) + 1
+    xy_ties = _tied_pairs(np.diff(np.concatenate(([0], run_starts, [n]))))
+    discordant = _count_inversions(keys % n_y)
+
+    denominator = (n_pairs - x_ties) * (n_pairs - y_ties)
+    if denominator == 0:
+        return np.nan
+    return (n_pairs - x_ties - y_ties + xy_ties - 2 * discordant) / np.sqrt(
+        float(denominator)
+    )
+
+
+def _tied_pairs(counts):
+    """
+    Count the pairs of observations sharing a value.
+
+    Parameters
+    ----------
+    counts : numpy.ndarray
+      Number of observations for every distinct value.
+
+    Returns
+    -------
+    int
+      The number of tied pairs.
+    """
+    counts = counts.astype(np.int64)
+    return int((counts * (counts - 1) // 2).sum())
+
+
+def _count_inversions(values):
+    """
+    Count the pairs i < j with values[i] > values[j] with a bottom-up merge
+    sort whose levels are vectorized with NumPy.
+
+    At every level, adjacent sorted blocks are tagged with their pair index
+    and merged by one stable sort. An element of a right block moves left by
+    exactly the number of greater elements in the left block of its pair.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+      Non-negative int64 values.
+
+    Returns
+    -------
+    int
+      The number of inversions.
+    """
+    n = len(values)
+    span = int(values.max()) + 1 if n else 1
+    positions = np.arange(n)
+    merged = np.empty(n, dtype=np.intp)
+    inversions = 0
+    width = 1
+    while width < n:
+        block = positions // width
+        pair = block // 2
+        keys = pair * span + values
+        order = np.argsort(keys, kind="stable")
+        merged[order] = positions
+        right = (block % 2).astype(bool)
+        inversions += int((positions[right] - merged[right]).sum())
+        values = keys[order] - pair * span
+        width *= 2
+    return inversions
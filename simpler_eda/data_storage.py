@@ -0,0 +1,118 @@
+import os
+
+import altair as alt
+import pandas as pd
+
+from simpler_eda.cache import _data_hash
+from simpler_eda.instrumentation import _stage_timer
+
+# Vega-Lite can only load these formats from a url
+STORAGE_FORMATS = ["json", "csv"]
+
+_previous_transformer = None
+
+
+def enable_data_storage(fmt="json", directory="simpler_eda_data",
+                        urlpath=None):
+    """
+    Store chart data in sidecar files instead of embedding it in the
+    Vega-Lite specification.
+
+    While enabled, the dataset of every chart, including the charts returned
+    by categorical_eda, numerical_eda and corr_map, is written once to a file
+    named after a hash of its content, and the specification refers to it
+    through the data url field. Charts with identical data reuse the same
+    file, so re-rendering a chart does not serialize its data again.
+
+    Parameters
+    ----------
+    fmt : str, optional
+      Format of the sidecar files, "json" or "csv".
+    directory : str, optional
+      Directory the sidecar files are written to. It is created if needed.
+    urlpath : str, optional
+      Prefix of the url written in the specification, when the renderer
+      serves the directory from another location. Defaults to directory.
+
+    Examples
+    --------
+    >>> from simpler_eda.data_storage import enable_data_storage
+    >>> enable_data_storage("csv", directory="charts/data")
+    """
+    global _previous_transformer
+    assert (
+        fmt in STORAGE_FORMATS
+    ), "The storage format should be 'json' or 'csv'"
+    assert isinstance(directory, str), "The directory should be a string"
+    assert urlpath is None or isinstance(
+        urlpath, str
+    ), "The urlpath should be a string"
+
+    if alt.data_transformers.active != "simpler_eda":
+        _previous_transformer = alt.data_transformers.active
+    alt.data_transformers.enable(
+        "simpler_eda",
+        fmt=fmt,
+        directory=directory,
+        urlpath=directory if urlpath is None else urlpath,
+    )
+
+
+def disable_data_storage():
+    """
+    Embed chart data in the Vega-Lite specification again, restoring the
+    data transformer that was active before enable_data_storage.
+    """
+    global _previous_transformer
+    if alt.data_transformers.active == "simpler_eda":
+        alt.data_transformers.enable(_previous_transformer or "default")
+    _previous_transformer = None
+
+
+def _store_data(data, fmt="json", directory="simpler_eda_data",
+                urlpath="simpler_eda_data"):
+    """
+    Altair data transformer writing a dataframe to a content-addressed
+    sidecar file.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame or dict
+      The chart data. Anything but a dataframe is embedded as usual.
+    fmt : str
+      "json" or "csv".
+    directory : str
+      Directory the file is written to.
+    urlpath : str
+      Prefix of the returned url.
+
+    Returns
+    -------
+    dict
+      The url based data model.
+    """
+    if not isinstance(data, pd.DataFrame) or hasattr(
+        data, "__geo_interface__"
+    ):
+        return alt.utils.data.to_values(data)
+
+    timer = _stage_timer("data_storage")
+    filename = f"{_data_hash(data)}.{fmt}"
+    path = os.path.join(directory, filename)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        sanitized = alt.utils.sanitize_dataframe(data)
+        # Writing to a temporary file first so that concurrent renders never
+        # read a partially written sidecar
+        partial = f"{path}.{os.getpid()}.tmp"
+        if fmt == "json":
+            sanitized.to_json(partial, orient="records")
+        else:
+            sanitized.to_csv(partial, index=False)
+        os.replace(partial, path)
+        timer.mark("write", data)
+    url = f"{urlpath.rstrip('/')}/{filename}" if urlpath else filename
+    return {"url": url, "format": {"type": fmt}}
+
+
+alt.data_transformers.register("simpler_eda", _store_data)
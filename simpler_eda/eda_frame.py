@@ -0,0 +1,187 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from simpler_eda.cache import _data_hash
+
+
+class EDAFrame:
+    """
+    A dataframe profiled once and shared by many categorical_eda,
+    numerical_eda and corr_map calls.
+
+    The plotting functions accept an EDAFrame wherever they accept the
+    dataframe it wraps. The column statistics they need, such as the null
+    counts, min/max domains, cardinalities, factorized category codes,
+    dense ranks and the fingerprints used by the cache, are computed the
+    first time a call needs them and then kept. A session of plots over
+    the same frame therefore scans each column once per statistic instead
+    of once per call. The wrapped dataframe should not be modified
+    afterwards.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+      The dataframe to profile.
+
+    Examples
+    --------
+    >>> from simpler_eda.eda_frame import EDAFrame
+    >>> from simpler_eda.correlation import corr_map
+    >>> from vega_datasets import data
+    >>> cars = EDAFrame(data.cars())
+    >>> cars.profile()
+    >>> corr_map(cars, ["Horsepower", "Displacement"], corr_method="spearman")
+    """
+
+    def __init__(self, data):
+        assert isinstance(
+            data, pd.DataFrame
+        ), "The input data is not a panda dataframe"
+        self.data = data
+        self.dtypes = data.dtypes
+        self._stats = {}
+
+    @property
+    def columns(self):
+        """
+        The columns of the wrapped dataframe.
+        """
+        return self.data.columns
+
+    def profile(self):
+        """
+        Summarize every column of the wrapped dataframe.
+
+        Returns
+        -------
+        pandas.core.frame.DataFrame
+          One row per column with its "dtype", "null_count", the "min" and
+          "max" of the numeric columns, NaN for the others, and the
+          "cardinality", the number of distinct non-missing values.
+        """
+        rows = []
+        for column in self.columns:
+            if self._is_numeric(column):
+                low, high = self._domain(column)
+            else:
+                low = high = np.nan
+            rows.append(
+                {
+                    "dtype": str(self.dtypes[column]),
+                    "null_count": self._null_count(column),
+                    "min": low,
+                    "max": high,
+                    "cardinality": self._cardinality(column),
+                }
+            )
+        return pd.DataFrame(rows, index=self.columns)
+
+    def _cached(self, key, compute):
+        """
+        Return the statistic stored under key, computing it on first use.
+        """
+        if key not in self._stats:
+            self._stats[key] = compute()
+        return self._stats[key]
+
+    def _is_numeric(self, column):
+        """
+        Whether a column is numeric.
+        """
+        return is_numeric_dtype(self.dtypes[column])
+
+    def _null_count(self, column):
+        """
+        The number of missing values of a column.
+        """
+        return self._cached(
+            ("null_count", column),
+            lambda: int(self.data[column].isna().sum()),
+        )
+
+    def _domain(self, column, log=False):
+        """
+        The finite (min, max) of a numeric column, of its natural logarithm
+        when log is True, as computed by numerical_eda.
+        """
+
+        def compute():
+            values = self.data[column]
+            if log:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    values = np.log(values)
+            return _finite_domain(values)
+
+        return self._cached(("domain", column, log), compute)
+
+    def _codes(self, column):
+        """
+        The pd.factorize codes of a column, -1 for missing values, and its
+        distinct values in order of first appearance.
+        """
+        return self._cached(
+            ("codes", column), lambda: pd.factorize(self.data[column])
+        )
+
+    def _cardinality(self, column):
+        """
+        The number of distinct non-missing values of a column.
+        """
+        return len(self._codes(column)[1])
+
+    def _ranks(self, column):
+        """
+        The dense ranks of a numeric column used by the rank correlations
+        of corr_map, -1 for missing values.
+        """
+        from simpler_eda.correlation import _dense_ranks
+
+        return self._cached(
+            ("ranks", column),
+            lambda: _dense_ranks(
+                self.data[column].to_numpy(dtype=float, na_value=np.nan)
+            ),
+        )
+
+    def _fingerprint(self, columns):
+        """
+        The content fingerprint of some columns used as a cache key, each
+        column being hashed once.
+        """
+        digest = hashlib.sha256()
+        for column in columns:
+            digest.update(
+                self._cached(
+                    ("hash", column),
+                    lambda: _data_hash(self.data[[column]]),
+                ).encode()
+            )
+        return digest.hexdigest()
+
+
+def _unwrap(data):
+    """
+    Split the input of a plotting function into its data and its profile.
+
+    Returns
+    -------
+    tuple
+      The dataframe wrapped by an EDAFrame and the EDAFrame, or the input
+      and None.
+    """
+    if isinstance(data, EDAFrame):
+        return data.data, data
+    return data, None
+
+
+def _finite_domain(values):
+    """
+    The (min, max) of the finite values of a numeric series, NaN when
+    there are none, leaving out the -inf of the logarithm of zero as the
+    dataframe backends do.
+    """
+    values = values[~values.isin([np.inf, -np.inf])]
+    return float(values.min()), float(values.max())
@@ -0,0 +1,232 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+# Image formats written by export_charts, by file extension
+_FORMATS = {".png": "png", ".svg": "svg", ".pdf": "pdf"}
+
+# Process pool kept warm between export_charts calls, and its size
+_pool = None
+_pool_workers = None
+
+
+def export_charts(charts, paths, scale=1.0, n_jobs=-1, max_pending=None):
+    """
+    Render many charts to PNG, SVG or PDF files in parallel.
+
+    The charts are serialized and rendered offline with vl-convert in a
+    pool of worker processes, so the export time scales with the number of
+    cores. The workers start the renderer once and stay warm for the next
+    calls until shutdown_export_workers is called. A chart failing to
+    render does not stop the others: its error is reported in its record.
+
+    Parameters
+    ----------
+    charts : list
+      The charts to render, for instance returned by categorical_eda,
+      numerical_eda or corr_map.
+    paths : list
+      The file path of every chart, whose ".png", ".svg" or ".pdf"
+      extension gives the image format.
+    scale : int or float, optional
+      Scale factor of the PNG and PDF images.
+    n_jobs : int, optional
+      Number of worker processes, -1 to use all the cores. With 1, the
+      charts are rendered in the current process.
+    max_pending : int, optional
+      Maximum number of charts sent to the workers and not rendered yet,
+      bounding the memory held by the queue. Defaults to twice the number
+      of workers.
+
+    Returns
+    -------
+    list
+      One dict per chart, in the order of the charts, holding its "path",
+      the "seconds" spent serializing and rendering it, and the "error"
+      message, None when the image was written.
+
+    Examples
+    --------
+    >>> from simpler_eda.export import export_charts
+    >>> from simpler_eda.correlation import corr_map
+    >>> from vega_datasets import data
+    >>> charts = [
+    ...     corr_map(data.cars(), ["Horsepower", "Displacement"]),
+    ...     corr_map(data.cars(), ["Horsepower", "Acceleration"]),
+    ... ]
+    >>> export_charts(charts, ["displacement.png", "acceleration.svg"])
+    """
+    assert isinstance(charts, list), "The charts should be given as a list"
+    assert isinstance(paths, list), "The paths should be given as a list"
+    assert len(charts) == len(
+        paths
+    ), "There should be one path for every chart"
+    assert all(
+        os.path.splitext(str(p))[1].lower() in _FORMATS for p in paths
+    ), "The paths should end with .png, .svg or .pdf"
+    assert (
+        isinstance(scale, (int, float)) and scale > 0
+    ), "The scale should be a positive number"
+    assert (
+        isinstance(n_jobs, int) and n_jobs != 0
+    ), "The n_jobs should be given as a non-zero integer"
+    assert max_pending is None or (
+        isinstance(max_pending, int) and max_pending > 0
+    ), "The max_pending should be given as a positive integer"
+
+    n_jobs = os.cpu_count() if n_jobs < 0 else n_jobs
+    n_jobs = min(n_jobs, len(charts))
+    if n_jobs <= 1:
+        return [
+            _render(chart, path, scale) for chart, path in zip(charts, paths)
+        ]
+
+    pool = _export_pool(n_jobs)
+    max_pending = 2 * n_jobs if max_pending is None else max_pending
+    records = [None] * len(charts)
+    pending = {}
+    queue = iter(enumerate(zip(charts, paths)))
+    while True:
+        # Submitting the charts as the workers free up, so that at most
+        # max_pending charts are pickled and waiting at any time
+        for index, (chart, path) in queue:
+            pending[pool.submit(_render, chart, path, scale)] = index
+            if len(pending) >= max_pending:
+                break
+        if not pending:
+            break
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            index = pending.pop(future)
+            try:
+                records[index] = future.result()
+            except Exception as e:
+                # The chart could not be sent to a worker, or the worker died
+                records[index] = {
+                    "path": str(paths[index]),
+                    "seconds": None,
+                    "error": _error_message(e),
+                }
+    if any(r["seconds"] is None for r in records):
+        # A broken pool cannot take new tasks, so it is not kept warm
+        shutdown_export_workers()
+    return records
+
+
+def shutdown_export_workers():
+    """
+    Stop the worker processes kept warm by export_charts.
+    """
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = _pool_workers = None
+
+
+def _export_pool(n_jobs):
+    """
+    The warm process pool of export_charts, restarted when the number of
+    workers changes.
+    """
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != n_jobs:
+        shutdown_export_workers()
+        # Forking a process that already started the renderer's threads
+        # deadlocks the workers, so they are spawned
+        _pool = ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_start_renderer,
+        )
+        _pool_workers = n_jobs
+    return _pool
+
+
+def _start_renderer():
+    """
+    Process pool initializer starting the vl-convert renderer, so that the
+    first chart of every worker does not pay for it.
+    """
+    try:
+        _convert({"mark": "point"}, "svg", 1.0)
+    except ImportError:
+        # Reported for every chart by _render
+        pass
+
+
+def _render(chart, path, scale):
+    """
+    Serialize a chart and write its image, catching any error.
+
+    Returns
+    -------
+    dict
+      The "path", "seconds" and "error" record of export_charts.
+    """
+    start = time.perf_counter()
+    error = None
+    try:
+        fmt = _FORMATS[os.path.splitext(str(path))[1].lower()]
+        image = _convert(chart.to_dict(), fmt, scale)
+        mode = "w" if fmt == "svg" else "wb"
+        with open(path, mode) as f:
+            f.write(image)
+    except Exception as e:
+        error = _error_message(e)
+    return {
+        "path": str(path),
+        "seconds": time.perf_counter() - start,
+        "error": error,
+    }
+
+
+def _convert(spec, fmt, scale):
+    """
+    Render a Vega-Lite specification with vl-convert.
+
+    Parameters
+    ----------
+    spec : dict
+      The Vega-Lite specification.
+    fmt : str
+      "png", "svg" or "pdf".
+    scale : float
+      Scale factor of the PNG and PDF images.
+
+    Returns
+    -------
+    str or bytes
+      The SVG text or the PNG and PDF data.
+    """
+    try:
+        import vl_convert as vlc
+    except ImportError:
+        raise ImportError(
+            "Exporting the charts requires vl-convert-python"
+        ) from None
+    vl_version = _vl_version(spec, vlc.get_vegalite_versions())
+    if fmt == "svg":
+        return vlc.vegalite_to_svg(spec, vl_version=vl_version)
+    if fmt == "png":
+        return vlc.vegalite_to_png(spec, vl_version=vl_version, scale=scale)
+    return vlc.vegalite_to_pdf(spec, vl_version=vl_version, scale=scale)
+
+
+def _vl_version(spec, versions):
+    """
+    The Vega-Lite version of vl-convert closest to the schema of the
+    specification: the oldest one of the same major version, or the oldest
+    one available for the specifications of Altair 4.
+    """
+    schema = spec.get("$schema", "")
+    major = schema.rsplit("/", 1)[-1].lstrip("v").split(".")[0]
+    same_major = [v for v in versions if v.split(".")[0] == major]
+    return (same_major or versions)[0]
+
+
+def _error_message(error):
+    """
+    The error reported for a chart.
+    """
+    return f"{type(error).__name__}: {error}"
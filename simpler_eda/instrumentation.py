@@ -0,0 +1,191 @@
+import threading
+import time
+from concurrent.futures import CancelledError
+from contextlib import contextmanager
+
+import pandas as pd
+
+from simpler_eda.backends import _native_backend
+
+_callbacks = []
+# The cancellation event of the async_eda call running in each thread
+_cancel_token = threading.local()
+
+
+def add_stage_callback(callback):
+    """
+    Report the stage timings of categorical_eda, numerical_eda and corr_map
+    to a callback.
+
+    Every function call is split into named stages, such as "validation",
+    "log transform", "domain", "binning", "density", "correlation" and
+    "chart". At the end of each stage the callback is called with a dict
+    holding the "function" name, the "stage" name, its duration in
+    "seconds" and, where relevant, the number of "rows" and "bytes" of the
+    data the stage produced, or None. The sidecar files written while
+    enable_data_storage is active are reported as the "write" stage of
+    "data_storage". While no callback is registered the stages are not
+    timed.
+
+    Parameters
+    ----------
+    callback : callable
+      Called with the record of every finished stage.
+
+    Examples
+    --------
+    >>> from simpler_eda.instrumentation import add_stage_callback
+    >>> add_stage_callback(lambda record: print(record))
+    """
+    assert callable(callback), "The callback should be callable"
+    _callbacks.append(callback)
+
+
+def remove_stage_callback(callback):
+    """
+    Stop reporting the stage timings to a callback registered with
+    add_stage_callback.
+
+    Parameters
+    ----------
+    callback : callable
+      The registered callback.
+    """
+    assert callback in _callbacks, "The callback is not registered"
+    _callbacks.remove(callback)
+
+
+@contextmanager
+def record_stages():
+    """
+    Collect the stage timings of the calls made inside a with block.
+
+    Yields
+    ------
+    list
+      The stage records, as passed to the callbacks of add_stage_callback,
+      in the order the stages finished.
+
+    Examples
+    --------
+    >>> from simpler_eda.instrumentation import record_stages
+    >>> from simpler_eda.correlation import corr_map
+    >>> from vega_datasets import data
+    >>> with record_stages() as records:
+    ...     corr_map(data.cars(), ["Horsepower", "Displacement"])
+    >>> [r["stage"] for r in records]
+    ['validation', 'correlation', 'chart']
+    """
+    records = []
+    add_stage_callback(records.append)
+    try:
+        yield records
+    finally:
+        remove_stage_callback(records.append)
+
+
+class _StageTimer:
+    """
+    Times the consecutive stages of one function call: each stage lasts from
+    the previous mark, or the creation of the timer, to its own mark.
+    """
+
+    def __init__(self, function):
+        self.function = function
+        self.last = time.perf_counter()
+
+    def mark(self, stage, data=None):
+        """
+        End a stage and report it to the callbacks.
+
+        Parameters
+        ----------
+        stage : str
+          Name of the stage.
+        data : pandas.core.frame.DataFrame, optional
+          The data produced by the stage, whose rows and bytes are reported.
+          pyarrow and polars DataFrames are measured as well.
+        """
+        _check_cancelled()
+        seconds = time.perf_counter() - self.last
+        rows = nbytes = None
+        backend = _native_backend(data)
+        if isinstance(data, pd.DataFrame):
+            rows = len(data)
+            nbytes = int(data.memory_usage(deep=False).sum())
+        elif backend == "arrow":
+            rows, nbytes = data.num_rows, data.nbytes
+        elif backend == "polars" and hasattr(data, "estimated_size"):
+            # A LazyFrame, as a Dask DataFrame, has no size until collected
+            rows, nbytes = data.height, data.estimated_size()
+        record = {
+            "function": self.function,
+            "stage": stage,
+            "seconds": seconds,
+            "rows": rows,
+            "bytes": nbytes,
+        }
+        for callback in list(_callbacks):
+            callback(record)
+        # Restarting the clock after the callbacks, so that their own cost is
+        # not attributed to the next stage
+        self.last = time.perf_counter()
+
+
+class _NullTimer:
+    """
+    Stand-in for _StageTimer while no callback is registered, which only
+    stops a cancelled call.
+    """
+
+    def mark(self, stage, data=None):
+        _check_cancelled()
+
+
+_null_timer = _NullTimer()
+
+
+def _stage_timer(function):
+    """
+    Start timing the stages of a function call.
+
+    Parameters
+    ----------
+    function : str
+      Name of the instrumented function.
+
+    Returns
+    -------
+    _StageTimer or _NullTimer
+      A timer doing nothing while no callback is registered.
+    """
+    if not _callbacks:
+        return _null_timer
+    return _StageTimer(function)
+
+
+@contextmanager
+def _cancellable(cancel):
+    """
+    Raise CancelledError at the end of the stages of the calls made by the
+    current thread inside a with block, once the cancel event is set.
+
+    Parameters
+    ----------
+    cancel : threading.Event
+      Set to cancel the calls.
+    """
+    _cancel_token.event = cancel
+    try:
+        yield
+    finally:
+        _cancel_token.event = None
+
+
+def _check_cancelled():
+    """
+    Raise CancelledError if the call running in this thread was cancelled.
+    """
+    cancel = getattr(_cancel_token, "event", None)
+    if cancel is not None and cancel.is_set():
+        raise CancelledError()
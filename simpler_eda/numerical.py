@@ -0,0 +1,926 @@
+import altair as alt
+import numpy as np
+import pandas as pd
+import json
+import warnings
+from pandas.api.types import is_numeric_dtype
+
+from simpler_eda.backends import (
+    _columns,
+    _is_frame,
+    _is_numeric,
+    _native_backend,
+    _native_binned_counts,
+    _to_pandas,
+)
+from simpler_eda.cache import _memoize
+from simpler_eda.compaction import _compact
+from simpler_eda.eda_frame import _finite_domain, _unwrap
+from simpler_eda.instrumentation import _null_timer, _stage_timer
+
+
+def numerical_eda(
+    data,
+    xval,
+    yval,
+    color,
+    plot_type="scatter",
+    title=None,
+    font_size=10,
+    color_scheme="tableau20",
+    plot_width=400,
+    plot_height=300,
+    x_transform=False,
+    y_transform=False,
+    bins=20,
+    max_points=None,
+):
+    """
+    This function takes in a data frame object, two numeric columns,
+    and produces a scatter, line or binned plot to visualize the relationship
+    between the two numerical features. Users can optionally change default
+    arguments for plot-type, color, title, size of text, color-scheme, and
+    toggle log transformation for the x and y axis.
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+       Input dataframe object. A pyarrow.Table or a polars DataFrame or
+       LazyFrame is also accepted: the binned plot is counted with its own
+       compute kernels, and the other plots only convert the plotted
+       columns to pandas. The binned plot of a Dask DataFrame is counted
+       partition by partition and the counts summed in a tree reduction.
+    xval : str
+      Variable used to represent the x-axis.
+    yval : str
+      Variable used to represent the y-axis.
+    color : str
+      Variable used to group the data ponts in different colors based on a
+      variable in the dataframe.
+    plot_type : str, optional
+      Variable used to represent the graphical relationship between xval and
+      yval, options are scatter, line or binned plot. The binned plot counts
+      the points of every color group in a bins x bins grid and draws one
+      rectangle per non-empty cell, so its size does not grow with the
+      number of rows.
+    tilte : str, optional
+      Variable used to set the title of the plot.
+    font_size  : int, optional
+      Variable used to set the size of the axis labels and title.
+    color_scheme: str, optional
+      The color scheme used for the plot.
+      Other color schemes can be "accent", "category10", "category20",
+      "category20b", "dark2", etc.
+      Other proper color scheme reference can be found in
+      https://vega.github.io/vega/docs/schemes/
+    plot_width: int, optional
+      The width of the plot.
+    plot_height: int, optional
+      The height of the plot.
+    x_transform : bool, optional
+      Determines whether a log transformation occurs on the x-axis.
+    y_transform : bool, optional
+      Determines whether a log transformation occurs on the y-axis.
+    bins : int, optional
+      Number of bins along each axis for the binned plot. The plot embeds
+      up to bins * bins cells per color group, so the default keeps a few
+      groups under the 5000 rows altair embeds by default.
+    max_points : int, optional
+      Maximum number of points drawn per color group in the line plot.
+      Longer series are downsampled with the Largest-Triangle-Three-Buckets
+      algorithm, which keeps the visual shape of the line.
+    Returns
+    -------
+    `altair`
+      Scatter plot or Line plot of user-specified variables.
+    Examples
+    --------
+    >>> import altair as alt
+    >>> import pandas as pd
+    >>> import numpy as np
+    >>> from simpler_eda.numerical import numerical_plot
+    >>> from vega_datasets import data
+    >>> numerical_plot(data.cars(), xval = "Horsepower", yval = "Acceleration",
+    plot_type = "line",
+                 color = "Origin",
+                 title = " Horsepower vs Acceleration",
+                 font_size = 10)
+    """
+    timer = _stage_timer("numerical_eda")
+    data, frame = _unwrap(data)
+
+    # Defensive programming: Check if user provides valid inputs
+
+    # If the title is not specified by the user, default title is provided
+    if title is None:
+        title = f"{xval} vs {yval} {plot_type} plot"
+
+    error_one = """TypeError: Data must be entered as a pandas
+        dataframe."""
+    assert _is_frame(data), error_one
+
+    error_two = """TypeError: X-axis variable must be entered
+        as a String."""
+    assert isinstance(xval, str), error_two
+
+    error_three = """TypeError: Y-axis variable must be entered as a
+        String."""
+    assert isinstance(yval, str), error_three
+
+    error_four = "TypeError: x_transform must be of type boolean."
+    assert isinstance(x_transform, bool), error_four
+
+    error_five = "TypeError: y_transform must be of type boolean."
+    assert isinstance(y_transform, bool), error_five
+
+    error_six = """InputValueError: plot_type must be either 'scatter',
+    'line' or 'binned'."""
+    assert plot_type in ["scatter", "line", "binned"], error_six
+
+    error_seven = "TypeError: plot_width must be an integer."
+    assert isinstance(plot_width, int), error_seven
+
+    error_eight = "TypeError: plot_height must be an integer."
+    assert isinstance(plot_height, int), error_eight
+
+    error_nine = "TypeError: font_size must be a positive integer."
+    assert isinstance(font_size, int), error_nine
+
+    error_ten = "TypeError: color must be a string."
+    assert isinstance(color, str), error_ten
+
+    error_eleven = "TypeError: color_scheme must be a string."
+    assert isinstance(color_scheme, str), error_eleven
+
+    error_twelve = "TypeError: title must be a string."
+    assert isinstance(title, str), error_twelve
+
+    error_thirteen = "TypeError: bins must be a positive integer."
+    assert isinstance(bins, int) and bins > 0, error_thirteen
+
+    error_fourteen = "TypeError: max_points must be an integer of at least 3."
+    assert max_points is None or (
+        isinstance(max_points, int) and max_points >= 3
+    ), error_fourteen
+
+    # Ensure variable exists in the dataframe
+    columns = _columns(data)
+    assert xval in columns, "Variable xval not found in input dataframe."
+
+    assert yval in columns, "Variable yval not found in input dataframe."
+
+    assert color in columns, "Variable color not found in input dataframe."
+
+    # Ensure variable is numeric
+    error_msg_x = "Your x-variable needs to be numeric."
+    assert _is_numeric(data, xval), error_msg_x
+
+    error_msg_y = "Your y-variable needs to be numeric."
+    assert _is_numeric(data, yval), error_msg_y
+    timer.mark("validation", data)
+
+    # Renaming the plotted columns, replacing underscores with space
+    names = tuple(str(v).replace("_", " ") for v in (xval, yval, color))
+    native = _native_backend(data) is not None
+    if native and plot_type == "binned":
+        df, x_domain, y_domain = _native_binned_data(
+            data, (xval, yval, color), names, x_transform, y_transform, bins
+        )
+        timer.mark("binning", df)
+    else:
+        if native:
+            # Scatter and line plots draw every point, so only the plotted
+            # columns are converted
+            data = _to_pandas(data, [xval, yval, color])
+            timer.mark("conversion", data)
+        df, x_domain, y_domain = _memoize(
+            "numerical_eda",
+            data if frame is None else frame,
+            [xval, yval, color],
+            (plot_type, x_transform, y_transform, bins, max_points),
+            lambda: _plot_data(
+                data,
+                (xval, yval, color),
+                names,
+                plot_type,
+                x_transform,
+                y_transform,
+                bins,
+                max_points,
+                timer,
+                frame,
+            ),
+            timer,
+        )
+    xval, yval, color = names
+
+    # Update scale bounds of the plots
+    x_scale = alt.Scale(domain=x_domain)
+    y_scale = alt.Scale(domain=y_domain)
+
+    # Plotting code for the function, code for either plot_type in ['line',
+    # 'scatter', 'binned']
+    # Code for the scatter plot
+    if plot_type == "scatter":
+        numerical_eda = (
+            alt.Chart(df, title=alt.TitleParams(text=title))
+            .mark_circle(size=10, opacity=0.8)
+            .encode(
+                alt.X(xval, scale=x_scale),
+                alt.Y(yval, scale=y_scale),
+                alt.Color(color, scale=alt.Scale(scheme=color_scheme)),
+            )
+            .properties(width=plot_width, height=plot_height)
+        ).configure_axis(
+              titleFontSize=font_size, labelFontSize=font_size, labelAngle=0
+        )
+
+    # Code for the binned plot
+    elif plot_type == "binned":
+        numerical_eda = (
+            alt.Chart(df, title=alt.TitleParams(text=title))
+            .mark_rect()
+            .encode(
+                alt.X(xval, scale=x_scale, bin="binned"),
+                alt.X2(f"{xval} end"),
+                alt.Y(yval, scale=y_scale, bin="binned"),
+                alt.Y2(f"{yval} end"),
+                alt.Color(color, scale=alt.Scale(scheme=color_scheme)),
+                alt.Opacity(df.columns[-1], title="Count"),
+            )
+            .properties(width=plot_width, height=plot_height)
+            .configure_axis(
+                titleFontSize=font_size, labelFontSize=font_size, labelAngle=0
+            )
+        )
+
+    # Code for the line plot
+    else:
+        numerical_eda = (
+            alt.Chart(df, title=alt.TitleParams(text=title))
+            .mark_line(size=1, opacity=0.8)
+            .encode(
+                alt.X(xval, scale=x_scale),
+                alt.Y(yval, scale=y_scale),
+                alt.Color(color, scale=alt.Scale(scheme=color_scheme)),
+            )
+            .properties(width=plot_width, height=plot_height)
+            .configure_axis(
+                titleFontSize=font_size, labelFontSize=font_size, labelAngle=0
+            )
+        )
+    timer.mark("chart", df)
+    numerical_eda = _compact(numerical_eda, None, timer)
+    return numerical_eda
+
+
+def pair_plot(
+    data,
+    features,
+    color,
+    title=None,
+    font_size=10,
+    color_scheme="tableau20",
+    plot_width=120,
+    plot_height=120,
+    log_features=None,
+    bins=20,
+):
+    """
+    This function takes in a data frame object and a list of numeric
+    columns, and produces a scatter matrix of the binned plots of
+    numerical_eda for every pair of features. Every feature is binned once
+    and the cells of every pair are counted in one shared dataset, so the
+    chart size does not grow with the number of rows. Only one triangle of
+    the matrix is embedded, the chart drawing its mirror image, and the
+    dataset is embedded whatever its number of rows.
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+       Input dataframe object.
+    features : list
+      Numeric variables plotted against each other.
+    color : str
+      Variable used to group the data ponts in different colors based on a
+      variable in the dataframe.
+    title : str, optional
+      Variable used to set the title of the plot.
+    font_size  : int, optional
+      Variable used to set the size of the axis labels and title.
+    color_scheme: str, optional
+      The color scheme used for the plot, as in numerical_eda.
+    plot_width: int, optional
+      The width of every plot of the matrix.
+    plot_height: int, optional
+      The height of every plot of the matrix.
+    log_features : list, optional
+      Features on which a log transformation occurs.
+    bins : int, optional
+      Number of bins along each axis of every plot.
+    Returns
+    -------
+    `altair`
+      Faceted chart with one binned plot per pair of features.
+    Examples
+    --------
+    >>> from simpler_eda.numerical import pair_plot
+    >>> from vega_datasets import data
+    >>> pair_plot(data.cars(),
+                  features = ["Horsepower", "Acceleration", "Displacement"],
+                  color = "Origin",
+                  log_features = ["Displacement"])
+    """
+    timer = _stage_timer("pair_plot")
+    data, frame = _unwrap(data)
+
+    if title is None:
+        title = "Pair plot"
+    if log_features is None:
+        log_features = []
+
+    error_one = """TypeError: Data must be entered as a pandas
+        dataframe."""
+    assert isinstance(data, pd.DataFrame), error_one
+
+    error_two = "TypeError: features must be a list of at least 2 strings."
+    assert (
+        isinstance(features, list)
+        and len(features) >= 2
+        and all(isinstance(f, str) for f in features)
+    ), error_two
+
+    error_three = "TypeError: log_features must be a list of features."
+    assert isinstance(log_features, list) and all(
+        f in features for f in log_features
+    ), error_three
+
+    error_four = "TypeError: plot_width must be an integer."
+    assert isinstance(plot_width, int), error_four
+
+    error_five = "TypeError: plot_height must be an integer."
+    assert isinstance(plot_height, int), error_five
+
+    error_six = "TypeError: font_size must be a positive integer."
+    assert isinstance(font_size, int), error_six
+
+    error_seven = "TypeError: color must be a string."
+    assert isinstance(color, str), error_seven
+
+    error_eight = "TypeError: color_scheme must be a string."
+    assert isinstance(color_scheme, str), error_eight
+
+    error_nine = "TypeError: title must be a string."
+    assert isinstance(title, str), error_nine
+
+    error_ten = "TypeError: bins must be a positive integer."
+    assert isinstance(bins, int) and bins > 0, error_ten
+
+    # Ensure variables exist in the dataframe and are numeric
+    for feature in features:
+        assert (
+            feature in data.columns
+        ), f"Variable {feature} not found in input dataframe."
+        assert is_numeric_dtype(
+            data[feature]
+        ), f"Your variable {feature} needs to be numeric."
+
+    assert (
+        color in data.columns
+    ), "Variable color not found in input dataframe."
+    timer.mark("validation", data)
+
+    df, edges = _memoize(
+        "pair_plot",
+        data if frame is None else frame,
+        features + [color],
+        (tuple(features), tuple(log_features), bins),
+        lambda: _pair_table(data, features, color, log_features, bins, frame),
+        timer,
+    )
+    timer.mark("binning", df)
+    x_col, y_col, color_col, x_bin, y_bin, count_col = df.columns
+    # The names and bin edges of the features are looked up by the chart
+    # rather than repeated on every row
+    labels = [str(f).replace("_", " ") for f in features]
+    names = json.dumps(labels)
+    bounds = json.dumps([e.tolist() for e in edges])
+
+    # Fields computed by the chart, named apart from the data columns
+    computed = []
+    for name in ["mirror", "x variable", "y variable", "x0", "x1", "y0",
+                 "y1"]:
+        while name in df.columns:
+            name = f"{name}_"
+        computed.append(name)
+    mirror, x_var, y_var, x0, x1, y0, y1 = computed
+
+    # The chart embeds inline values, whose types altair cannot infer
+    color_type = alt.utils.infer_vegalite_type(df[color_col])
+    color_sort = alt.Undefined
+    if isinstance(color_type, tuple):
+        # The order of ordered categories
+        color_type, color_sort = color_type
+
+    def field(name):
+        return f"datum[{json.dumps(name)}]"
+
+    def swap(mirrored, kept):
+        return f"({field(mirror)} ? {field(mirrored)} : {field(kept)})"
+
+    column_feature, row_feature = swap(y_col, x_col), swap(x_col, y_col)
+    column_bin, row_bin = swap(y_bin, x_bin), swap(x_bin, y_bin)
+
+    pair_plot = (
+        alt.Chart()
+        .mark_rect()
+        .encode(
+            alt.X(f"{x0}:Q", bin="binned", title=None),
+            alt.X2(x1),
+            alt.Y(f"{y0}:Q", bin="binned", title=None),
+            alt.Y2(y1),
+            alt.Color(
+                color_col,
+                type=color_type,
+                sort=color_sort,
+                scale=alt.Scale(scheme=color_scheme),
+            ),
+            alt.Opacity(f"{count_col}:Q", title="Count"),
+        )
+        .properties(width=plot_width, height=plot_height)
+        .facet(
+            row=alt.Row(f"{y_var}:N", sort=labels, title=None),
+            column=alt.Column(f"{x_var}:N", sort=labels, title=None),
+            data=df,
+        )
+        # Every row is drawn once as binned and once mirrored, with x and
+        # y swapped, except on the diagonal
+        .transform_calculate(**{mirror: "[false, true]"})
+        .transform_flatten([mirror])
+        .transform_filter(
+            f"!{field(mirror)} || {field(x_col)} != {field(y_col)}"
+        )
+        .transform_calculate(
+            **{
+                x_var: f"{names}[{column_feature}]",
+                y_var: f"{names}[{row_feature}]",
+                x0: f"{bounds}[{column_feature}][{column_bin}]",
+                x1: f"{bounds}[{column_feature}][{column_bin} + 1]",
+                y0: f"{bounds}[{row_feature}][{row_bin}]",
+                y1: f"{bounds}[{row_feature}][{row_bin} + 1]",
+            }
+        )
+        .resolve_scale(x="independent", y="independent")
+        .properties(title=title)
+        .configure_axis(titleFontSize=font_size, labelFontSize=font_size)
+        .configure_header(labelFontSize=font_size)
+        .configure_title(fontSize=font_size)
+    )
+    timer.mark("chart", df)
+    pair_plot = _compact(pair_plot, None, timer)
+    return _inline_data(pair_plot)
+
+
+def _inline_data(chart):
+    """
+    Embed the aggregated data of a chart as inline values, which altair
+    does not limit to max_rows as it does dataframes.
+
+    The data is kept as a dataframe when another data transformer than
+    the default one, such as the sidecar files of enable_data_storage, is
+    active.
+    """
+    if alt.data_transformers.active != "default":
+        return chart
+    chart = chart.copy(deep=False)
+    # A dict rather than an alt.InlineData, which validates every row
+    chart.data = alt.utils.data.to_values(chart.data)
+    return chart
+
+
+def _pair_table(data, features, color, log_features, bins, frame=None):
+    """
+    Count the points of every color group in the 2D grid of every pair of
+    features. Every feature is transformed and binned once, then each pair
+    takes a single np.bincount. Only the pairs of a feature with itself or
+    a later feature are counted, the other half of the matrix being the
+    same cells with x and y swapped.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+      Input dataframe object.
+    features, color, log_features, bins
+      As in pair_plot.
+    frame : EDAFrame, optional
+      Profile of data whose color codes are reused.
+
+    Returns
+    -------
+    tuple
+      The table of the cells and the bin edges of every feature. The table
+      has one row per non-empty cell of every pair and color group with the
+      "x feature" and "y feature" positions in features, the group, the
+      "x bin" and "y bin" positions in their edges and the number of points
+      in the last column.
+    """
+    color_name = str(color).replace("_", " ")
+    columns = []
+    for name in ["x feature", "y feature", "x bin", "y bin", "count"]:
+        while name == color_name:
+            name = f"{name}_"
+        columns.append(name)
+    x_col, y_col, x_bin, y_bin, count_col = columns
+
+    codes, groups = _color_codes(data[color], frame)
+    edges, index = [], []
+    for feature in features:
+        values = data[feature]
+        if feature in log_features:
+            if (values < 0).any():
+                warnings.warn(f"Can't have negative {feature} values with "
+                              "np.log")
+            values = np.log(values)
+        finite = values[np.isfinite(values)]
+        domain = (
+            (float(finite.min()), float(finite.max()))
+            if len(finite) else (0.0, 1.0)
+        )
+        feature_edges, feature_index = _bin_index(values, domain, bins)
+        edges.append(feature_edges)
+        index.append(feature_index)
+
+    tables = []
+    for i in range(len(features)):
+        for j in range(i, len(features)):
+            group, ix, iy, counts = _count_cells(
+                codes, len(groups), index[i], index[j], bins
+            )
+            tables.append(
+                pd.DataFrame(
+                    {
+                        x_col: i,
+                        y_col: j,
+                        color_name: groups.take(group),
+                        x_bin: ix,
+                        y_bin: iy,
+                        count_col: counts,
+                    }
+                )
+            )
+    return pd.concat(tables, ignore_index=True), edges
+
+
+def _plot_data(data, columns, names, plot_type, x_transform, y_transform,
+               bins, max_points, timer=_null_timer, frame=None):
+    """
+    Compute the data plotted by numerical_eda.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame
+      Input dataframe object.
+    columns : tuple
+      The (xval, yval, color) columns of data.
+    names : tuple
+      The (xval, yval, color) column names of the returned dataframe.
+    plot_type, x_transform, y_transform, bins, max_points
+      As in numerical_eda.
+    timer : _StageTimer, optional
+      Timer of the numerical_eda call.
+    frame : EDAFrame, optional
+      Profile of data whose domains and color codes are reused.
+
+    Returns
+    -------
+    tuple
+      The plotted dataframe and the (min, max) domains of the x and y
+      scales.
+    """
+    xval, yval, color = columns
+
+    # Project only the plotted columns, so that the original dataframe
+    # remains unchanged without copying the columns that are not plotted
+    x_values = data[xval]
+    y_values = data[yval]
+
+    # Toggle a log transformation on the x-axis
+    warn_one = "Can't have negative x values with np.log"
+    if x_transform:
+        if _has_negatives(x_values, frame):
+            warnings.warn(warn_one)
+        x_values = np.log(x_values)
+
+    # Toggle a log transformation on the y-axis
+    warn_two = "Can't have negative y values with np.log"
+    if y_transform:
+        if _has_negatives(y_values, frame):
+            warnings.warn(warn_two)
+        y_values = np.log(y_values)
+    timer.mark("log transform")
+
+    # Scale bounds of the plots, kept by an EDAFrame
+    if frame is None:
+        x_domain = _finite_domain(x_values)
+        y_domain = _finite_domain(y_values)
+    else:
+        x_domain = frame._domain(xval, x_transform)
+        y_domain = frame._domain(yval, y_transform)
+    timer.mark("domain")
+
+    color_values = data[color]
+
+    # Downsample every color group of the line plot to max_points points
+    if plot_type == "line" and max_points is not None:
+        keep = _lttb_downsample(x_values, y_values, color_values, max_points)
+        x_values = x_values.iloc[keep]
+        y_values = y_values.iloc[keep]
+        color_values = color_values.iloc[keep]
+        timer.mark("downsample")
+
+    if plot_type == "binned":
+        df = _binned_table(
+            x_values,
+            y_values,
+            color_values,
+            names,
+            x_domain,
+            y_domain,
+            bins,
+            frame,
+        )
+        timer.mark("binning", df)
+    else:
+        x_name, y_name, color_name = names
+        df = pd.DataFrame(
+            {color_name: color_values, x_name: x_values, y_name: y_values}
+        )
+        timer.mark("frame", df)
+    return df, x_domain, y_domain
+
+
+def _binned_table(x_values, y_values, color_values, names, x_domain,
+                  y_domain, bins, frame=None):
+    """
+    Count the points of every color group in a regular 2D grid with a single
+    np.bincount over the combined group and cell index.
+
+    Parameters
+    ----------
+    x_values, y_values : pandas.core.series.Series
+      The (transformed) values of the x and y variables.
+    color_values : pandas.core.series.Series
+      The variable used to group the points.
+    names : tuple
+      Column names (xval, yval, color) used in the returned dataframe.
+    x_domain, y_domain : tuple
+      (min, max) range covered by the grid along each axis.
+    bins : int
+      Number of bins along each axis.
+    frame : EDAFrame, optional
+      Profile of the input dataframe whose color codes are reused.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      One row per non-empty cell of every color group with the group, the
+      bin bounds "<xval>", "<xval> end", "<yval>", "<yval> end" and the
+      number of points in the last column.
+    """
+    xval, yval, color = names
+    codes, labels = _color_codes(color_values, frame)
+    x_edges, ix = _bin_index(x_values, x_domain, bins)
+    y_edges, iy = _bin_index(y_values, y_domain, bins)
+    group, ix, iy, counts = _count_cells(codes, len(labels), ix, iy, bins)
+    return _binned_frame(
+        names, np.asarray(labels).take(group), x_edges, ix, y_edges, iy,
+        counts
+    )
+
+
+def _binned_frame(names, groups, x_edges, ix, y_edges, iy, counts):
+    """
+    Build the table of the binned plot from the counted cells.
+
+    Parameters
+    ----------
+    names : tuple
+      Column names (xval, yval, color) used in the returned dataframe.
+    groups : numpy.ndarray
+      The color group of every cell.
+    x_edges, y_edges : numpy.ndarray
+      The bin edges along each axis.
+    ix, iy : numpy.ndarray
+      The x and y bin of every cell.
+    counts : numpy.ndarray
+      The number of points in every cell.
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+      The group, the bin bounds "<xval>", "<xval> end", "<yval>",
+      "<yval> end" and the number of points in the last column.
+    """
+    xval, yval, color = names
+    count_col = "count"
+    while count_col in names:
+        count_col = f"{count_col}_"
+    return pd.DataFrame(
+        {
+            color: groups,
+            xval: x_edges[ix],
+            f"{xval} end": x_edges[ix + 1],
+            yval: y_edges[iy],
+            f"{yval} end": y_edges[iy + 1],
+            count_col: counts,
+        }
+    )
+
+
+def _native_binned_data(data, columns, names, x_transform, y_transform,
+                        bins):
+    """
+    Compute the binned plot of numerical_eda for a pyarrow or polars
+    dataframe with the kernels of its library, converting only the counted
+    cells.
+
+    Returns
+    -------
+    tuple
+      The plotted dataframe and the (min, max) domains of the x and y
+      scales.
+    """
+    cells = _native_binned_counts(
+        data, columns, (x_transform, y_transform), bins
+    )
+    negative_x, negative_y = cells["negatives"]
+    if negative_x:
+        warnings.warn("Can't have negative x values with np.log")
+    if negative_y:
+        warnings.warn("Can't have negative y values with np.log")
+    x_domain, y_domain = cells["domains"]
+    df = _binned_frame(
+        names,
+        cells["groups"],
+        np.linspace(*x_domain, bins + 1),
+        cells["ix"],
+        np.linspace(*y_domain, bins + 1),
+        cells["iy"],
+        cells["counts"],
+    )
+    return df, x_domain, y_domain
+
+
+def _color_codes(color_values, frame=None):
+    """
+    Factorize the color groups, missing colors forming a group of their
+    own as in the scatter plot. The codes of an EDAFrame are reused.
+
+    Returns
+    -------
+    tuple
+      The integer code of every row and the pandas.Index of the groups.
+    """
+    if frame is None:
+        codes, labels = pd.factorize(color_values)
+    else:
+        codes, labels = frame._codes(color_values.name)
+    labels = pd.Index(labels)
+    if (codes < 0).any():
+        codes = np.where(codes < 0, len(labels), codes)
+        labels = labels.insert(len(labels), np.nan)
+    return codes, labels
+
+
+def _has_negatives(values, frame=None):
+    """
+    Whether a column has negative values, from the domain kept by an
+    EDAFrame when given.
+    """
+    if frame is None:
+        return (values < 0).any()
+    return frame._domain(values.name)[0] < 0
+
+
+def _bin_index(values, domain, bins):
+    """
+    Assign the values to regular bins spanning domain.
+
+    Returns
+    -------
+    tuple
+      The bins + 1 bin edges and the bin of every value, -1 for the
+      missing and infinite values.
+    """
+    x = values.to_numpy(dtype=float, na_value=np.nan)
+    edges = np.linspace(*domain, bins + 1)
+    width = (domain[1] - domain[0]) or 1.0
+    with np.errstate(invalid="ignore"):
+        index = np.clip(
+            np.nan_to_num((x - domain[0]) / width * bins), 0, bins - 1
+        ).astype(np.intp)
+    return edges, np.where(np.isfinite(x), index, -1)
+
+
+def _count_cells(codes, n_groups, ix, iy, bins):
+    """
+    Count the points of every group in every cell of the 2D grid with a
+    single np.bincount, skipping the points outside the grid.
+
+    Returns
+    -------
+    tuple
+      The group, x bin, y bin and number of points of every non-empty
+      cell.
+    """
+    valid = (ix >= 0) & (iy >= 0)
+    counts = np.bincount(
+        (codes[valid] * bins + ix[valid]) * bins + iy[valid],
+        minlength=n_groups * bins * bins,
+    )
+    cells = np.flatnonzero(counts)
+    group, cell = np.divmod(cells, bins * bins)
+    ix, iy = np.divmod(cell, bins)
+    return group, ix, iy, counts[cells]
+
+
+def _lttb_downsample(x_values, y_values, color_values, max_points):
+    """
+    Select at most max_points points of every color group with the
+    Largest-Triangle-Three-Buckets algorithm.
+
+    The points are sorted by group and x once. Every group keeps its first
+    and last point and splits the others into max_points - 2 buckets. In each
+    bucket, the point forming the largest triangle with the previously kept
+    point and the average of the next bucket is kept.
+
+    Parameters
+    ----------
+    x_values, y_values : pandas.core.series.Series
+      The (transformed) values of the x and y variables.
+    color_values : pandas.core.series.Series
+      The variable used to group the points into separate lines.
+    max_points : int
+      Maximum number of points kept per group, at least 3.
+
+    Returns
+    -------
+    numpy.ndarray
+      Positions of the kept points, sorted by group and x.
+    """
+    x = x_values.to_numpy(dtype=float, na_value=np.nan)
+    y = y_values.to_numpy(dtype=float, na_value=np.nan)
+    codes = pd.factorize(color_values)[0]
+
+    positions = np.flatnonzero(~np.isnan(x) & ~np.isnan(y))
+    positions = positions[np.lexsort((x[positions], codes[positions]))]
+    bounds = np.flatnonzero(np.diff(codes[positions])) + 1
+    bounds = np.concatenate(([0], bounds, [len(positions)]))
+
+    keep = []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        group = positions[start:end]
+        if len(group) <= max_points:
+            keep.append(group)
+        else:
+            keep.append(group[_lttb(x[group], y[group], max_points)])
+    return np.concatenate(keep) if keep else positions
+
+
+def _lttb(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling of one series sorted by x.
+
+    Parameters
+    ----------
+    x, y : numpy.ndarray
+      Coordinates of the series, sorted by x.
+    n_out : int
+      Number of points to keep, at least 3 and less than len(x).
+
+    Returns
+    -------
+    numpy.ndarray
+      Indices of the kept points in increasing order.
+    """
+    n = len(x)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    x_sums = np.concatenate(([0.0], np.cumsum(x)))
+    y_sums = np.concatenate(([0.0], np.cumsum(y)))
+    sizes = np.diff(edges)
+    # The average point of every bucket, followed by the last point, is the
+    # third corner of the triangles of the previous bucket
+    x_next = np.append((x_sums[edges[1:]] - x_sums[edges[:-1]]) / sizes,
+                       x[-1])[1:]
+    y_next = np.append((y_sums[edges[1:]] - y_sums[edges[:-1]]) / sizes,
+                       y[-1])[1:]
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+    for b in range(n_out - 2):
+        start, end = edges[b], edges[b + 1]
+        a = selected[b]
+        area = np.abs(
+            (x[a] - x_next[b]) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (y_next[b] - y[a])
+        )
+        selected[b + 1] = start + np.argmax(area)
+    return selected
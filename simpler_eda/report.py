@@ -0,0 +1,446 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import altair as alt
+import numpy as np
+import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+)
+
+from simpler_eda.categorical import (
+    _iso_timestamps,
+    _other_label,
+    categorical_eda,
+)
+from simpler_eda.correlation import corr_map
+from simpler_eda.eda_frame import _unwrap
+from simpler_eda.export import _error_message
+
+# Numeric features above which the correlation map only keeps the strongest
+# pairs of every feature, so its size grows linearly with the features
+_CORR_DENSE_LIMIT = 50
+_CORR_TOP_K = 10
+
+
+def eda_report(
+    data,
+    path=None,
+    n_jobs=-1,
+    corr_method="pearson",
+    corr_top_k=None,
+    max_categories=50,
+):
+    """
+    Chart every column of a dataframe and the correlations of its numeric
+    columns in one call.
+
+    The numeric columns are plotted as an aggregated density and the other
+    columns as an aggregated histogram with categorical_eda, and a corr_map
+    is added over the numeric columns. The charts are made in a pool of
+    worker processes reading the columns from shared memory instead of
+    receiving a pickled copy: the numeric columns as one float64 matrix and
+    the other columns as their factorized codes. Every chart embeds
+    aggregated data only, so its size does not grow with the number of
+    rows, and a chart failing does not stop the others.
+
+    Parameters
+    ----------
+    data : pandas.core.frame.DataFrame or EDAFrame
+      The dataframe to report on. The factorized codes of an EDAFrame are
+      reused.
+    path : str, optional
+      File the report is written to: a self-contained ".html" page showing
+      the charts with vega-embed, or the ".json" bundle.
+    n_jobs : int, optional
+      Number of worker processes, -1 to use all the cores. With 1, the
+      charts are made in the current process.
+    corr_method : str, optional
+      "pearson", "kendall" or "spearman", as in corr_map.
+    corr_top_k : int, optional
+      Only plot the top_k strongest pairs of every feature in the
+      correlation map, as in corr_map. Defaults to 10 above 50 numeric
+      columns, and to the full matrix otherwise.
+    max_categories : int, optional
+      The histograms of columns with more distinct values, such as
+      identifiers, only show their max_categories most frequent values and
+      an "Other" bar, as with the max_categories of categorical_eda.
+
+    Returns
+    -------
+    dict
+      The bundle holding the number of "rows" and the "charts", one dict
+      per column in the order of the columns then one for the correlation
+      map, holding the "column" name (None for the correlation map), its
+      "kind", "numeric", "categorical" or "correlation", its Vega-Lite
+      "spec", and the "error" message, None when the chart was made.
+
+    Examples
+    --------
+    >>> from simpler_eda.report import eda_report
+    >>> from vega_datasets import data
+    >>> bundle = eda_report(data.cars(), "cars.html")
+    """
+    data, frame = _unwrap(data)
+    assert isinstance(
+        data, pd.DataFrame
+    ), "The input data is not a panda dataframe"
+    assert (
+        isinstance(path, str)
+        and os.path.splitext(path)[1].lower() in [".html", ".json"]
+    ) or path is None, "The path should end with .html or .json"
+    assert (
+        isinstance(n_jobs, int) and n_jobs != 0
+    ), "The n_jobs should be given as a non-zero integer"
+    assert corr_method in [
+        "pearson",
+        "kendall",
+        "spearman",
+    ], "The corr_method should be 'pearson', 'kendall' or 'spearman'"
+    assert corr_top_k is None or (
+        isinstance(corr_top_k, int) and corr_top_k > 0
+    ), "The corr_top_k should be given as a positive integer"
+    assert (
+        isinstance(max_categories, int) and max_categories > 0
+    ), "The max_categories should be given as a positive integer"
+
+    names = [str(c) for c in data.columns]
+    numeric, categorical = [], []
+    codes, categories = [], []
+    for k, column in enumerate(data.columns):
+        dtype = data.dtypes.iloc[k]
+        if is_numeric_dtype(dtype) and not is_bool_dtype(dtype):
+            numeric.append(k)
+            continue
+        if frame is None:
+            column_codes, uniques = pd.factorize(data.iloc[:, k])
+        else:
+            column_codes, uniques = frame._codes(column)
+        if len(uniques) > max_categories:
+            column_codes, uniques = _top_codes(
+                column_codes, uniques, max_categories
+            )
+        categorical.append(k)
+        codes.append(column_codes)
+        categories.append(uniques)
+
+    n_rows = len(data)
+    num_values = np.empty((len(numeric), n_rows))
+    for row, k in enumerate(numeric):
+        num_values[row] = data.iloc[:, k].to_numpy(
+            dtype=float, na_value=np.nan
+        )
+    cat_codes = np.empty((len(categorical), n_rows), dtype=np.int64)
+    for row, column_codes in enumerate(codes):
+        cat_codes[row] = column_codes
+    del codes
+
+    num_names = [names[k] for k in numeric]
+    if corr_top_k is None and len(numeric) > _CORR_DENSE_LIMIT:
+        corr_top_k = _CORR_TOP_K
+    tasks = []
+    if len(numeric) >= 2:
+        # The longest task is submitted first
+        tasks.append(("correlation", num_names, (corr_method, corr_top_k)))
+    n_jobs = os.cpu_count() if n_jobs < 0 else n_jobs
+    cat_names = [names[k] for k in categorical]
+    for kind, kind_names in [
+        ("numeric", num_names),
+        ("categorical", cat_names),
+    ]:
+        rows = range(len(kind_names))
+        # About four tasks per worker, so that the workers are balanced
+        # while each task pays the pickling of its results once
+        size = max(1, int(np.ceil(len(rows) / (4 * n_jobs))))
+        for start in range(0, len(rows), size):
+            stop = start + size
+            tasks.append((kind, kind_names[start:stop], rows[start:stop]))
+
+    if n_jobs == 1 or len(tasks) <= 1:
+        blocks = (num_values, cat_codes, categories)
+        results = [_report_task(blocks, *task) for task in tasks]
+    else:
+        results = _parallel_report(
+            tasks, num_values, cat_codes, categories, n_jobs
+        )
+
+    records = {}
+    corr_record = None
+    for task, result in zip(tasks, results):
+        kind, _, rows = task
+        if kind == "correlation":
+            corr_record = {
+                "column": None,
+                "kind": kind,
+                "spec": result[0][0],
+                "error": result[0][1],
+            }
+            continue
+        source = numeric if kind == "numeric" else categorical
+        for row, (spec, error) in zip(rows, result):
+            records[source[row]] = {
+                "column": names[source[row]],
+                "kind": kind,
+                "spec": spec,
+                "error": error,
+            }
+    charts = [records[k] for k in range(len(names))]
+    if corr_record is not None:
+        charts.append(corr_record)
+
+    bundle = {"rows": n_rows, "charts": charts}
+    if path is not None:
+        _write_report(bundle, path)
+    return bundle
+
+
+def _top_codes(codes, uniques, max_categories):
+    """
+    Fold the factorized codes of the values of a column other than its
+    max_categories most frequent ones into an "Other" category.
+
+    Returns
+    -------
+    tuple
+      The new codes and their categories: the most frequent values, then
+      the label of the "Other" bar from _other_label.
+    """
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    top = np.argsort(-counts, kind="stable")[:max_categories]
+    mapping = np.full(len(uniques), max_categories)
+    mapping[top] = np.arange(max_categories)
+    codes = np.where(codes >= 0, mapping[codes], -1)
+    values = pd.Index(np.asarray(uniques, dtype=object)[top], dtype=object)
+    return codes, values.append(
+        pd.Index([_other_label(values)], dtype=object)
+    )
+
+
+def _parallel_report(tasks, num_values, cat_codes, categories, n_jobs):
+    """
+    Run the tasks of eda_report in a process pool sharing the columns
+    through shared memory.
+    """
+    shms = []
+    try:
+        shapes = []
+        for values in [num_values, cat_codes]:
+            # Zero-size blocks cannot be shared
+            shm = shared_memory.SharedMemory(
+                create=True, size=max(values.nbytes, 1)
+            )
+            shms.append(shm)
+            np.ndarray(values.shape, values.dtype, buffer=shm.buf)[:] = values
+            shapes.append(values.shape)
+        with ProcessPoolExecutor(
+            max_workers=min(n_jobs, len(tasks)),
+            initializer=_attach_report_columns,
+            initargs=(
+                [shm.name for shm in shms],
+                shapes,
+                categories,
+            ),
+        ) as pool:
+            return list(pool.map(_shared_report_task, *zip(*tasks)))
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
+
+
+def _report_task(blocks, kind, names, rows):
+    """
+    Make the charts of one task of eda_report.
+
+    Parameters
+    ----------
+    blocks : tuple
+      The (features, rows) numeric matrix, the (columns, rows) factorized
+      codes of the categorical columns and their distinct values.
+    kind : str
+      "numeric", "categorical" or "correlation".
+    names : list
+      The names of the columns of the rows, or of every numeric column for
+      the correlation map.
+    rows : range or tuple
+      The rows of the block to chart, or the corr_method and top_k of the
+      correlation map.
+
+    Returns
+    -------
+    list
+      The (spec, error) pair of every chart.
+    """
+    num_values, cat_codes, categories = blocks
+    if kind == "correlation":
+        corr_method, top_k = rows
+        return [
+            _chart_spec(
+                _correlation_chart, num_values, names, corr_method, top_k
+            )
+        ]
+    results = []
+    for row, name in zip(rows, names):
+        if kind == "numeric":
+            results.append(
+                _chart_spec(_numeric_chart, num_values[row], name)
+            )
+        else:
+            results.append(
+                _chart_spec(
+                    _categorical_chart, cat_codes[row], categories[row], name
+                )
+            )
+    return results
+
+
+def _correlation_chart(num_values, names, corr_method, top_k):
+    """
+    Plot the correlation map of the (features, rows) numeric matrix.
+    """
+    # Wrapping the matrix does not copy it
+    numeric = pd.DataFrame(num_values.T, columns=names, copy=False)
+    return corr_map(numeric, names, corr_method=corr_method, top_k=top_k)
+
+
+def _numeric_chart(values, name):
+    """
+    Plot the density of a row of the numeric matrix.
+    """
+    column = pd.DataFrame({name: pd.Series(values, copy=False)})
+    return categorical_eda(
+        column, name, plot_type="density", aggregate=True, title=name
+    )
+
+
+def _categorical_chart(codes, categories, name):
+    """
+    Plot the histogram of the factorized codes of a categorical column.
+    """
+    values = pd.Categorical.from_codes(codes, categories)
+    if is_datetime64_any_dtype(categories.dtype):
+        # Altair only serializes the timestamps of datetime columns
+        values = values.astype(categories.dtype)
+    elif any(isinstance(v, pd.Timestamp) for v in categories):
+        # The timestamps of a column folded by _top_codes
+        values = _iso_timestamps(pd.Series(values).astype(object))
+    column = pd.DataFrame({name: values})
+    return categorical_eda(column, name, aggregate=True, title=name)
+
+
+def _chart_spec(function, *args, **kwargs):
+    """
+    Make a chart and return its Vega-Lite specification, catching any
+    error, including those of building the data of the chart.
+
+    Returns
+    -------
+    tuple
+      The specification and None, or None and the error message.
+    """
+    try:
+        # The report embeds the aggregated data of every chart, such as the
+        # cells of a wide correlation map, whatever their number of rows
+        with alt.data_transformers.disable_max_rows():
+            return function(*args, **kwargs).to_dict(), None
+    except Exception as e:
+        return None, _error_message(e)
+
+
+_shared_columns = None
+
+
+def _attach_report_columns(names, shapes, categories):
+    """
+    Process pool initializer mapping the shared numeric matrix and
+    categorical codes.
+    """
+    global _shared_columns
+    shms = [shared_memory.SharedMemory(name=name) for name in names]
+    _shared_columns = (
+        shms,
+        (
+            np.ndarray(shapes[0], dtype=float, buffer=shms[0].buf),
+            np.ndarray(shapes[1], dtype=np.int64, buffer=shms[1].buf),
+            categories,
+        ),
+    )
+
+
+def _shared_report_task(kind, names, rows):
+    """
+    Run one task in a worker process from the shared columns.
+    """
+    return _report_task(_shared_columns[1], kind, names, rows)
+
+
+def _write_report(bundle, path):
+    """
+    Write the bundle of eda_report as JSON, or as an HTML page embedding
+    every chart with vega-embed.
+    """
+    if os.path.splitext(path)[1].lower() == ".json":
+        with open(path, "w") as f:
+            json.dump(bundle, f)
+        return
+
+    sections = []
+    for k, record in enumerate(bundle["charts"]):
+        heading = (
+            "Correlation map"
+            if record["column"] is None
+            else f"{record['column']} ({record['kind']})"
+        )
+        body = (
+            f'<div id="chart{k}"></div>'
+            if record["error"] is None
+            else f"<p>{_escape(record['error'])}</p>"
+        )
+        sections.append(f"<h2>{_escape(heading)}</h2>\n{body}")
+    # Closing tags in the data would end the script element
+    specs = json.dumps([r["spec"] for r in bundle["charts"]]).replace(
+        "</", "<\\/"
+    )
+    page = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>EDA report</title>
+<script src="https://cdn.jsdelivr.net/npm/vega@{alt.VEGA_VERSION}"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-lite@{alt.VEGALITE_VERSION}">\
+</script>
+<script src="https://cdn.jsdelivr.net/npm/vega-embed@{alt.VEGAEMBED_VERSION}">\
+</script>
+</head>
+<body>
+<h1>EDA report of {bundle["rows"]} rows</h1>
+{chr(10).join(sections)}
+<script>
+const specs = {specs};
+specs.forEach((spec, k) => {{
+  if (spec !== null) {{
+    vegaEmbed("#chart" + k, spec);
+  }}
+}});
+</script>
+</body>
+</html>
+"""
+    with open(path, "w") as f:
+        f.write(page)
+
+
+def _escape(text):
+    """
+    Escape a text shown in the HTML report.
+    """
+    return (
+        str(text)
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+    )
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+from vega_datasets import data
+from simpler_eda.accumulators import (
+    CorrelationAccumulator,
+    HistogramAccumulator,
+)
+from simpler_eda.categorical import categorical_eda
+from simpler_eda.correlation import corr_map
+
+cars = data.cars()
+batches = [cars[:100], cars[100:101], cars[101:]]
+
+
+def test_histogram_accumulator():
+    """
+    Tests that the counts updated batch by batch match the aggregated
+    histogram of all the rows, and the exceptions of the accumulator.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    histogram = HistogramAccumulator("Origin", color="Cylinders")
+    assert len(histogram.count_table()) == 0
+    for batch in batches:
+        histogram.update(batch)
+    pd.testing.assert_frame_equal(
+        histogram.count_table(),
+        categorical_eda(
+            data=cars, xval="Origin", color="Cylinders", aggregate=True
+        ).data,
+    )
+    spec = histogram.chart(title="Origin", color_scheme="set1").to_dict()
+    assert spec["encoding"]["y"]["field"] == "count"
+    assert spec["encoding"]["color"]["scale"] == {"scheme": "set1"}
+
+    faceted = HistogramAccumulator("Origin", facet_factor="Year")
+    faceted.update(cars).update(cars)
+    assert (
+        faceted.count_table()["count"].sum() == 2 * len(cars)
+    ), "the counts should add up to the number of rows"
+    assert "facet" in faceted.chart(facet_col=3).to_dict()
+
+    names = HistogramAccumulator("Name", max_categories=2)
+    for batch in batches:
+        names.update(batch)
+    counts = names.count_table()
+    assert counts["Name"].tolist()[-1] == "Other"
+    assert (
+        counts["count"].sum() == len(cars)
+    ), "every row should be counted once"
+
+    try:
+        faceted.chart()
+    except Exception as e:
+        assert str(e) == "Specify facet_col for facetting the plot"
+    try:
+        histogram.update(cars[["Origin"]])
+    except Exception as e:
+        assert str(e) == "color must be a feature in the input dataframe"
+
+
+def test_correlation_accumulator():
+    """
+    Tests that the moments updated batch by batch give the correlations of
+    all the rows, also for pyarrow batches, and the exceptions of the
+    accumulator.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    pa = pytest.importorskip("pyarrow")
+
+    features = ["Horsepower", "Displacement", "Miles_per_Gallon"]
+    corr = CorrelationAccumulator(features)
+    corr.update(batches[0]).update(
+        pa.Table.from_pandas(batches[1], preserve_index=False)
+    ).update(batches[2])
+    assert np.allclose(
+        corr.corr(), cars[features].corr()
+    ), "the correlations should match pandas"
+    for options in [{}, {"top_k": 1, "cluster": True}]:
+        expected = corr_map(cars, features, **options).data
+        plotted = corr.chart(**options).data
+        assert plotted[["level_0", "level_1"]].equals(
+            expected[["level_0", "level_1"]]
+        )
+        assert np.allclose(plotted["corr"], expected["corr"])
+
+    try:
+        CorrelationAccumulator(["Horsepower"])
+    except Exception as e:
+        assert str(e) == "There should be at least 2 features in the list"
+    try:
+        corr.update(cars[["Name", "Horsepower", "Displacement"]].rename(
+            columns={"Name": "Miles_per_Gallon"}
+        ))
+    except Exception as e:
+        assert str(e) == "All features in the list should be numeric"
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from vega_datasets import data
+from simpler_eda.async_eda import (
+    corr_map_async,
+    numerical_eda_async,
+    set_async_executor,
+    _offload,
+)
+from simpler_eda.correlation import corr_map
+from simpler_eda.instrumentation import (
+    _callbacks,
+    _null_timer,
+    _stage_timer,
+)
+from simpler_eda.numerical import numerical_eda
+
+cars = data.cars()
+
+
+def test_async_functions():
+    """
+    Tests that the async functions return the charts of the synchronous
+    functions.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    features = ["Horsepower", "Displacement", "Miles_per_Gallon"]
+
+    async def plots():
+        return await asyncio.gather(
+            corr_map_async(cars, features, corr_method="spearman"),
+            numerical_eda_async(cars, xval="Horsepower",
+                                yval="Acceleration", color="Origin",
+                                plot_type="binned"),
+        )
+
+    corr, binned = asyncio.run(plots())
+    pd.testing.assert_frame_equal(
+        corr.data, corr_map(cars, features, corr_method="spearman").data
+    )
+    assert binned.to_dict() == numerical_eda(
+        cars, xval="Horsepower", yval="Acceleration", color="Origin",
+        plot_type="binned"
+    ).to_dict()
+
+    try:
+        set_async_executor(max_concurrency=0)
+    except Exception as e:
+        assert (
+            str(e)
+            == "The max_concurrency should be given as a positive integer"
+        )
+
+
+def test_concurrency_limit_and_cancellation():
+    """
+    Tests that at most max_concurrency calls run at once and that a
+    cancelled call stops at its next stage, without timing the stages of
+    the other calls.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    lock = threading.Lock()
+    running = []
+    peak = []
+    stopped = threading.Event()
+    timers = []
+
+    def job():
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    def endless():
+        timer = _stage_timer("endless")
+        timers.append(timer)
+        try:
+            for _ in range(1000):
+                time.sleep(0.01)
+                timer.mark("step")
+        finally:
+            stopped.set()
+
+    async def session():
+        await asyncio.gather(*[_offload(job, (), {}) for _ in range(6)])
+        task = asyncio.ensure_future(_offload(endless, (), {}))
+        await asyncio.sleep(0.1)
+        timers.append(_stage_timer("other"))
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    executor = ThreadPoolExecutor(4)
+    set_async_executor(executor, max_concurrency=2)
+    try:
+        assert asyncio.run(session()), "the task should be cancelled"
+    finally:
+        set_async_executor()
+    assert max(peak) == 2, "at most max_concurrency calls should run at once"
+    assert stopped.wait(1), "the cancelled call should stop"
+    executor.shutdown()
+    assert not _callbacks, "no stage callback should be registered"
+    assert all(
+        t is _null_timer for t in timers
+    ), "the stages should not be timed while no callback is registered"
@@ -0,0 +1,108 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from vega_datasets import data
+from simpler_eda import cache
+from simpler_eda.cache import (
+    enable_cache,
+    disable_cache,
+    clear_cache,
+    cache_info,
+    _memoize,
+)
+from simpler_eda.categorical import categorical_eda
+from simpler_eda.correlation import corr_map
+from simpler_eda.numerical import numerical_eda
+
+cars = data.cars()
+features = ["Horsepower", "Displacement", "Cylinders", "Acceleration"]
+
+
+def test_cache():
+    """
+    Tests that cosmetic re-renders reuse the cached chart data and that
+    data-affecting changes are recomputed.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    enable_cache()
+    try:
+        first = corr_map(cars, features, title="First")
+        second = corr_map(
+            cars, features, title="Second", color_scheme="redgrey"
+        )
+        assert cache_info()["hits"] == 1, "cosmetic changes should hit"
+        assert first.data is second.data, "the cached data should be reused"
+        assert second.title == "Second", "the styling should still apply"
+
+        corr_map(cars, features, corr_method="spearman")
+        changed = cars.copy()
+        changed.loc[0, "Horsepower"] = 1000
+        corr_map(changed, features)
+        assert cache_info()["misses"] == 3, "data changes should miss"
+
+        numerical_eda(cars, "Horsepower", "Acceleration", "Origin")
+        numerical_eda(
+            cars, "Horsepower", "Acceleration", "Origin", font_size=5
+        )
+        categorical_eda(cars, "Origin", color="Cylinders", aggregate=True)
+        categorical_eda(cars, "Origin", color="Cylinders", aggregate=True,
+                        title="Renamed")
+        assert cache_info()["hits"] == 3
+        assert cache_info()["entries"] == 5
+
+        clear_cache()
+        assert cache_info()["entries"] == 0 and cache_info()["bytes"] == 0
+
+        enable_cache(max_bytes=1)
+        corr_map(cars, features)
+        assert cache_info()["entries"] == 0, "oversized entries are skipped"
+
+        enable_cache(max_bytes=70_000)
+        for column in ["Horsepower", "Displacement", "Cylinders"]:
+            numerical_eda(cars, column, "Acceleration", "Origin")
+        info = cache_info()
+        assert info["bytes"] <= 70_000, "the budget should be enforced"
+        assert info["entries"] < 3, "least recently used entries are evicted"
+    finally:
+        disable_cache()
+
+    corr_map(cars, features)
+    assert cache_info()["entries"] == 0, "the disabled cache stores nothing"
+
+
+def test_cache_threads():
+    """
+    Tests that the size of the cache stays consistent with its entries
+    while many threads look up and insert at once.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    frame = cars[["Horsepower"]]
+
+    def lookup(i):
+        return _memoize(
+            "stress", frame, ["Horsepower"], (i % 40,),
+            lambda: pd.Series(range(i % 7 + 1), dtype=float),
+        )
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    enable_cache(max_bytes=3000)
+    try:
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(lookup, range(4000)))
+        info = cache_info()
+        assert info["bytes"] == sum(size for _, size in cache._cache.values())
+        assert info["bytes"] <= 3000, "the budget should be enforced"
+        assert info["hits"] + info["misses"] == 4000
+    finally:
+        sys.setswitchinterval(interval)
+        disable_cache()
@@ -1,5 +1,8 @@
+import altair as alt
+import numpy as np
+import pytest
 from vega_datasets import data
-from simpler_eda.categorical_eda import categorical_eda
+from simpler_eda.categorical import categorical_eda, categorical_eda_batch
 
 cars = data.cars()
 
@@ -281,3 +284,337 @@ def test_categorical_eda_exceptions():
         )
     except Exception as e:
         assert str(e) == "color must be a feature in the input dataframe"
+
+
+def test_categorical_eda_aggregate():
+    """
+    Tests that the aggregated histogram only embeds the count table.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts error should be displayed.
+    """
+    aggregated = categorical_eda(
+        data=cars,
+        xval="Origin",
+        color="Cylinders",
+        title="Histogram",
+        facet_factor="Year",
+        facet_col=3,
+        aggregate=True,
+    )
+    expected = cars.groupby(["Origin", "Cylinders", "Year"]).size()
+    assert aggregated.data.shape == (
+        len(expected),
+        4,
+    ), "one row per observed (xval, color, facet_factor) combination"
+    assert (
+        aggregated.data["count"].sum() == cars.shape[0]
+    ), "the counts should add up to the number of rows"
+    assert (
+        aggregated.spec.encoding.y.shorthand == "count:Q"
+    ), "the precomputed counts should be mapped to the y-axis"
+
+    same_column = categorical_eda(
+        data=cars, xval="Origin", color="Origin", aggregate=True
+    )
+    assert list(same_column.data.columns) == [
+        "Origin",
+        "count",
+    ], "repeated grouping columns should only be counted once"
+    assert (
+        same_column.data.set_index("Origin")["count"].to_dict()
+        == cars["Origin"].value_counts().to_dict()
+    ), "the counts should match the value counts of xval"
+
+    for plot_type in ["histogram", "density"]:
+        uncolored = categorical_eda(
+            data=cars, xval="Horsepower", plot_type=plot_type,
+            title="Horsepower", aggregate=True
+        ).to_dict()
+        assert (
+            "color" not in uncolored["encoding"]
+        ), "the marks should not be colored without a color"
+
+    try:
+        categorical_eda(data=cars, xval="Origin", aggregate="yes")
+    except Exception as e:
+        assert str(e) == "aggregate must be of type boolean."
+
+
+def test_categorical_eda_aggregate_density():
+    """
+    Tests that the aggregated density plot embeds a fixed-size grid per
+    group that matches a direct kernel density estimate.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts error should be displayed.
+    """
+    density = categorical_eda(
+        data=cars,
+        xval="Horsepower",
+        plot_type="density",
+        color="Origin",
+        title="Density Plot",
+        aggregate=True,
+        grid_size=50,
+    )
+    assert density.data.shape == (
+        3 * 50,
+        3,
+    ), "there should be one grid of 50 points per Origin"
+    assert (
+        density.encoding.y.shorthand == "density:Q"
+    ), "Density should be mapped to the y-axis"
+    assert density.transform is alt.Undefined or not density.transform, (
+        "the density should not be recomputed in the browser"
+    )
+
+    for origin, grid in density.data.groupby("Origin"):
+        values = cars.loc[cars["Origin"] == origin, "Horsepower"].dropna()
+        bw = 1.059 * values.std() * len(values) ** -0.2
+        x = grid["Horsepower"].to_numpy()[:, None]
+        expected = np.exp(-0.5 * ((x - values.to_numpy()) / bw) ** 2).sum(
+            axis=1
+        ) / (len(values) * bw * np.sqrt(2 * np.pi))
+        assert np.allclose(
+            grid["density"], expected, atol=0.02 * expected.max()
+        ), "the binned estimate should match the exact Gaussian KDE"
+
+    density_facet = categorical_eda(
+        data=cars,
+        xval="Horsepower",
+        plot_type="density",
+        color="Origin",
+        title="Density Plot",
+        facet_factor="Cylinders",
+        facet_col=3,
+        aggregate=True,
+        bandwidth="silverman",
+    )
+    assert set(density_facet.data.columns) == {
+        "Origin",
+        "Cylinders",
+        "Horsepower",
+        "density",
+    }, "the grid should be computed per color group and facet"
+
+    try:
+        categorical_eda(
+            data=cars,
+            xval="Horsepower",
+            plot_type="density",
+            aggregate=True,
+            bandwidth="wide",
+        )
+    except Exception as e:
+        assert (
+            str(e)
+            == "bandwidth must be 'scott', 'silverman' or a positive number"
+        )
+
+    try:
+        categorical_eda(
+            data=cars, xval="Origin", plot_type="density", aggregate=True
+        )
+    except Exception as e:
+        assert str(e) == "xval must be numeric for density plots"
+
+
+def test_categorical_eda_batch():
+    """
+    Tests that the batch histograms embed one long count table matching the
+    per-column counts.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    xvals = ["Origin", "Cylinders", "Miles_per_Gallon"]
+    batch = categorical_eda_batch(cars, xvals, color="Origin", title="Batch")
+    assert isinstance(batch, alt.FacetChart)
+    assert list(batch.data.columns) == ["variable", "value", "Origin", "count"]
+    assert batch.facet.sort == xvals, "histograms keep the order of xvals"
+    for xval in xvals:
+        counts = batch.data[batch.data["variable"] == xval]
+        assert counts["count"].sum() == cars.shape[0]
+        expected = cars.groupby([xval, "Origin"], dropna=False).size()
+        assert sorted(counts["count"]) == sorted(expected[expected > 0])
+    cylinders = batch.data[batch.data["variable"] == "Cylinders"]
+    assert list(cylinders["value"].unique()) == ["3", "4", "5", "6", "8"]
+    assert batch.data["value"].isna().sum() == cars["Miles_per_Gallon"].isna(
+    ).groupby(cars["Origin"]).any().sum(), "missing values are counted"
+    assert batch.to_dict()["resolve"]["scale"]["x"] == "independent"
+
+    uncolored = categorical_eda_batch(cars, ["Cylinders"])
+    assert list(uncolored.data.columns) == ["variable", "value", "count"]
+    assert "color" not in uncolored.to_dict()["spec"]["encoding"]
+
+    try:
+        categorical_eda_batch(cars, "Origin")
+    except Exception as e:
+        assert str(e) == "xvals must be a non-empty list of features"
+    try:
+        categorical_eda_batch(cars, ["Origin", "Color"])
+    except Exception as e:
+        assert str(e) == "xvals must be features in the input dataframe"
+    try:
+        categorical_eda_batch(cars, ["Origin"], facet_col=0)
+    except Exception as e:
+        assert str(e) == "facet_col must be a positive integer"
+
+
+def test_categorical_eda_native_input():
+    """
+    Tests that pyarrow and polars dataframes are counted with their own
+    group-by, giving the counts of the aggregated pandas histogram.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts error should be displayed.
+    """
+    pa = pytest.importorskip("pyarrow")
+    pl = pytest.importorskip("polars")
+
+    frame = cars[["Origin", "Cylinders", "Horsepower"]]
+    expected = categorical_eda(
+        data=frame, xval="Origin", color="Cylinders", aggregate=True
+    ).data
+    expected = expected.sort_values(["Origin", "Cylinders"])
+    for native in [
+        pa.Table.from_pandas(frame, preserve_index=False),
+        pl.DataFrame({c: frame[c].tolist() for c in frame.columns}),
+        pl.LazyFrame({c: frame[c].tolist() for c in frame.columns}),
+    ]:
+        plot = categorical_eda(data=native, xval="Origin", color="Cylinders")
+        counts = plot.data.sort_values(["Origin", "Cylinders"])
+        assert list(counts.columns) == ["Origin", "Cylinders", "count"]
+        assert (
+            counts["count"].tolist() == expected["count"].tolist()
+        ), "the native counts should match the pandas counts"
+        assert plot.encoding.y.shorthand == "count:Q"
+
+        density = categorical_eda(
+            data=native, xval="Horsepower", color="Origin",
+            plot_type="density"
+        )
+        assert sorted(density.data.columns) == [
+            "Horsepower", "Origin"
+        ], "only the plotted columns should be converted to pandas"
+
+    try:
+        categorical_eda(
+            data=pl.DataFrame({"x": ["a"], "c": ["b"]}),
+            xval="x",
+            color="c",
+            plot_type="density",
+        )
+    except Exception as e:
+        assert str(e) == "xval must be numeric for density plots"
+
+
+def test_categorical_eda_dask_input():
+    """
+    Tests that the histogram counts of a Dask DataFrame, summed over its
+    partitions, match the counts of the pandas dataframe.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts error should be displayed.
+    """
+    dd = pytest.importorskip("dask.dataframe")
+
+    expected = categorical_eda(
+        data=cars, xval="Origin", color="Cylinders", aggregate=True
+    ).data
+    counts = categorical_eda(
+        data=dd.from_pandas(cars, npartitions=20),
+        xval="Origin",
+        color="Cylinders",
+    ).data
+    assert (
+        counts.values.tolist() == expected.values.tolist()
+    ), "the counts should match, in order of first appearance"
+
+
+def test_categorical_eda_max_categories():
+    """
+    Tests that only the most frequent values keep their own bar, the other
+    rows being counted in "Other", exactly for dataframes and within the
+    Space-Saving summary for chunks.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts error should be displayed.
+    """
+    top = categorical_eda(
+        data=cars, xval="Name", color="Origin", title="Names",
+        max_categories=3
+    )
+    counts = top.data.groupby("Name")["count"].sum()
+    expected = cars["Name"].value_counts()
+    assert len(counts) == 4, "three bars and an Other bar are plotted"
+    assert counts["Other"] == len(cars) - counts.drop("Other").sum()
+    assert (
+        counts.drop("Other").sort_values().tolist()
+        == expected[:3].sort_values().tolist()
+    ), "the exact counts of the most frequent names should be plotted"
+    assert (
+        categorical_eda(data=cars, xval="Origin", max_categories=3)
+        .data["Origin"].isin(["Other"]).sum() == 0
+    ), "no Other bar is needed when every value is kept"
+
+    labelled = cars.assign(
+        Name=cars["Name"].where(cars["Name"] != "ford pinto", "Other")
+    )
+    folded = categorical_eda(
+        data=labelled, xval="Name", max_categories=1
+    ).data.set_index("Name")["count"]
+    assert folded.to_dict() == {
+        "Other": 6, "Other_": len(cars) - 6
+    }, "a value named Other should keep its own bar"
+
+    chunks = [cars[i:i + 50] for i in range(0, len(cars), 50)]
+    chunked = categorical_eda(
+        data=iter(chunks), xval="Cylinders", color="Origin",
+        max_categories=2
+    ).data
+    exact = categorical_eda(
+        data=cars, xval="Cylinders", color="Origin", max_categories=2
+    ).data
+    key = ["Cylinders", "Origin"]
+    assert (
+        chunked.set_index(key)["count"].sort_index().equals(
+            exact.set_index(key)["count"].sort_index()
+        )
+    ), "the summary should be exact while it monitors every value"
+    sketched = categorical_eda(
+        data=iter(chunks), xval="Name", max_categories=2
+    ).data
+    assert len(sketched) == 3
+    assert (
+        sketched["count"].sum() == len(cars)
+    ), "every row should be counted once"
+
+    try:
+        categorical_eda(data=iter(chunks), xval="Origin")
+    except Exception as e:
+        assert str(e) == "the input data has to be a dataframe."
+    try:
+        categorical_eda(
+            data=cars, xval="Horsepower", plot_type="density",
+            max_categories=3
+        )
+    except Exception as e:
+        assert str(e) == "max_categories only applies to histograms"
+    try:
+        categorical_eda(data=cars, xval="Origin", max_categories=0)
+    except Exception as e:
+        assert str(e) == "max_categories must be a positive integer"
@@ -0,0 +1,110 @@
+import altair as alt
+import numpy as np
+import pandas as pd
+from vega_datasets import data
+from simpler_eda.compaction import (
+    enable_compaction,
+    disable_compaction,
+    spec_size,
+    _round_floats,
+)
+from simpler_eda.categorical import categorical_eda
+from simpler_eda.correlation import corr_map
+from simpler_eda.numerical import numerical_eda
+
+cars = data.cars()
+
+
+def test_compaction():
+    """
+    Tests that the compacted charts embed smaller data restoring the same
+    strings, and that compaction is off by default.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    full = categorical_eda(cars, "Origin", color="Origin", title="Full")
+    assert full.data is cars, "compaction should be disabled by default"
+
+    enable_compaction(precision=3)
+    try:
+        compact = categorical_eda(cars, "Origin", color="Origin",
+                                  title="Compact")
+        assert list(compact.data.columns) == ["Origin"]
+        assert compact.transform[0].to_dict() == {
+            "calculate": '{"0": "USA", "1": "Europe", "2": "Japan"}'
+            '[datum["Origin"]]',
+            "as": "Origin",
+        }, "a calculate transform should restore the strings"
+        assert spec_size(compact) < spec_size(full) / 5
+
+        scatter = numerical_eda(cars, "Horsepower", "Acceleration",
+                                "Origin")
+        assert scatter.data["Acceleration"].round(1).equals(
+            scatter.data["Acceleration"]
+        ), "floats should keep 3 significant digits"
+        assert scatter.data["Horsepower"].dropna().dtype == float
+
+        features = ["Horsepower", "Displacement", "Miles_per_Gallon",
+                    "Weight_in_lbs", "Acceleration", "Cylinders"]
+        correlations = corr_map(cars, features)
+        assert set(correlations.data["level_0"]) == set("012345")
+        assert correlations.to_dict()["encoding"]["x"]["type"] == "nominal"
+    finally:
+        disable_compaction()
+
+    assert isinstance(compact, alt.Chart)
+    try:
+        enable_compaction(precision=0)
+    except Exception as e:
+        assert str(e) == "The precision should be given as a positive integer"
+
+
+def test_compaction_aggregate():
+    """
+    Tests that the counts and densities computed by an aggregated
+    categorical_eda are kept by the compaction.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    histogram = categorical_eda(cars, "Origin", color="Cylinders",
+                                aggregate=True, title="Counts")
+    density = categorical_eda(cars, "Horsepower", plot_type="density",
+                              aggregate=True, title="Density")
+
+    enable_compaction(precision=3)
+    try:
+        compact = categorical_eda(cars, "Origin", color="Cylinders",
+                                  aggregate=True, title="Counts")
+        assert "count" in compact.data.columns, "the counts are plotted"
+        assert compact.data["count"].tolist() == (
+            histogram.data["count"].tolist()
+        )
+        compact = categorical_eda(cars, "Horsepower", plot_type="density",
+                                  aggregate=True, title="Density")
+        assert "density" in compact.data.columns, "the densities are plotted"
+        assert np.allclose(compact.data["density"],
+                           density.data["density"], rtol=1e-2)
+    finally:
+        disable_compaction()
+
+
+def test_round_floats():
+    """
+    Tests the rounding to significant digits.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    values = pd.Series([123456.0, 0.000123456, -1.5, np.nan, 0.0, np.inf])
+    rounded = _round_floats(values, 3)
+    assert rounded.tolist()[:3] == [123000.0, 0.000123, -1.5]
+    assert np.isnan(rounded[3]) and rounded[4] == 0 and rounded[5] == np.inf
+    assert _round_floats(pd.Series([1.0, 2.0]), 3).dtype == np.int64
@@ -1,9 +1,9 @@
 # import altair as alt
-# import numpy as np
-# import pandas as pd
-# import pytest
+import numpy as np
+import pandas as pd
+import pytest
 from vega_datasets import data
-from simpler_eda.corr_map import corr_map
+from simpler_eda.correlation import corr_map
 
 df = data.cars()
 
@@ -149,3 +149,249 @@ def test_corr_map():
     assert (
         out.title == "Correlation Map"
     ), "The title should be Correlation Map or the given value"
+
+
+def test_kendall_engine():
+    """
+    Tests that the built-in Kendall tau-b matches a brute-force computation
+    with ties and missing values.
+
+    Returns
+    --------
+    None
+        All test should pass and no asserts should be displayed.
+    """
+    rng = np.random.default_rng(123)
+    tied = pd.DataFrame(
+        {
+            "a": rng.integers(0, 6, 200).astype(float),
+            "b": rng.normal(size=200),
+            "c": rng.integers(0, 3, 200).astype(float),
+        }
+    )
+    tied.loc[rng.choice(200, 20, replace=False), "b"] = np.nan
+    tied["d"] = -tied["a"] + rng.integers(0, 2, 200)
+
+    def brute_force_tau_b(x, y):
+        valid = ~np.isnan(x) & ~np.isnan(y)
+        x, y = x[valid], y[valid]
+        dx = np.sign(x[:, None] - x[None, :])
+        dy = np.sign(y[:, None] - y[None, :])
+        return (dx * dy).sum() / np.sqrt(
+            (dx != 0).sum() * (dy != 0).sum()
+        )
+
+    out_kendall = corr_map(tied, ["a", "b", "c", "d"], corr_method="kendall")
+    result = out_kendall.data.set_index(["level_0", "level_1"])["corr"]
+    for x in ["a", "b", "c", "d"]:
+        for y in ["a", "b", "c", "d"]:
+            assert np.isclose(
+                result[(x, y)],
+                brute_force_tau_b(tied[x].to_numpy(), tied[y].to_numpy()),
+            ), "Kendall tau-b should match the brute-force value"
+
+    constant = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [5.0, 5.0, 5.0]})
+    matrix = corr_map(constant, ["a", "b"], corr_method="kendall").data
+    assert list(zip(matrix["level_0"], matrix["level_1"])) == [
+        ("a", "a"),
+        ("b", "b"),
+    ], "Kendall tau-b is undefined against a constant feature"
+
+
+def test_chunked_input():
+    """
+    Tests that corr_map over an iterator of chunks matches the in-memory
+    Pearson correlation, including pairwise missing values.
+
+    Returns
+    --------
+    None
+        All test should pass and no asserts should be displayed.
+    """
+    features = ["Horsepower", "Displacement", "Miles_per_Gallon", "Cylinders"]
+    chunks = (df.iloc[i:i + 50] for i in range(0, len(df), 50))
+    out_chunked = corr_map(chunks, features)
+    expected = df[features].corr().stack().reset_index(name="corr")
+
+    pd.testing.assert_frame_equal(
+        out_chunked.data.sort_values(["level_0", "level_1"]).reset_index(
+            drop=True
+        ),
+        expected.sort_values(["level_0", "level_1"]).reset_index(drop=True),
+    )
+
+    try:
+        corr_map(iter([df]), features, corr_method="spearman")
+    except Exception as err:
+        assert (
+            str(err)
+            == "Chunked input only supports the 'pearson' correlation method"
+        )
+
+    try:
+        corr_map(iter([df, df["Name"]]), features)
+    except Exception as err:
+        assert str(err) == "The input data is not a panda dataframe"
+
+    try:
+        corr_map(iter([df]), ["Horsepower", "Name"])
+    except Exception as err:
+        assert str(err) == "All features in the list should be numeric"
+
+
+def test_parallel_rank_corr():
+    """
+    Tests that the parallel rank correlations are identical to the serial
+    ones and that spearman matches pandas.
+
+    Returns
+    --------
+    None
+        All test should pass and no asserts should be displayed.
+    """
+    features = ["Horsepower", "Displacement", "Miles_per_Gallon", "Cylinders"]
+    for method in ["kendall", "spearman"]:
+        serial = corr_map(df, features, corr_method=method)
+        parallel = corr_map(df, features, corr_method=method, n_jobs=2)
+        pd.testing.assert_frame_equal(serial.data, parallel.data)
+
+    expected = df[features].corr("spearman").stack()
+    result = serial.data.set_index(["level_0", "level_1"])["corr"]
+    assert np.allclose(
+        result.loc[expected.index], expected
+    ), "spearman should match the pandas implementation"
+
+    try:
+        corr_map(df, features, n_jobs=0)
+    except Exception as err:
+        assert str(err) == "The n_jobs should be given as a non-zero integer"
+
+
+def test_sparse_corr_map():
+    """
+    Tests that the thresholded and top-k correlation maps keep the expected
+    cells of the dense map, computed in several blocks of columns.
+
+    Returns
+    --------
+    None
+        All test should pass and no asserts should be displayed.
+    """
+    import simpler_eda.correlation as corr_map_module
+
+    features = ["Horsepower", "Displacement", "Miles_per_Gallon",
+                "Cylinders", "Acceleration", "Weight_in_lbs"]
+    block_size = corr_map_module._BLOCK_SIZE
+    corr_map_module._BLOCK_SIZE = 4
+    try:
+        for method in ["spearman", "pearson"]:
+            dense = corr_map(df, features, corr_method=method).data
+            kept = corr_map(
+                df, features, corr_method=method, min_abs_corr=0.8
+            ).data
+            expected = dense[dense["corr"].abs() >= 0.8]
+            pd.testing.assert_frame_equal(
+                kept, expected.reset_index(drop=True), check_exact=False
+            )
+
+        top = corr_map(df, features, top_k=1).data
+        top = top[top["level_0"] != top["level_1"]]
+        matrix = df[features].corr().abs()
+        for feature in features:
+            strongest = matrix[feature].drop(feature).idxmax()
+            assert strongest in set(
+                top.loc[top["level_0"] == feature, "level_1"]
+            ), "the strongest partner of every feature should be kept"
+    finally:
+        corr_map_module._BLOCK_SIZE = block_size
+
+    chunks = (df.iloc[i:i + 100] for i in range(0, len(df), 100))
+    # Chunked input is thresholded as well
+    pd.testing.assert_frame_equal(
+        corr_map(chunks, features, min_abs_corr=0.8).data, kept
+    )
+
+    try:
+        corr_map(df, features, min_abs_corr=2)
+    except Exception as err:
+        assert (
+            str(err) == "The min_abs_corr should be a number between 0 and 1"
+        )
+    try:
+        corr_map(df, features, top_k=0)
+    except Exception as err:
+        assert str(err) == "The top_k should be given as a positive integer"
+
+
+def test_clustered_corr_map():
+    """
+    Tests that clustering orders the axes so that correlated features are
+    adjacent.
+
+    Returns
+    --------
+    None
+        All test should pass and no asserts should be displayed.
+    """
+    pytest.importorskip("scipy")
+
+    features = ["Horsepower", "Displacement", "Miles_per_Gallon",
+                "Cylinders", "Acceleration", "Weight_in_lbs"]
+    clustered = corr_map(df, features, cluster=True)
+    order = clustered.encoding.x.sort
+    assert sorted(order) == sorted(features)
+    assert clustered.encoding.y.sort == order
+    assert abs(order.index("Displacement") - order.index("Cylinders")) == 1
+
+
+def test_native_input():
+    """
+    Tests that pyarrow and polars dataframes give the correlations of the
+    pandas dataframe.
+
+    Returns
+    --------
+    None
+        All test should pass and no asserts should be displayed.
+    """
+    pa = pytest.importorskip("pyarrow")
+    pl = pytest.importorskip("polars")
+
+    features = ["Horsepower", "Displacement", "Miles_per_Gallon"]
+    frame = df[features + ["Origin"]]
+    for method in ["pearson", "spearman"]:
+        expected = corr_map(frame, features, corr_method=method).data
+        for native in [
+            pa.Table.from_pandas(frame, preserve_index=False),
+            pl.LazyFrame({c: frame[c].tolist() for c in frame.columns}),
+        ]:
+            pd.testing.assert_frame_equal(
+                corr_map(native, features, corr_method=method).data,
+                expected,
+            )
+
+    try:
+        corr_map(pl.DataFrame(frame.to_dict("list")), ["Origin", "Horsepower"])
+    except Exception as err:
+        assert str(err) == "All features in the list should be numeric"
+
+
+def test_dask_input():
+    """
+    Tests that the pearson moments of the partitions of a Dask DataFrame
+    are merged into the correlations of the pandas dataframe.
+
+    Returns
+    --------
+    None
+        All test should pass and no asserts should be displayed.
+    """
+    dd = pytest.importorskip("dask.dataframe")
+
+    features = ["Horsepower", "Displacement", "Miles_per_Gallon"]
+    partitioned = dd.from_pandas(df, npartitions=20)
+    for method in ["pearson", "spearman"]:
+        pd.testing.assert_frame_equal(
+            corr_map(partitioned, features, corr_method=method).data,
+            corr_map(df, features, corr_method=method).data,
+        )
@@ -0,0 +1,58 @@
+import os
+
+import altair as alt
+from vega_datasets import data
+from simpler_eda.correlation import corr_map
+from simpler_eda.numerical import numerical_eda
+from simpler_eda.data_storage import (
+    enable_data_storage,
+    disable_data_storage,
+)
+
+cars = data.cars()
+features = ["Horsepower", "Displacement", "Cylinders", "Acceleration"]
+
+
+def test_data_storage(tmp_path):
+    """
+    Tests that chart data is written once to a content-addressed sidecar
+    file and referenced by url while the storage is enabled.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    directory = str(tmp_path / "data")
+    enable_data_storage("csv", directory=directory, urlpath="data")
+    try:
+        first = corr_map(cars, features).to_dict()
+        second = corr_map(cars, features, title="Renamed").to_dict()
+        scatter = numerical_eda(
+            cars, xval="Horsepower", yval="Acceleration", color="Origin"
+        ).to_dict()
+    finally:
+        disable_data_storage()
+
+    assert first["data"]["url"].startswith("data/"), "data should be a url"
+    assert first["data"]["format"] == {"type": "csv"}
+    assert "datasets" not in first, "no data should be embedded"
+    assert (
+        first["data"] == second["data"]
+    ), "identical data should reuse the same sidecar file"
+    assert scatter["data"] != first["data"], "different data, different file"
+    assert sorted(os.listdir(directory)) == sorted(
+        [
+            first["data"]["url"].split("/")[-1],
+            scatter["data"]["url"].split("/")[-1],
+        ]
+    ), "exactly one file should be written per distinct dataset"
+
+    inline = corr_map(cars, features).to_dict()
+    assert "datasets" in inline, "disabling should embed the data again"
+    assert alt.data_transformers.active == "default"
+
+    try:
+        enable_data_storage("xlsx")
+    except Exception as e:
+        assert str(e) == "The storage format should be 'json' or 'csv'"
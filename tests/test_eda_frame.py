@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+from vega_datasets import data
+from simpler_eda.cache import cache_info, disable_cache, enable_cache
+from simpler_eda.categorical import categorical_eda
+from simpler_eda.correlation import corr_map
+from simpler_eda.eda_frame import EDAFrame
+from simpler_eda.numerical import numerical_eda
+
+cars = data.cars()
+
+
+def test_profile():
+    """
+    Tests that the profile summarizes every column of the wrapped frame.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    profile = EDAFrame(cars).profile()
+    assert list(profile.index) == list(cars.columns)
+    assert (
+        profile["null_count"].to_dict() == cars.isna().sum().to_dict()
+    ), "the null counts should match pandas"
+    assert (
+        profile["cardinality"].to_dict() == cars.nunique().to_dict()
+    ), "the cardinalities should match pandas"
+    assert profile.loc["Horsepower", "max"] == cars["Horsepower"].max()
+    assert np.isnan(profile.loc["Origin", "min"])
+
+    try:
+        EDAFrame(cars.to_dict())
+    except Exception as e:
+        assert str(e) == "The input data is not a panda dataframe"
+
+
+def test_eda_frame_plots():
+    """
+    Tests that the plotting functions give the same charts for an EDAFrame
+    as for its dataframe, computing its statistics only once.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    frame = EDAFrame(cars)
+    features = ["Horsepower", "Displacement", "Miles_per_Gallon"]
+    for method in ["spearman", "kendall"]:
+        pd.testing.assert_frame_equal(
+            corr_map(frame, features, corr_method=method).data,
+            corr_map(cars, features, corr_method=method).data,
+        )
+    ranks = frame._ranks("Horsepower")
+    corr_map(frame, features, corr_method="spearman", top_k=1)
+    assert frame._ranks("Horsepower") is ranks, "the ranks should be kept"
+
+    for plot_type in ["scatter", "binned"]:
+        kwargs = dict(
+            xval="Horsepower",
+            yval="Acceleration",
+            color="Origin",
+            plot_type=plot_type,
+            x_transform=True,
+        )
+        assert (
+            numerical_eda(frame, **kwargs).to_dict()
+            == numerical_eda(cars, **kwargs).to_dict()
+        )
+
+    kwargs = dict(xval="Origin", color="Cylinders", facet_factor="Year",
+                  facet_col=3, aggregate=True)
+    pd.testing.assert_frame_equal(
+        categorical_eda(frame, **kwargs).data,
+        categorical_eda(cars, **kwargs).data,
+    )
+
+    enable_cache()
+    try:
+        corr_map(frame, features)
+        corr_map(frame, features, title="Again")
+        assert cache_info()["hits"] == 1
+        assert ("hash", "Horsepower") in frame._stats
+    finally:
+        disable_cache()
@@ -0,0 +1,51 @@
+import altair as alt
+import pytest
+from vega_datasets import data
+from simpler_eda.export import export_charts, shutdown_export_workers
+from simpler_eda.categorical import categorical_eda
+from simpler_eda.correlation import corr_map
+
+cars = data.cars()
+
+
+def test_export_charts(tmp_path):
+    """
+    Tests that the charts are written in the format of their extension, in
+    the current process and in the worker processes, and that a failing
+    chart only reports its own error.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    pytest.importorskip("vl_convert")
+
+    charts = [
+        corr_map(cars, ["Horsepower", "Displacement"]),
+        categorical_eda(cars, "Origin", color="Origin", title="Origin"),
+        # A bin given as a string does not validate against the schema
+        alt.Chart(cars).mark_bar().encode(x=alt.X("Origin:N", bin="yes")),
+    ]
+    for n_jobs in [1, 2]:
+        paths = [
+            str(tmp_path / f"{n_jobs}_{name}")
+            for name in ["corr.svg", "origin.png", "broken.pdf"]
+        ]
+        try:
+            records = export_charts(charts, paths, n_jobs=n_jobs)
+        finally:
+            shutdown_export_workers()
+        assert [r["path"] for r in records] == paths
+        assert records[0]["error"] is None and records[1]["error"] is None
+        assert records[2]["error"].startswith("SchemaValidationError")
+        with open(paths[0]) as f:
+            assert f.read().startswith("<svg")
+        with open(paths[1], "rb") as f:
+            assert f.read(8) == b"\x89PNG\r\n\x1a\n"
+        assert not (tmp_path / f"{n_jobs}_broken.pdf").exists()
+
+    try:
+        export_charts(charts, ["corr.jpg"] * 3)
+    except Exception as e:
+        assert str(e) == "The paths should end with .png, .svg or .pdf"
@@ -0,0 +1,89 @@
+from vega_datasets import data
+from simpler_eda.instrumentation import (
+    add_stage_callback,
+    remove_stage_callback,
+    record_stages,
+    _callbacks,
+)
+from simpler_eda.cache import enable_cache, disable_cache
+from simpler_eda.categorical import categorical_eda
+from simpler_eda.correlation import corr_map
+from simpler_eda.numerical import numerical_eda
+
+cars = data.cars()
+features = ["Horsepower", "Displacement", "Cylinders", "Acceleration"]
+
+
+def test_record_stages():
+    """
+    Tests that every function reports its stages in order, with their
+    durations and the size of the data they produced.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    with record_stages() as records:
+        numerical_eda(cars, "Horsepower", "Acceleration", "Origin",
+                      y_transform=True)
+    assert [r["stage"] for r in records] == [
+        "validation", "log transform", "domain", "frame", "chart"
+    ]
+    assert all(r["function"] == "numerical_eda" for r in records)
+    assert all(r["seconds"] >= 0 for r in records)
+    assert records[0]["rows"] == len(cars)
+    assert records[-1]["rows"] == len(cars)
+    assert records[-1]["bytes"] > 0
+    assert records[1]["rows"] is None
+
+    with record_stages() as records:
+        categorical_eda(cars, "Origin", color="Cylinders", aggregate=True)
+        corr_map(cars, features, corr_method="spearman")
+    assert [(r["function"], r["stage"]) for r in records] == [
+        ("categorical_eda", "validation"),
+        ("categorical_eda", "counts"),
+        ("categorical_eda", "chart"),
+        ("corr_map", "validation"),
+        ("corr_map", "correlation"),
+        ("corr_map", "chart"),
+    ]
+    assert records[-1]["rows"] == len(features) ** 2
+    assert not _callbacks, "the recorder should be removed on exit"
+
+
+def test_stage_callback():
+    """
+    Tests the registered callbacks and the cache lookup stage.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    stages = []
+
+    def callback(record):
+        stages.append(record["stage"])
+
+    add_stage_callback(callback)
+    enable_cache()
+    try:
+        corr_map(cars, features)
+        corr_map(cars, features, title="Cached")
+    finally:
+        disable_cache()
+        remove_stage_callback(callback)
+    assert stages == ["validation", "cache lookup", "correlation", "chart"] * 2
+
+    corr_map(cars, features)
+    assert len(stages) == 8, "removed callbacks should not be called"
+
+    try:
+        remove_stage_callback(callback)
+    except Exception as e:
+        assert str(e) == "The callback is not registered"
+    try:
+        add_stage_callback("callback")
+    except Exception as e:
+        assert str(e) == "The callback should be callable"
@@ -1,7 +1,8 @@
+import numpy as np
 import pandas as pd
 from vega_datasets import data
 import pytest
-from simpler_eda.numerical_eda import numerical_eda
+from simpler_eda.numerical import numerical_eda, pair_plot
 
 cars = data.cars()
 
@@ -459,8 +460,8 @@ def test_input_value():
         )
     except Exception as e:
         assert (
-            str(e) == """InputValueError: plot_type must be either 'scatter' or
-    'line'."""
+            str(e) == """InputValueError: plot_type must be either 'scatter',
+    'line' or 'binned'."""
         )
 
 
@@ -526,3 +527,347 @@ def test_negY(test_negative):
             x_transform=False,
             y_transform=True,
         )
+
+
+def test_column_projection():
+    """
+    Test that only the plotted columns are embedded in the chart and that
+    the input dataframe is left unchanged.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    wide = cars.copy()
+    wide["Extra_Column"] = 1.0
+    original = wide.copy()
+
+    plot = numerical_eda(
+        wide,
+        xval="Miles_per_Gallon",
+        yval="Horsepower",
+        color="Origin",
+        x_transform=True,
+    )
+
+    assert set(plot.data.columns) == {
+        "Miles per Gallon",
+        "Horsepower",
+        "Origin",
+    }, "Only the plotted columns should be embedded, with spaces"
+    assert (
+        plot.encoding.x.shorthand == "Miles per Gallon"
+    ), "The renamed x-variable should be mapped to the x axis"
+    assert plot.data["Miles per Gallon"].equals(
+        np.log(wide["Miles_per_Gallon"])
+    ), "The log transformation should be applied to the projected column"
+    assert (
+        plot.encoding.x.scale.domain[0]
+        == np.log(wide["Miles_per_Gallon"]).min()
+    ), "The x scale should span the transformed values"
+    pd.testing.assert_frame_equal(wide, original)
+
+
+def test_binned_plot():
+    """
+    Test that the binned plot embeds one row per non-empty cell of every
+    color group and that the cell counts add up to the plotted points.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    plot = numerical_eda(
+        cars,
+        xval="Horsepower",
+        yval="Acceleration",
+        color="Origin",
+        plot_type="binned",
+        bins=10,
+        y_transform=True,
+    )
+    plotted = cars[["Horsepower", "Acceleration"]].dropna()
+
+    assert plot.mark == "rect", "the plot type (mark) should be a rect"
+    assert (
+        plot.encoding.x.shorthand == "Horsepower"
+    ), "The bin start of Horsepower should be mapped to the x axis"
+    assert (
+        plot.encoding.x2.shorthand == "Horsepower end"
+    ), "The bin end of Horsepower should be mapped to x2"
+    assert (
+        plot.data["count"].sum() == len(plotted)
+    ), "Every plotted point should be counted in exactly one cell"
+    assert (
+        plot.data.groupby("Origin")["count"].sum().to_dict()
+        == cars.loc[plotted.index, "Origin"].value_counts().to_dict()
+    ), "The counts should be computed per color group"
+    assert len(plot.data) <= 3 * 10 * 10, "There are at most bins^2 cells"
+    assert plot.data["Acceleration"].min() == pytest.approx(
+        np.log(cars["Acceleration"]).min()
+    ), "The grid should cover the log transformed y-variable"
+
+    rng = np.random.default_rng(0)
+    spread = pd.DataFrame(
+        {
+            "x": rng.uniform(size=40_000),
+            "y": rng.uniform(size=40_000),
+            "c": rng.choice(list("abcd"), size=40_000),
+        }
+    )
+    plot = numerical_eda(spread, "x", "y", "c", plot_type="binned")
+    assert len(plot.data) == 4 * 20 * 20, "every cell should be filled"
+    assert plot.to_dict()["mark"] == "rect", "the plot should render"
+
+    zeros = pd.DataFrame(
+        {"x": [0.0, 1, 2], "y": [1.0, 2, 3], "c": list("aab")}
+    )
+    kwargs = dict(plot_type="binned", x_transform=True)
+    with pytest.warns(RuntimeWarning):
+        plot = numerical_eda(zeros, "x", "y", "c", **kwargs)
+    assert plot.encoding.x.scale.domain == (
+        0.0,
+        np.log(2),
+    ), "The log of zero should be left out of the domain"
+    assert np.isfinite(plot.data[["x", "x end"]]).all(axis=None)
+    assert plot.data["count"].sum() == 2, "The log of zero is not plotted"
+    pl = pytest.importorskip("polars")
+    pd.testing.assert_frame_equal(
+        numerical_eda(pl.from_pandas(zeros), "x", "y", "c", **kwargs).data,
+        plot.data,
+        check_dtype=False,
+    )
+
+    try:
+        numerical_eda(
+            cars,
+            xval="Horsepower",
+            yval="Acceleration",
+            color="Origin",
+            plot_type="binned",
+            bins=0,
+        )
+    except Exception as e:
+        assert str(e) == "TypeError: bins must be a positive integer."
+
+
+def test_line_downsampling():
+    """
+    Test that max_points caps the number of points of every line while
+    keeping the first and last points and the extremes of the series.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    t = np.arange(2000, dtype=float)
+    series = pd.DataFrame(
+        {
+            "time": np.concatenate([t, t]),
+            "value": np.concatenate([np.sin(t / 100), np.cos(t / 50)]),
+            "sensor": ["a"] * 2000 + ["b"] * 2000,
+        }
+    )
+    series.loc[500, "value"] = 10.0
+
+    plot = numerical_eda(
+        series,
+        xval="time",
+        yval="value",
+        color="sensor",
+        plot_type="line",
+        max_points=100,
+    )
+    counts = plot.data["sensor"].value_counts()
+    assert (counts == 100).all(), "Every series should be capped separately"
+    for sensor, line in plot.data.groupby("sensor"):
+        assert line["time"].is_monotonic_increasing, "Points sorted by x"
+        assert line["time"].iloc[0] == 0 and line["time"].iloc[-1] == 1999
+    assert (
+        10.0 in plot.data["value"].values
+    ), "The spike should be kept by the downsampling"
+
+    short = numerical_eda(
+        cars,
+        xval="Horsepower",
+        yval="Acceleration",
+        color="Origin",
+        plot_type="line",
+        max_points=1000,
+    )
+    plotted = cars[["Horsepower", "Acceleration"]].dropna()
+    assert (
+        len(short.data) == plotted.shape[0]
+    ), "Series shorter than max_points should be kept whole"
+
+    try:
+        numerical_eda(
+            cars,
+            xval="Horsepower",
+            yval="Acceleration",
+            color="Origin",
+            plot_type="line",
+            max_points=2,
+        )
+    except Exception as e:
+        assert (
+            str(e) == "TypeError: max_points must be an integer of at least 3."
+        )
+
+
+def test_pair_plot():
+    """
+    Test that the pair plot embeds the binned cells of every pair of
+    features once in one dataset, matching the binned plot of
+    numerical_eda, and renders whatever its number of cells.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    features = ["Horsepower", "Acceleration", "Miles_per_Gallon"]
+    plot = pair_plot(
+        cars, features, "Origin", log_features=["Acceleration"], bins=10
+    )
+    table = pd.DataFrame(plot.data["values"])
+    pairs = table.groupby(["x feature", "y feature"])["count"].sum()
+
+    assert len(pairs) == 6, "every pair should be binned once"
+    assert (
+        pairs[0, 2] == len(cars[["Horsepower", "Miles_per_Gallon"]].dropna())
+    ), "every point of a pair should be counted in exactly one cell"
+    assert plot.facet.row.sort == ["Horsepower", "Acceleration",
+                                   "Miles per Gallon"]
+
+    single = numerical_eda(
+        cars,
+        xval="Horsepower",
+        yval="Acceleration",
+        color="Origin",
+        plot_type="binned",
+        bins=10,
+        y_transform=True,
+    ).data
+    cells = table[(table["x feature"] == 0) & (table["y feature"] == 1)]
+    assert cells[["Origin", "count"]].to_numpy().tolist() == (
+        single[["Origin", "count"]].to_numpy().tolist()
+    ), "the cells should match the binned plot of numerical_eda"
+    x_edges = np.linspace(
+        cars["Horsepower"].min(), cars["Horsepower"].max(), 11
+    )
+    assert np.allclose(x_edges[cells["x bin"]], single["Horsepower"])
+
+    rng = np.random.default_rng(0)
+    wide = pd.DataFrame(
+        rng.normal(size=(20_000, 6)), columns=[f"x{i}" for i in range(6)]
+    ).assign(group=rng.choice(list("abcd"), size=20_000))
+    plot = pair_plot(wide, [f"x{i}" for i in range(6)], "group")
+    assert len(plot.data["values"]) > 5000, "the limit should not apply"
+    assert len(plot.to_dict()["datasets"]) == 1, "the plot should render"
+
+    try:
+        pair_plot(cars, ["Horsepower"], "Origin")
+    except Exception as e:
+        assert (
+            str(e)
+            == "TypeError: features must be a list of at least 2 strings."
+        )
+    try:
+        pair_plot(cars, ["Horsepower", "Name"], "Origin")
+    except Exception as e:
+        assert str(e) == "Your variable Name needs to be numeric."
+    try:
+        pair_plot(cars, features, "Origin", log_features=["Name"])
+    except Exception as e:
+        assert str(e) == "TypeError: log_features must be a list of features."
+
+
+def test_native_input():
+    """
+    Test that pyarrow and polars dataframes give the same binned counts and
+    scatter data as the pandas dataframe they hold.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    pa = pytest.importorskip("pyarrow")
+    pl = pytest.importorskip("polars")
+
+    columns = ["Horsepower", "Acceleration", "Origin"]
+    frame = cars[columns]
+    kwargs = dict(
+        xval="Horsepower",
+        yval="Acceleration",
+        color="Origin",
+        plot_type="binned",
+        bins=10,
+        x_transform=True,
+    )
+    expected = numerical_eda(frame, **kwargs).data
+    for native in [
+        pa.Table.from_pandas(frame, preserve_index=False),
+        pl.DataFrame({c: frame[c].tolist() for c in columns}),
+        pl.LazyFrame({c: frame[c].tolist() for c in columns}),
+    ]:
+        binned = numerical_eda(native, **kwargs).data
+        pd.testing.assert_frame_equal(
+            binned.sort_values(list(binned.columns[:5]))
+            .reset_index(drop=True),
+            expected.sort_values(list(expected.columns[:5]))
+            .reset_index(drop=True),
+            check_dtype=False,
+        )
+
+        scatter = numerical_eda(
+            native, xval="Horsepower", yval="Acceleration", color="Origin"
+        )
+        assert sorted(scatter.data.columns) == sorted(columns), (
+            "Only the plotted columns should be converted to pandas"
+        )
+        assert len(scatter.data) == len(frame)
+
+    try:
+        numerical_eda(
+            pl.DataFrame({"x": ["a"], "y": [1.0], "c": ["b"]}),
+            xval="x",
+            yval="y",
+            color="c",
+        )
+    except Exception as e:
+        assert str(e) == "Your x-variable needs to be numeric."
+
+
+def test_dask_input():
+    """
+    Test that the binned plot of a Dask DataFrame, counted partition by
+    partition, matches the binned plot of the pandas dataframe.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    dd = pytest.importorskip("dask.dataframe")
+
+    kwargs = dict(
+        xval="Horsepower",
+        yval="Acceleration",
+        color="Origin",
+        plot_type="binned",
+        bins=10,
+        y_transform=True,
+    )
+    expected = numerical_eda(cars, **kwargs).data
+    binned = numerical_eda(dd.from_pandas(cars, npartitions=20), **kwargs).data
+    key = list(expected.columns[:5])
+    pd.testing.assert_frame_equal(
+        binned.sort_values(key).reset_index(drop=True),
+        expected.sort_values(key).reset_index(drop=True),
+        check_dtype=False,
+    )
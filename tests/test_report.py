@@ -0,0 +1,136 @@
+import json
+
+import numpy as np
+import pandas as pd
+from vega_datasets import data
+from simpler_eda.eda_frame import EDAFrame
+from simpler_eda.report import _report_task, eda_report
+
+cars = data.cars()
+
+
+def test_eda_report(tmp_path):
+    """
+    Tests that every column gets a chart of its kind plus a correlation
+    map, identical in the current process and in the worker processes, and
+    that the bundle is written as JSON and HTML.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    frame = cars.assign(Heavy=cars["Weight_in_lbs"] > 3000)
+    serial = eda_report(frame, n_jobs=1, max_categories=10)
+    assert serial["rows"] == len(frame)
+    records = {r["column"]: r for r in serial["charts"]}
+    assert list(records) == list(frame.columns) + [None]
+    assert records["Horsepower"]["kind"] == "numeric"
+    assert records["Horsepower"]["spec"]["mark"]["type"] == "area"
+    assert records["Origin"]["kind"] == "categorical"
+    assert records["Heavy"]["kind"] == "categorical"
+    assert records[None]["kind"] == "correlation"
+    assert all(r["error"] is None for r in serial["charts"])
+    names = list(records["Name"]["spec"]["datasets"].values())[0]
+    assert len(names) == 11, "the identifiers should be folded"
+    assert "Other" in [r["Name"] for r in names]
+    assert sum(r["count"] for r in names) == len(frame)
+
+    counts = records["Origin"]["spec"]["datasets"]
+    counts = list(counts.values())[0]
+    assert {r["Origin"]: r["count"] for r in counts} == cars[
+        "Origin"
+    ].value_counts().to_dict(), "the histogram should count every value"
+
+    mixed = cars[["Name"]].assign(
+        Name=["Other"] * 10 + [1] * 8 + ["1"] * 7 + list(cars["Name"][25:]),
+        Year=cars["Year"],
+    )
+    for n_jobs in [1, 2]:
+        bundle = eda_report(mixed, n_jobs=n_jobs, max_categories=3)
+        assert [r["error"] for r in bundle["charts"]] == [None, None]
+        names = list(bundle["charts"][0]["spec"]["datasets"].values())[0]
+        assert {r["Name"]: r["count"] for r in names} == {
+            "Other": 10, 1: 8, "1": 7, "Other_": len(cars) - 25
+        }, "the values should be kept apart from the Other bar"
+
+    json_path = str(tmp_path / "report.json")
+    html_path = str(tmp_path / "report.html")
+    parallel = eda_report(
+        EDAFrame(frame), json_path, n_jobs=2, max_categories=10
+    )
+    # The names of the interactive selections are numbered per process
+    assert (
+        parallel["charts"][:-1] == serial["charts"][:-1]
+    ), "the workers should make the same charts"
+    assert (
+        parallel["charts"][-1]["spec"]["datasets"]
+        == serial["charts"][-1]["spec"]["datasets"]
+    )
+    with open(json_path) as f:
+        assert json.load(f) == json.loads(json.dumps(parallel))
+    eda_report(frame, html_path, n_jobs=2, max_categories=10)
+    with open(html_path) as f:
+        page = f.read()
+    assert page.count("vegaEmbed(") == 1
+    assert page.count('<div id="chart') == len(frame.columns) + 1
+
+
+def test_report_task_errors():
+    """
+    Tests that a column whose data cannot be built only fails its own
+    chart.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    cat_codes = np.array([[0, 1, 0], [0, 5, 1]])
+    categories = [pd.Index(["a", "b"]), pd.Index(["c", "d"])]
+    blocks = (np.empty((0, 3)), cat_codes, categories)
+    results = _report_task(blocks, "categorical", ["good", "bad"], range(2))
+    assert results[0][0] is not None and results[0][1] is None
+    assert results[1][0] is None
+    assert results[1][1].startswith("ValueError"), "the codes are invalid"
+
+
+def test_eda_report_wide():
+    """
+    Tests that only the strongest pairs of a wide table are kept in its
+    correlation map, and the exceptions of eda_report.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    rng = np.random.default_rng(0)
+    wide = cars[[]].assign(
+        **{f"x{i}": rng.normal(size=len(cars)) for i in range(60)}
+    )
+    bundle = eda_report(wide, n_jobs=2)
+    corr = bundle["charts"][-1]
+    assert corr["error"] is None
+    cells = list(corr["spec"]["datasets"].values())[0]
+    assert len(cells) < 60 * 60, "the dense matrix should not be plotted"
+
+    try:
+        eda_report(cars.to_dict())
+    except Exception as e:
+        assert str(e) == "The input data is not a panda dataframe"
+    try:
+        eda_report(cars, "report.png")
+    except Exception as e:
+        assert str(e) == "The path should end with .html or .json"
+    try:
+        eda_report(cars, n_jobs=0)
+    except Exception as e:
+        assert str(e) == "The n_jobs should be given as a non-zero integer"
+    try:
+        eda_report(cars, corr_method="cosine")
+    except Exception as e:
+        assert (
+            str(e)
+            == "The corr_method should be 'pearson', 'kendall' or 'spearman'"
+        )
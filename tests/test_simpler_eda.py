@@ -0,0 +1,126 @@
+import subprocess
+import sys
+
+import simpler_eda
+
+# Generous budget for a cold import; pulling in altair alone takes longer
+IMPORT_TIME_BUDGET = 0.5
+
+HEAVY_MODULES = ["altair", "pandas", "numpy", "jsonschema"]
+
+
+def _run(code):
+    """
+    Run code in a fresh interpreter and return its standard output.
+    """
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+
+def test_lazy_import():
+    """
+    Tests that importing the package is fast and does not import the
+    plotting dependencies until a function is accessed.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    output = _run(
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import simpler_eda\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(*[m in sys.modules for m in {HEAVY_MODULES!r}])\n"
+        "simpler_eda.corr_map\n"
+        "print('altair' in sys.modules)\n"
+    )
+    assert (
+        float(output[0]) < IMPORT_TIME_BUDGET
+    ), "importing simpler_eda should stay within the import-time budget"
+    assert output[1:-1] == ["False"] * len(
+        HEAVY_MODULES
+    ), "no heavy dependency should be imported with the package"
+    assert output[-1] == "True", "accessing a function imports its module"
+
+
+def test_package_functions():
+    """
+    Tests that the three plotting functions are exported at package level.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    from simpler_eda.categorical import categorical_eda
+    from simpler_eda.correlation import corr_map
+    from simpler_eda.numerical import numerical_eda
+
+    assert _run(
+        "from simpler_eda import categorical_eda, numerical_eda, corr_map\n"
+        "print(*[callable(f) for f in "
+        "(categorical_eda, numerical_eda, corr_map)])"
+    ) == ["True"] * 3, "the functions should be importable from the package"
+    assert simpler_eda.corr_map is corr_map
+    assert simpler_eda.numerical_eda is numerical_eda
+    assert simpler_eda.categorical_eda is categorical_eda
+    assert set(simpler_eda.__all__) <= set(dir(simpler_eda))
+
+    try:
+        simpler_eda.not_a_function
+    except AttributeError as e:
+        assert "not_a_function" in str(e)
+
+
+def test_submodule_imports():
+    """
+    Tests that the package attributes stay the functions whatever the
+    order in which the submodules sharing their names are imported.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    assert _run(
+        "import simpler_eda\n"
+        "from simpler_eda.corr_map import corr_map\n"
+        "print(simpler_eda.corr_map is corr_map)\n"
+        "simpler_eda.eda_report\n"
+        "print(simpler_eda.corr_map is corr_map)\n"
+        "import simpler_eda.correlation as module\n"
+        "print(module.corr_map is simpler_eda.corr_map)\n"
+        "import simpler_eda.categorical_eda\n"
+        "print(callable(simpler_eda.categorical_eda))"
+    ) == ["True"] * 4, "the functions should not be replaced by modules"
+    assert _run(
+        "import simpler_eda\n"
+        "f = simpler_eda.corr_map\n"
+        "import importlib\n"
+        "module = importlib.import_module('simpler_eda.corr_map')\n"
+        "print(module.__name__, module.corr_map is f)"
+    ) == ["simpler_eda.correlation", "True"], "the alias is the module"
+
+
+def test_rebinding(monkeypatch):
+    """
+    Tests that the exported functions can still be rebound deliberately,
+    modules included.
+
+    Returns
+    -------
+    None
+        The test should pass and no asserts should be displayed.
+    """
+    import simpler_eda.cache as module
+
+    monkeypatch.setattr(simpler_eda, "corr_map", module)
+    assert simpler_eda.corr_map is module
+    monkeypatch.setattr(simpler_eda, "numerical_eda", len)
+    assert simpler_eda.numerical_eda is len